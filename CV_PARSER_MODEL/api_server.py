@@ -1,16 +1,25 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.encoders import jsonable_encoder
 import uvicorn
 import logging
 from datetime import datetime
 from pathlib import Path
-import shutil
 import os
 
 from main import CV_parsing_main  # Import your function
+from parsers.pdf_document import PDFDocumentHandle
+from parsers.extraction_budget import ExtractionBudget
+from parsers.entity_extractor import NER_ENABLED, HeaderEntityExtractor
+from utilis.result_models import dumps
+
+# Production endpoints use adaptive extraction: PyMuPDF first, PdfMiner on poor output.
+# CV_MAX_PAGES and CV_STOP_ON_SECTIONS=1 bound the work spent on long PDFs.
+EXTRACTION_BUDGET = ExtractionBudget(
+    max_pages=int(os.environ.get("CV_MAX_PAGES", 0)) or None,
+    stop_when_sections_found=os.environ.get("CV_STOP_ON_SECTIONS", "0") == "1"
+)
 
 app = FastAPI()
 
@@ -23,6 +32,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+def warm_models():
+    """Load the NER model before the first request instead of during it"""
+    if NER_ENABLED:
+        HeaderEntityExtractor.get_extractor()
+
 # Mount static for favicon
 app.mount("/static", StaticFiles(directory="CV_PARSER_MODEL/static"), name="static")
 
@@ -31,88 +46,73 @@ def favicon():
     from fastapi.responses import FileResponse
     return FileResponse("CV_PARSER_MODEL/static/favicon.ico")
 
-# Directory to save uploads
+# Uploads are parsed straight from the request bytes. Set CV_SAVE_UPLOADS=1 to
+# also keep a copy of every upload in UPLOAD_DIR.
+SAVE_UPLOADS = os.environ.get("CV_SAVE_UPLOADS", "0") == "1"
 UPLOAD_DIR = Path("uploads")
-UPLOAD_DIR.mkdir(exist_ok=True)
-
-@app.post("/parse")
-async def parse_file(file: UploadFile = File(...)):
-    # Save the uploaded file
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    saved_filename = f"{timestamp}_{file.filename}"
-    saved_path = UPLOAD_DIR / saved_filename
-
-    with saved_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    # Call your parser
-    result = CV_parsing_main(str(saved_path), save_results=False)
+if SAVE_UPLOADS:
+    UPLOAD_DIR.mkdir(exist_ok=True)
+
+async def _parse_upload(file: UploadFile, fields=None):
+    """Parse an uploaded PDF in memory, persisting it only when SAVE_UPLOADS is on"""
+    data = await file.read()
+    if SAVE_UPLOADS:
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        saved_path = UPLOAD_DIR / f"{timestamp}_{Path(file.filename or 'upload.pdf').name}"
+        saved_path.write_bytes(data)
+
+    with PDFDocumentHandle.from_bytes(data, name=file.filename) as document:
+        result = CV_parsing_main(document, save_results=False, mode="adaptive", budget=EXTRACTION_BUDGET,
+                                 fields=fields)
     if result is None:
         raise HTTPException(status_code=500, detail="Parsing failed")
+    return result
 
-    # Optionally, delete the file after parsing
-    # saved_path.unlink()
+def _json_response(result):
+    """Serialize results and their result models directly to JSON bytes"""
+    return Response(content=dumps(result), media_type="application/json")
 
-    return JSONResponse(content=jsonable_encoder(result))
+@app.post("/parse")
+async def parse_file(file: UploadFile = File(...)):
+    result = await _parse_upload(file)
+    return _json_response(result)
 
 @app.post("/cv/upload")
 async def upload_and_parse(file: UploadFile = File(...)):
-    # Save the uploaded file
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    saved_filename = f"{timestamp}_{file.filename}"
-    saved_path = UPLOAD_DIR / saved_filename
-
-    with saved_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    # Call your parser
-    result = CV_parsing_main(str(saved_path), save_results=False)
-    if result is None:
-        raise HTTPException(status_code=500, detail="Parsing failed")
-
-    # Optionally, delete the file after parsing
-    # saved_path.unlink()
-
-    return JSONResponse(content=jsonable_encoder(result))
+    result = await _parse_upload(file)
+    return _json_response(result)
 
 # For file upload
 @app.post("/cv/upload_score")
 async def upload_and_parse_score(file: UploadFile = File(...)):
-    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-    saved_filename = f"{timestamp}_{file.filename}"
-    saved_path = UPLOAD_DIR / saved_filename
-
-    with saved_path.open("wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-
-    result = CV_parsing_main(str(saved_path), save_results=False)
-    if result is None:
-        raise HTTPException(status_code=500, detail="Parsing failed")
-    custom = result.get("parsers", {}).get("custom", {})
+    # Only the skills are needed: the other fields are never computed
+    result = await _parse_upload(file, fields=["Skills"])
+    custom = result.get("parsers", {}).get("custom")
     # Example: score is the number of skills found
-    score = len(custom.get("Skills", []))
+    score = len(custom.skills or ()) if custom else 0
     return {"score": score}
 
 @app.get("/parse_cv")
 async def parse_cv(path: str = Query(..., description="Path to the resume PDF file")):
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail="File not found")
-    result = CV_parsing_main(path, save_results=False)
+    result = CV_parsing_main(path, save_results=False, mode="adaptive", budget=EXTRACTION_BUDGET)
     if result is None:
         raise HTTPException(status_code=500, detail="Parsing failed")
-    return JSONResponse(content=jsonable_encoder(result))
+    return _json_response(result)
 
 # For file path
 @app.get("/parse_cv_score")
 async def parse_cv_score(path: str = Query(..., description="Path to the resume PDF file")):
     if not os.path.exists(path):
         raise HTTPException(status_code=404, detail="File not found")
-    result = CV_parsing_main(path, save_results=False)
+    result = CV_parsing_main(path, save_results=False, mode="adaptive", budget=EXTRACTION_BUDGET,
+                             fields=["Skills"])
     if result is None:
         raise HTTPException(status_code=500, detail="Parsing failed")
-    custom = result.get("parsers", {}).get("custom", {})
+    custom = result.get("parsers", {}).get("custom")
     # Example: score is the number of skills found
-    score = len(custom.get("Skills", []))
+    score = len(custom.skills or ()) if custom else 0
     return {"score": score}
 
 if __name__ == "__main__":
@@ -0,0 +1,245 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : extraction_benchmark.py
+# @Software: Vscode
+# @Description: Throughput benchmark for the PDF extraction engines.
+# @License : MIT License
+#
+# Run from CV_PARSER_MODEL/:
+#     python -m benchmarks.extraction_benchmark --dir ~/cvs --output bench.json
+#     python -m benchmarks.extraction_benchmark --synthetic 50 --pages 3
+
+import argparse
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ENGINES = ["pymupdf", "pdfminer", "pyresparser"]
+
+_SYNTHETIC_SECTIONS = {
+    "Professional Experience": [
+        "Embedded software engineer at ACTIA Engineering Services, 2019 - present",
+        "Developed diagnostic services in C++ on Linux and FreeRTOS targets",
+        "SW designer at Sofrecom Solutions, Jan 2016 - Dec 2018",
+        "Implemented CI pipelines with Jenkins, Docker and Git",
+    ],
+    "Education": [
+        "ESPRIT - Engineering diploma in embedded systems, 2013 - 2016",
+        "Higher Institute of Computer Science and Mathematics in Monastir, 2010 - 2013",
+    ],
+    "Skills": [
+        "Python, C, C++, Rust, Bash, Git, Docker, Kubernetes, Jira, Scrum",
+        "Android, Linux, AUTOSAR, CAN, UDS, Yocto, Buildroot",
+    ],
+    "Projects": [
+        "Over-the-air update client for telematics control units",
+        "Resume analyzer with PdfMiner and PyMuPDF extraction engines",
+    ],
+}
+
+
+def generate_synthetic_corpus(output_dir, documents, pages, seed=0):
+    """Write `documents` resume-like PDFs of `pages` pages each and return their paths"""
+    import fitz  # PyMuPDF
+
+    rng = random.Random(seed)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for doc_no in range(documents):
+        doc = fitz.open()
+        for page_no in range(pages):
+            page = doc.new_page()
+            y = 72
+            if page_no == 0:
+                page.insert_text((72, y), f"Candidate {doc_no:05d}", fontsize=18)
+                y += 24
+                page.insert_text((72, y), f"candidate{doc_no}@example.com  +216 2{rng.randint(0, 9999999):07d}")
+                y += 30
+            for header, lines in _SYNTHETIC_SECTIONS.items():
+                page.insert_text((72, y), header, fontsize=13)
+                y += 20
+                for line in rng.sample(lines, len(lines)):
+                    page.insert_text((84, y), line, fontsize=10)
+                    y += 14
+                y += 12
+        path = output_dir / f"synthetic_{doc_no:05d}.pdf"
+        doc.save(str(path))
+        doc.close()
+        paths.append(str(path))
+    return paths
+
+
+def _page_count(path):
+    from parsers.pdf_document import PDFDocumentHandle
+
+    with PDFDocumentHandle(path) as document:
+        return document.page_count
+
+
+def _extract(engine, path):
+    """Run one engine on one PDF, reading it from disk like a real request"""
+    from parsers.pdf_document import PDFDocumentHandle
+
+    with PDFDocumentHandle(path) as document:
+        if engine == "pymupdf":
+            from parsers.PDFTextExtractorPyMuPDF import PDFTextExtractorPyMuPDF
+            PDFTextExtractorPyMuPDF(document).extract_paragraphs()
+        elif engine == "pdfminer":
+            from parsers.PDFTextExtractorPdfMiner import PDFTextExtractorPdfMiner
+            PDFTextExtractorPdfMiner(document).extract_paragraphs()
+        elif engine == "pyresparser":
+            from parsers.PyResParserExtractor import PyResParserExtractor
+            PyResParserExtractor(document).extract_all()
+        else:
+            raise ValueError(f"Unknown engine: {engine}")
+
+
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _engine_worker(engine, paths, repeat, connection):
+    """Benchmark one engine in a fresh process so peak RSS is its own"""
+    latencies = []
+    pages = 0
+    errors = []
+    page_counts = {}
+    try:
+        # Count pages and warm up imports outside the timed loop
+        for path in paths:
+            page_counts[path] = _page_count(path)
+        _extract(engine, paths[0])
+    except Exception as e:
+        errors.append(f"warmup: {e}")
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for path in paths:
+            t0 = time.perf_counter()
+            try:
+                _extract(engine, path)
+            except Exception as e:
+                errors.append(f"{Path(path).name}: {e}")
+                continue
+            latencies.append(time.perf_counter() - t0)
+            pages += page_counts.get(path, 0)
+    elapsed = time.perf_counter() - start
+
+    connection.send({
+        "latencies": latencies,
+        "pages": pages,
+        "elapsed": elapsed,
+        "peak_rss_mb": _peak_rss_mb(),
+        "errors": errors,
+    })
+    connection.close()
+
+
+def _percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(raw):
+    latencies_ms = sorted(l * 1000 for l in raw["latencies"])
+    documents = len(latencies_ms)
+    elapsed = raw["elapsed"]
+    return {
+        "documents": documents,
+        "pages": raw["pages"],
+        "total_seconds": round(raw["elapsed"], 4),
+        "documents_per_second": round(documents / elapsed, 3) if documents and elapsed else 0.0,
+        "pages_per_second": round(raw["pages"] / elapsed, 3) if raw["pages"] and elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies_ms) / documents, 3) if documents else None,
+            "p50": _percentile(latencies_ms, 50),
+            "p95": _percentile(latencies_ms, 95),
+            "p99": _percentile(latencies_ms, 99),
+        },
+        "peak_rss_mb": round(raw["peak_rss_mb"], 1),
+        "errors": raw["errors"],
+    }
+
+
+def run_benchmark(paths, engines, repeat=1):
+    """Benchmark each engine over `paths` and return the per-engine summaries"""
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for engine in engines:
+        print(f"Benchmarking {engine} on {len(paths)} documents...")
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_engine_worker, args=(engine, paths, repeat, sender))
+        process.start()
+        sender.close()
+        try:
+            raw = receiver.recv()
+        except EOFError:
+            raw = {"latencies": [], "pages": 0, "elapsed": 0.0, "peak_rss_mb": 0.0,
+                   "errors": [f"worker exited with code {process.exitcode}"]}
+        process.join()
+        results[engine] = summarize(raw)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the PDF extraction engines")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--dir', help='Directory of PDFs to benchmark')
+    source.add_argument('--synthetic', type=int, help='Generate this many synthetic resumes')
+    parser.add_argument('--pages', type=int, default=2, help='Pages per synthetic resume')
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES)
+    parser.add_argument('--repeat', type=int, default=1, help='Passes over the corpus per engine')
+    parser.add_argument('--output', default=None, help='JSON results file')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="cv_bench_") as tmp_dir:
+        if args.synthetic:
+            paths = generate_synthetic_corpus(tmp_dir, args.synthetic, args.pages)
+            corpus = {"type": "synthetic", "documents": args.synthetic, "pages_per_document": args.pages}
+        else:
+            paths = sorted(str(p) for p in Path(args.dir).expanduser().glob("*.pdf"))
+            corpus = {"type": "directory", "path": str(args.dir), "documents": len(paths)}
+        if not paths:
+            parser.error("No PDF files to benchmark")
+
+        report = {
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+            "corpus": corpus,
+            "engines": run_benchmark(paths, args.engines, args.repeat),
+        }
+
+    output = Path(args.output) if args.output else (
+        Path(__file__).parent.parent / 'results' / f"extraction_benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+
+    for engine, stats in report["engines"].items():
+        latency = stats["latency_ms"]
+        print(f"{engine:12s} {stats['documents_per_second']:8.2f} docs/s {stats['pages_per_second']:8.2f} pages/s "
+              f"p50={latency['p50']} p95={latency['p95']} p99={latency['p99']} ms "
+              f"peak_rss={stats['peak_rss_mb']} MB errors={len(stats['errors'])}")
+    print(f"Results saved to: {output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
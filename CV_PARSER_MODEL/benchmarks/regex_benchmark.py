@@ -0,0 +1,247 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : regex_benchmark.py
+# @Software: Vscode
+# @Description: Per-document cost of contact and date regexes, before and after precompilation,
+#               and of the experience timeline against the year scan it replaced.
+# @License : MIT License
+#
+# Run from CV_PARSER_MODEL/:
+#     python -m benchmarks.regex_benchmark --documents 500
+#     python -m benchmarks.regex_benchmark --texts ~/cv_texts --output regex.json
+
+import argparse
+import json
+import platform
+import random
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.extraction_benchmark import _SYNTHETIC_SECTIONS, _percentile
+
+
+# Implementations as they were before parsers/patterns.py, kept as the baseline
+
+def _legacy_is_valid_phone(number):
+    cleaned = ''.join(c for c in number if c.isdigit() or c == '+')
+    if not cleaned:
+        return False
+    if not (cleaned.startswith('+') or cleaned[0].isdigit()):
+        return False
+    if len(cleaned) < 8 or len(cleaned) > 15:
+        return False
+    if cleaned.startswith('+'):
+        if cleaned.startswith('+216'):
+            return len(cleaned) == 12
+    if not cleaned[1:].isdigit():
+        return False
+    if re.search(r'[12]\d{3}', cleaned):
+        return False
+    return True
+
+
+def _legacy_phone_numbers(paragraphs):
+    phone_patterns = [
+        r'(?:\+\d{1,3}[-\s]?)?\d{8,12}',
+        r'\+\d{1,3}\s\d{8}',
+        r'\+216\s\d{8}'
+    ]
+    found_numbers = []
+    for para in paragraphs:
+        for pattern in phone_patterns:
+            for match in re.finditer(pattern, para):
+                number = match.group().strip()
+                if _legacy_is_valid_phone(number):
+                    found_numbers.append(number)
+    return list(dict.fromkeys(found_numbers))
+
+
+def _legacy_match_date(text):
+    patterns = [
+        r'\b(19|20)\d{2}\s*[-to]{1,3}\s*(19|20)\d{2}\b',
+        r'\b(19|20)\d{2}\b',
+        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*(19|20)\d{2}',
+    ]
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            return match.group()
+    return None
+
+
+def _legacy_years_of_experience(experience_text):
+    total_years = 0
+    date_pattern = r'(\d{4})\s*[-–—]\s*((?:\d{4})|(?:present|current|now))'
+    current_year = datetime.now().year
+    for match in re.finditer(date_pattern, experience_text.lower()):
+        start_year = int(match.group(1))
+        end_str = match.group(2)
+        end_year = current_year if end_str in ['present', 'current', 'now'] else int(end_str)
+        if start_year <= end_year:
+            total_years += end_year - start_year
+    return max(total_years, _legacy_years_mentioned(experience_text))
+
+
+def _legacy_years_mentioned(text):
+    year_patterns = [
+        r'(\d+)\+?\s*years? of experience',
+        r'(\d+)\+?\s*years? in',
+        r'experienced (\d+)\+?\s*years?'
+    ]
+    total_years = 0
+    for pattern in year_patterns:
+        for match in re.finditer(pattern, text.lower()):
+            total_years = max(total_years, int(match.group(1)))
+    return total_years
+
+
+def experience_entries(paragraphs):
+    """Lines of the paragraphs headed "... Experience", what the scorer reads years from"""
+    entries = []
+    for paragraph in paragraphs:
+        heading, _, body = paragraph.partition("\n")
+        if "experience" in heading.lower():
+            entries.extend(line for line in body.split("\n") if line.strip())
+    return entries
+
+
+def run_before(paragraphs):
+    return (
+        _legacy_phone_numbers(paragraphs),
+        [_legacy_match_date(p) for p in paragraphs],
+        _legacy_years_mentioned("\n".join(paragraphs)),
+    )
+
+
+def run_after(paragraphs):
+    from parsers.patterns import YEARS_MENTION_RES, find_phone_numbers, match_date
+
+    text = "\n".join(paragraphs)
+    lowered = text.lower()
+    return (
+        find_phone_numbers(text),
+        [match_date(p) for p in paragraphs],
+        max((int(m.group(1)) for pattern in YEARS_MENTION_RES for m in pattern.finditer(lowered)), default=0),
+    )
+
+
+def run_year_scan(paragraphs):
+    return _legacy_years_of_experience(" ".join(experience_entries(paragraphs)))
+
+
+def run_timeline(paragraphs):
+    from parsers.experience_timeline import ExperienceTimeline
+
+    # The scorer's path, without the experience_timeline() cache so every pass parses
+    return ExperienceTimeline(experience_entries(paragraphs)).total_years
+
+
+def synthetic_documents(count, seed=0):
+    """Resume-like paragraph lists with contact lines and date ranges"""
+    rng = random.Random(seed)
+    documents = []
+    for doc_no in range(count):
+        paragraphs = [
+            f"Candidate {doc_no:05d}\ncandidate{doc_no}@example.com\n"
+            f"+216 {rng.randint(20000000, 99999999)}  (+33) 6{rng.randint(0, 99999999):08d}"
+        ]
+        for header, lines in _SYNTHETIC_SECTIONS.items():
+            paragraphs.append("\n".join([header] + rng.sample(lines, len(lines))))
+        if rng.random() < 0.5:
+            paragraphs.append(f"{rng.randint(2, 15)}+ years of experience in embedded software")
+        documents.append(paragraphs)
+    return documents
+
+
+def load_text_documents(directory):
+    """Paragraph lists from .txt files, paragraphs separated by blank lines"""
+    documents = []
+    for path in sorted(Path(directory).expanduser().glob("*.txt")):
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        paragraphs = [p for p in text.split("\n\n") if p.strip()]
+        if paragraphs:
+            documents.append(paragraphs)
+    return documents
+
+
+def _time_per_document(func, documents, repeat):
+    latencies = []
+    for _ in range(repeat):
+        for paragraphs in documents:
+            t0 = time.perf_counter()
+            func(paragraphs)
+            latencies.append((time.perf_counter() - t0) * 1e6)
+    latencies.sort()
+    return {
+        "mean_us": round(sum(latencies) / len(latencies), 2),
+        "p50_us": round(_percentile(latencies, 50), 2),
+        "p95_us": round(_percentile(latencies, 95), 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark contact and date regex extraction")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--documents', type=int, default=500, help='Synthetic documents to generate')
+    source.add_argument('--texts', help='Directory of extracted resume .txt files')
+    parser.add_argument('--repeat', type=int, default=3, help='Passes over the corpus')
+    parser.add_argument('--output', default=None, help='JSON results file')
+    args = parser.parse_args(argv)
+
+    documents = load_text_documents(args.texts) if args.texts else synthetic_documents(args.documents)
+    if not documents:
+        parser.error("No documents to benchmark")
+
+    # Warm up imports and the re module cache before timing
+    for func in (run_before, run_after, run_year_scan, run_timeline):
+        func(documents[0])
+
+    # The merged phone scan no longer reports a truncated duplicate of a number
+    mismatches = sum(1 for paragraphs in documents if run_before(paragraphs) != run_after(paragraphs))
+    before = _time_per_document(run_before, documents, args.repeat)
+    after = _time_per_document(run_after, documents, args.repeat)
+
+    # Years of experience are a different computation, timed on their own: the
+    # timeline merges overlaps, counts months and reads month-name ranges
+    # ("Jan 2016 - Dec 2018") that the year scan skips
+    year_mismatches = sum(1 for paragraphs in documents if run_year_scan(paragraphs) != run_timeline(paragraphs))
+    year_scan = _time_per_document(run_year_scan, documents, args.repeat)
+    timeline = _time_per_document(run_timeline, documents, args.repeat)
+
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "documents": len(documents),
+        "repeat": args.repeat,
+        "before": before,
+        "after": after,
+        "speedup": round(before["mean_us"] / after["mean_us"], 2) if after["mean_us"] else None,
+        "documents_with_different_output": mismatches,
+        "experience_years": {
+            "year_scan": year_scan,
+            "timeline": timeline,
+            "documents_with_different_years": year_mismatches,
+        },
+    }
+
+    output = Path(args.output) if args.output else (
+        Path(__file__).parent.parent / 'results' / f"regex_benchmark_{datetime.now():%Y%m%d_%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=4)
+
+    print(f"before: {before['mean_us']} us/doc (p95 {before['p95_us']})")
+    print(f"after:  {after['mean_us']} us/doc (p95 {after['p95_us']})")
+    print(f"speedup: {report['speedup']}x, documents with different output: {mismatches}")
+    print(f"years: year scan {year_scan['mean_us']} us/doc, timeline {timeline['mean_us']} us/doc, "
+          f"documents with different years: {year_mismatches}")
+    print(f"Results saved to: {output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@
 # @License : MIT License
 
 import argparse
+import json
 import os
 import atexit
 import signal
@@ -16,18 +17,28 @@ import sys
 import logging
 from pathlib import Path
 from datetime import datetime
-import json
 import time
+import tempfile
 import traceback
 
 from utilis.watchdog import Watchdog
 from utilis.log_manager import LogManager
 from parsers.PDFTextExtractorPyMuPDF import PDFTextExtractorPyMuPDF
 from parsers.PDFTextExtractorPdfMiner import PDFTextExtractorPdfMiner
+from parsers.pdf_document import PDFDocumentHandle
+from parsers.extraction_cache import ExtractionCache
+from parsers.extraction_quality import assess_extraction_quality
+from parsers.extraction_budget import ExtractionBudget
 from parsers.ResumeInfoExtractor import ResumeInfoExtractor
 from parsers.cv_scorer import CVScorer
+from parsers.batch_scorer import BatchScorer
+from parsers.feature_store import FeatureStore
+from parsers.profile_scorer import ProfileScorer
+from parsers.experience_timeline import experience_timeline
 from recommanders.skill_recommander import SkillRecommender
 from recommanders.course_recommander import CourseRecommender
+from recommanders.job_matcher import JobMatcher
+from utilis.result_models import ParsedResume, dumps
 import sys
 sys.path.append(str(Path(__file__).parent / 'parsers'))
 logger_manager = LogManager.get_log_manager()
@@ -51,24 +62,27 @@ logger = log_manager.get_logger(__name__)
 # Register cleanup
 atexit.register(log_manager.shutdown)
 
-TEMP_FILE = "temp_save.txt"
-
 HELP_TEXT = """
 Resume Analyzer CLI
 
 Usage:
-    python main.py <action> --path <file_path> [--timeout <seconds>]
+    python main.py <action> --path <file_path> [--timeout <seconds>] [--workers <n>]
 
 Actions:
     parse_cv     Parse the resume/CV and extract paragraphs
     recommend    Recommend courses based on the resume
-    match        Match resume to job offers
+    match        Match resume to job offers (--path), or stored CVs to a job offer (--job)
     compare      Compare parsers for resume extraction
+    rescore      Rank every stored CV under new criteria, without re-parsing
 
 Examples:
     python main.py parse_cv --path resume.pdf
     python main.py recommend --path resume.pdf --timeout 15
     python main.py compare --path resume.pdf
+    python main.py parse_cv --path portfolio.pdf --workers 4
+    python main.py rescore --criteria docker_required.json --top 20
+    python main.py match --path resume.pdf --top 5
+    python main.py match --job devops_engineer --top 20
 """
 
 # Handle Ctrl+C and SIGTERM
@@ -78,77 +92,147 @@ def handle_exit(signum, frame):
 signal.signal(signal.SIGINT, handle_exit)
 signal.signal(signal.SIGTERM, handle_exit)
 
-def extract_pdf_text_using_PdfMuPDF(pdf_path):
+def save_debug_paragraphs(paragraphs, engine, debug_dir):
+    """Write one engine's paragraphs to a unique per-request file (debug only)"""
+    debug_dir = Path(debug_dir)
+    debug_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    fd, debug_file = tempfile.mkstemp(prefix=f"{engine}_{timestamp}_", suffix=".txt", dir=debug_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        for para in paragraphs:
+            f.write(para + "\n\n")
+    logger.info(f"Debug paragraphs saved to: {debug_file}")
+    return debug_file
+
+def format_paragraphs(paragraphs):
+    """Numbered, human readable view of extracted paragraphs"""
+    if not paragraphs:
+        return None
+    output = "\n\n".join([f"--- Paragraph {i+1} ---\n{para}"
+                          for i, para in enumerate(paragraphs)
+                          if para.strip()])
+    return output if output else None
+
+_extraction_cache = None
+
+def get_extraction_cache():
+    """Process-wide extraction cache, disabled with CV_EXTRACTION_CACHE=0"""
+    global _extraction_cache
+    if os.environ.get("CV_EXTRACTION_CACHE", "1") == "0":
+        return None
+    if _extraction_cache is None:
+        max_mb = int(os.environ.get("CV_EXTRACTION_CACHE_MB", 256))
+        _extraction_cache = ExtractionCache(
+            cache_dir=os.environ.get("CV_EXTRACTION_CACHE_DIR"),
+            max_bytes=max_mb * 1024 * 1024
+        )
+    return _extraction_cache
+
+_feature_store = None
+
+def get_feature_store():
+    """Process-wide scoring feature store, disabled with CV_FEATURE_STORE=0"""
+    global _feature_store
+    if os.environ.get("CV_FEATURE_STORE", "1") == "0":
+        return None
+    if _feature_store is None:
+        _feature_store = FeatureStore(os.environ.get("CV_FEATURE_STORE_PATH"))
+    return _feature_store
+
+def _run_text_extractor(extractor, engine, debug_dir=None, budget=None):
+    """Extract paragraphs in memory; nothing touches the disk unless debug_dir is set"""
+    cache = get_extraction_cache()
+    # A budget tracks a single run, and budgeted output is cached separately
+    budget = budget.fresh() if budget and budget.enabled else None
+    cache_engine = extractor.ENGINE + (budget.cache_suffix if budget else "")
     try:
-        extractor = PDFTextExtractorPyMuPDF(pdf_path)
-        paragraphs = extractor.extract_paragraphs(TEMP_FILE)
+        paragraphs = None
+        if cache:
+            digest = extractor.document.sha256
+            paragraphs = cache.get(cache_engine, extractor.VERSION, digest)
+            if paragraphs is not None:
+                logger.info(f"{engine} extraction cache hit for {digest[:12]}")
+        if paragraphs is None:
+            paragraphs = extractor.extract_paragraphs(budget=budget)
+            if budget and budget.stop_reason:
+                logger.info(f"{engine} extraction stopped early: {budget.stop_reason}")
+            if cache and paragraphs:
+                cache.put(cache_engine, extractor.VERSION, digest, paragraphs)
+    finally:
         extractor.close()
 
-        if not paragraphs:
-            # Read from temp file as backup
-            with open(TEMP_FILE, 'r', encoding='utf-8') as f:
-                content = f.read()
-                paragraphs = [p.strip() for p in content.split('\n') if p.strip()]
+    if not paragraphs:
+        logger.warning("No paragraphs extracted from PDF")
+        return None
 
-        if not paragraphs:
-            logger.warning("No paragraphs extracted from PDF")
-            return None
+    logger.info(f"Extracted {len(paragraphs)} paragraphs from PDF")
+    print("\n\n")
+    print(f"================================= Using {engine} ================================")
+    print(f"[DEBUG] Extracted {len(paragraphs)} paragraphs")
+    print("==================================================================================")
+    print(paragraphs)
+    print("===============================================================================")
 
-        logger.info(f"Extracted {len(paragraphs)} paragraphs from PDF")
-        print("\n\n")
-        print("================================= Using PDF MINER ================================")
-        print(f"[DEBUG] Extracted {len(paragraphs)} paragraphs")
-        print("==================================================================================")
-        print(paragraphs)
-        print("===============================================================================")
-        
-        # Create formatted output with non-empty paragraphs
-        output = "\n\n".join([f"--- Paragraph {i+1} ---\n{para}" 
-                             for i, para in enumerate(paragraphs) 
-                             if para.strip()])
-        return output if output else None
+    if debug_dir:
+        save_debug_paragraphs(paragraphs, engine, debug_dir)
+    return paragraphs
 
+def extract_pdf_text_using_PdfMuPDF(source, debug_dir=None, budget=None, layout="text"):
+    try:
+        extractor = PDFTextExtractorPyMuPDF(source, layout=layout)
+        engine = "PyMuPDF" if layout == "text" else f"PyMuPDF ({layout})"
+        return _run_text_extractor(extractor, engine, debug_dir, budget)
     except Exception as e:
         logger.error(f"Failed to extract text from PDF: {str(e)}")
         return None
     
-def extract_pdf_text_using_PdfMiner(pdf_path):
+def extract_pdf_text_using_PdfMiner(source, workers=1, debug_dir=None, budget=None):
     try:
-        extractor = PDFTextExtractorPdfMiner(pdf_path)
-        paragraphs = extractor.extract_paragraphs(TEMP_FILE)
-        extractor.close()
+        extractor = PDFTextExtractorPdfMiner(source, workers=workers)
+        return _run_text_extractor(extractor, "PdfMiner", debug_dir, budget)
+    except Exception as e:
+        logger.error(f"Failed to extract text from PDF: {str(e)}")
+        return None
 
-        if not paragraphs:
-            # Read from temp file as backup
-            with open(TEMP_FILE, 'r', encoding='utf-8') as f:
-                content = f.read()
-                paragraphs = [p.strip() for p in content.split('\n') if p.strip()]
+def extract_adaptive(document, workers=1, debug_dir=None, budget=None):
+    """Run fast PyMuPDF first and fall back to PdfMiner only when its output looks poor.
 
-        if not paragraphs:
-            logger.warning("No paragraphs extracted from PDF")
-            return None
+    PyMuPDF runs in "blocks" layout so multi-column resumes keep their reading order.
+    Returns the chosen paragraphs and a record of which engine was used and why.
+    """
+    pymupdf_paragraphs = extract_pdf_text_using_PdfMuPDF(document, debug_dir=debug_dir, budget=budget,
+                                                         layout="blocks")
+    try:
+        page_count = document.page_count
+    except Exception:
+        page_count = 1
+    if budget and budget.max_pages:
+        page_count = min(page_count, budget.max_pages)
+    quality = assess_extraction_quality(pymupdf_paragraphs, page_count)
 
-        logger.info(f"Extracted {len(paragraphs)} paragraphs from PDF")
-        logger.info(f"********************************************************")
-        logger.info("******************** Printing paragraphs *****************")
-        logger.info(paragraphs)
-        logger.info(f"********************************************************")
-        print("\n\n")
-        print("================================= Using PDF MINER ================================")
-        print(f"[DEBUG] Extracted {len(paragraphs)} paragraphs")
-        print("==================================================================================")
-        print(paragraphs)
-        print("===============================================================================")
-        
-        # Create formatted output with non-empty paragraphs
-        output = "\n\n".join([f"--- Paragraph {i+1} ---\n{para}" 
-                             for i, para in enumerate(paragraphs) 
-                             if para.strip()])
-        return output if output else None
+    if pymupdf_paragraphs and quality["acceptable"]:
+        return pymupdf_paragraphs, {
+            "engine": "pymupdf",
+            "layout": "blocks",
+            "reason": "PyMuPDF output passed quality checks",
+            "quality": quality
+        }
 
-    except Exception as e:
-        logger.error(f"Failed to extract text from PDF: {str(e)}")
-        return None
+    logger.info(f"PyMuPDF output rejected ({'; '.join(quality['reasons'])}), falling back to PdfMiner")
+    miner_paragraphs = extract_pdf_text_using_PdfMiner(document, workers=workers, debug_dir=debug_dir, budget=budget)
+    if not miner_paragraphs:
+        # Poor text is still better than none
+        return pymupdf_paragraphs, {
+            "engine": "pymupdf",
+            "layout": "blocks",
+            "reason": "PdfMiner fallback produced no text",
+            "quality": quality
+        }
+    return miner_paragraphs, {
+        "engine": "pdfminer",
+        "reason": "PyMuPDF output failed quality checks: " + "; ".join(quality["reasons"]),
+        "quality": quality
+    }
 
 def print_parser_results(results):
     """Pretty print parser results"""
@@ -164,44 +248,64 @@ def print_parser_results(results):
                 logger.info(f"-{item}")
                 print(f"- {item}")
         else:
-            print(value)
+            print(value.to_dict() if isinstance(value, ParsedResume) else value)
+
+def compare_parsers(pdf_path, workers=1, debug_dir=None, mode="compare", budget=None, fields=None):
+    """Compare results from different parser implementations.
 
-def compare_parsers(pdf_path):
-    """Compare results from different parser implementations"""
+    mode="compare" runs both extraction engines and prefers PdfMiner;
+    mode="adaptive" runs PyMuPDF and only falls back to PdfMiner on poor output.
+    An ExtractionBudget limits how many pages the text engines read.
+    `fields` restricts the custom parser to some result keys and skips PyResParser.
+    """
     logger = logging.getLogger('ParserComparison')
     results = {
         'extraction_methods': {},
         'parsers': {}
     }
     
+    # Read the PDF once; every engine below works from the same buffer
+    document = PDFDocumentHandle.open(pdf_path)
     try:
-        # 1. Extract text using both methods
-
-        logger.info("Extracting text using PdfMiner...")
-        miner_text = extract_pdf_text_using_PdfMiner(pdf_path)
-        results['extraction_methods']['pdfminer'] = miner_text
-        
-        logger.info("Extracting text using PyMuPDF...")
-        pymupdf_text = extract_pdf_text_using_PdfMuPDF(pdf_path)
-        results['extraction_methods']['pymupdf'] = pymupdf_text
-        
-        # Use PdfMiner text as primary, fallback to PyMuPDF if needed
-        text_to_parse = miner_text if miner_text else pymupdf_text
+        results['sha256'] = document.sha256
+        # 1. Extract text
+        if mode == "adaptive":
+            logger.info("Extracting text adaptively (PyMuPDF first)...")
+            paragraphs_to_parse, selection = extract_adaptive(document, workers=workers, debug_dir=debug_dir,
+                                                              budget=budget)
+            results['extraction_methods'][selection["engine"]] = format_paragraphs(paragraphs_to_parse)
+            results['extraction'] = selection
+        else:
+            logger.info("Extracting text using PdfMiner...")
+            miner_paragraphs = extract_pdf_text_using_PdfMiner(document, workers=workers, debug_dir=debug_dir,
+                                                               budget=budget)
+            results['extraction_methods']['pdfminer'] = format_paragraphs(miner_paragraphs)
+            
+            logger.info("Extracting text using PyMuPDF...")
+            pymupdf_paragraphs = extract_pdf_text_using_PdfMuPDF(document, debug_dir=debug_dir, budget=budget)
+            results['extraction_methods']['pymupdf'] = format_paragraphs(pymupdf_paragraphs)
+            
+            # Use PdfMiner text as primary, fallback to PyMuPDF if needed
+            paragraphs_to_parse = miner_paragraphs if miner_paragraphs else pymupdf_paragraphs
+            results['extraction'] = {
+                "engine": "pdfminer" if miner_paragraphs else "pymupdf",
+                "reason": "compare mode prefers PdfMiner" if miner_paragraphs else "PdfMiner produced no text"
+            }
         
-        if not text_to_parse:
+        if not paragraphs_to_parse:
             logger.error("Failed to extract text from PDF using both methods")
             return False
             
-        # 2. Parse with ResumeInfoExtractor
+        # 2. Parse with ResumeInfoExtractor (paragraphs are handed over in memory)
         logger.info("Parsing with ResumeInfoExtractor...")
-        custom_parser = ResumeInfoExtractor(text_to_parse)
-        results['parsers']['custom'] = custom_parser.extract_all()
+        custom_parser = ResumeInfoExtractor(paragraphs_to_parse)
+        results['parsers']['custom'] = custom_parser.extract_resume(fields=fields)
         
         # 3. Parse with PyResParser if available
-        if HAS_PYRESPARSER:
+        if HAS_PYRESPARSER and fields is None:
             logger.info("Parsing with PyResParser...")
-            py_parser = PyResParserExtractor(pdf_path)
-            results['parsers']['pyres'] = py_parser.extract_all()
+            py_parser = PyResParserExtractor(document)
+            results['parsers']['pyres'] = ParsedResume.from_fields(py_parser.extract_all())
         
         # 4. Print comparison results
         print("\n=== Parsing Results Comparison ===\n")
@@ -212,18 +316,95 @@ def compare_parsers(pdf_path):
     except Exception as e:
         logger.error(f"Parser comparison failed: {str(e)}")
         raise
+    finally:
+        if document is not pdf_path:
+            document.close()
+
+def source_name(source):
+    """Label of a PDF in the feature store: its path, or the upload filename when in memory"""
+    if isinstance(source, PDFDocumentHandle):
+        return source.name if source.in_memory else source.pdf_path
+    return str(source)
+
+def score_parsed_cv(parsed_results, source=None):
+    """Score CV based on parsed results.
 
-def score_parsed_cv(parsed_results):
-    """Score CV based on parsed results"""
+    The custom parser's scoring features are also kept in the feature store,
+    keyed by the PDF hash, for later re-scoring (see rescore_corpus).
+    """
     logger.info("Scoring CV...")
     scorer = CVScorer()
     
     scores = {}
     for parser_name, parser_data in parsed_results['parsers'].items():
         scores[parser_name] = scorer.score_cv(parser_data)
+    
+    store = get_feature_store()
+    custom = parsed_results['parsers'].get('custom')
+    if store is not None and custom and parsed_results.get('sha256'):
+        store.put(parsed_results['sha256'], scorer.extract_features(custom), source)
         
     return scores
 
+def rescore_corpus(criteria_path=None, top=10, console=False):
+    """Rank every CV of the feature store under the default or a custom criteria file"""
+    store = get_feature_store()
+    if store is None:
+        logger.error("Feature store is disabled (CV_FEATURE_STORE=0)")
+        return None
+    custom_criteria = None
+    if criteria_path:
+        with open(criteria_path, 'r', encoding='utf-8') as f:
+            custom_criteria = json.load(f)
+    ranked = BatchScorer(custom_criteria).rescore(store, k=top)
+    logger.info(f"Re-scored {len(store)} stored CVs")
+    
+    if console:
+        print(f"\n=== Top {len(ranked)} of {len(store)} stored CVs ===")
+        for rank, (digest, source, score) in enumerate(ranked, start=1):
+            print(f"{rank:3d}. {score.total_score:6.2f}  {source or digest[:12]}  {score.detailed_scores}")
+    return ranked
+
+def print_matches(matches, heading):
+    print(f"\n=== {heading} ===")
+    for rank, match in enumerate(matches, start=1):
+        print(f"{rank:3d}. {match.score:6.2f}  {match.title}  "
+              f"(relevance {match.relevance}, CV score {match.cv_score.total_score})")
+        print(f"       matched: {', '.join(match.matched_terms)}")
+
+def match_cv_to_jobs(pdf_path, args=None, top=10):
+    """Parse and score a resume, then rank the job offers for it"""
+    results = compare_parsers(pdf_path, workers=getattr(args, "workers", 1) if args else 1,
+                              mode=getattr(args, "mode", "compare") if args else "compare")
+    if not results:
+        logger.error("Failed to parse resume")
+        return None
+    results['scores'] = score_parsed_cv(results, source=source_name(pdf_path))
+    matches = JobMatcher().top_jobs(results['parsers']['custom'], k=top)
+    results['job_matches'] = matches
+    print_matches(matches, f"Top {len(matches)} job offers")
+    
+    if args and getattr(args, "save", False):
+        output_dir = Path(__file__).parent / 'results'
+        output_dir.mkdir(exist_ok=True)
+        output_file = output_dir / f'job_matches_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        with open(output_file, 'wb') as f:
+            f.write(dumps(results, indent=True))
+        logger.info(f"Results saved to: {output_file}")
+    return results
+
+def match_job_to_cvs(job_id, top=10):
+    """Rank the CVs of the feature store for one job offer"""
+    store = get_feature_store()
+    if store is None:
+        logger.error("Feature store is disabled (CV_FEATURE_STORE=0)")
+        return None
+    matcher = JobMatcher()
+    matcher.load_store(store)
+    matches = matcher.top_cvs(job_id, k=top)
+    print_matches(matches, f"Top {len(matches)} of {len(store)} stored CVs for {job_id}")
+    return matches
+
 def measure_execution_time(func):
     """Decorator to measure execution time of functions"""
     def wrapper(*args, **kwargs):
@@ -238,16 +419,29 @@ def measure_execution_time(func):
     return wrapper
 
 @measure_execution_time
-def CV_parsing_main(pdf_path, save_results=False, args=None):
+def CV_parsing_main(pdf_path, save_results=False, args=None, mode=None, budget=None, fields=None):
     try:
         logger.info(f"Processing PDF: {pdf_path}")
-        results = compare_parsers(pdf_path)
+        workers = getattr(args, "workers", 1) if args else 1
+        debug_dir = getattr(args, "debug_dir", None) if args else None
+        mode = mode or (getattr(args, "mode", None) if args else None) or "compare"
+        if budget is None and args:
+            budget = ExtractionBudget(max_pages=getattr(args, "max_pages", None),
+                                      stop_when_sections_found=getattr(args, "stop_on_sections", False))
+        results = compare_parsers(pdf_path, workers=workers, debug_dir=debug_dir, mode=mode, budget=budget,
+                                  fields=fields)
+        
+        if results and fields is not None:
+            # Partial parses skip recommendations and scoring, which need every field
+            custom = results['parsers']['custom']
+            logger.info(f"Parsed fields: {', '.join(custom.to_dict() if custom else {})}")
+            return results
         
         if results:
             # Add skill recommendations
-            custom_results = results['parsers'].get('custom', {})
-            current_skills = custom_results.get('Skills', [])
-            position = custom_results.get('Position', 'sw_designer')  # default to sw_designer if not found
+            custom_results = results['parsers'].get('custom')
+            current_skills = list(custom_results.skills or ()) if custom_results else []
+            position = 'sw_designer'  # the position is not extracted yet
             
             # Get skill recommendations
             recommender = SkillRecommender()
@@ -262,9 +456,15 @@ def CV_parsing_main(pdf_path, save_results=False, args=None):
             results['learning_path'] = course_recommendations
             
             # Score the CV
-            cv_scores = score_parsed_cv(results)
+            cv_scores = score_parsed_cv(results, source=source_name(pdf_path))
             results['scores'] = cv_scores
             
+            # Fit against every position profile, from the same features
+            if custom_results:
+                results['profile_scores'] = ProfileScorer().score_cv(custom_results)
+                # Cached: the scorer already built it from the same entries
+                results['experience_timeline'] = experience_timeline(custom_results.experience)
+            
             logger.info("Successfully parsed, scored and generated recommendations")
             
             if save_results:
@@ -274,31 +474,41 @@ def CV_parsing_main(pdf_path, save_results=False, args=None):
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 output_file = output_dir / f'parsed_resume_{timestamp}.json'
                 
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=4, ensure_ascii=False)
+                with open(output_file, 'wb') as f:
+                    f.write(dumps(results, indent=True))
                 logger.info(f"Results saved to: {output_file}")
             
             if args and getattr(args, "console", False):
                 print("\n=== CV Analysis Results ===")
                 print(f"\nCurrent Position: {position}")
+                timeline = results.get('experience_timeline')
+                if timeline:
+                    print(f"Experience: {timeline.total_months // 12} years {timeline.total_months % 12} months"
+                          f" ({timeline.gap_months} months of gaps)")
                 print("\nSkill Recommendations:")
-                if skill_recommendations["status"] == "success":
+                if skill_recommendations.ok:
                     print("\nMissing Required Skills:")
-                    for skill in skill_recommendations["recommendations"]["missing_required"]:
+                    for skill in skill_recommendations.missing_required:
                         print(f"- {skill}")
                     
                     print("\nMissing Preferred Skills:")
-                    for skill in skill_recommendations["recommendations"]["missing_preferred"]:
+                    for skill in skill_recommendations.missing_preferred:
                         print(f"- {skill}")
                     
                     print("\nRelated Skills to Consider:")
-                    for skill in skill_recommendations["recommendations"]["related_skills"]:
+                    for skill in skill_recommendations.related_skills:
                         print(f"- {skill}")
                 
+                if results.get('profile_scores'):
+                    print("\nBest Fitting Positions:")
+                    best = sorted(results['profile_scores'].items(), key=lambda item: -item[1])
+                    for profile, score in best[:3]:
+                        print(f"- {profile}: {score}")
+                
                 print("\n=== Learning Resources ===")
-                if course_recommendations["status"] == "success":
+                if course_recommendations.ok:
                     print("\nPriority Courses:")
-                    for skill, courses in course_recommendations["high_priority"].items():
+                    for skill, courses in course_recommendations.high_priority.items():
                         print(f"\nFor {skill.upper()}:")
                         if courses["udemy"]:
                             print("  Udemy Courses:")
@@ -341,12 +551,33 @@ if __name__ == "__main__":
     start_time = time.time()
     
     parser = argparse.ArgumentParser(description=HELP_TEXT)
-    parser.add_argument('action', choices=['parse_cv', 'recommend', 'match', 'compare'])
-    parser.add_argument('--path', required=True, help='Path to the resume PDF file')
+    parser.add_argument('action', choices=['parse_cv', 'recommend', 'match', 'compare', 'rescore'])
+    parser.add_argument('--path', help='Path to the resume PDF file')
     parser.add_argument('--save', action='store_true', help='Save results to JSON file')
     parser.add_argument('--logging', action='store_true', help='Enable logging to file')
     parser.add_argument('--console', action='store_true', help='Enable console output')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Number of processes for page-parallel PdfMiner extraction')
+    parser.add_argument('--mode', choices=['compare', 'adaptive'], default='compare',
+                        help='compare: run both engines; adaptive: PyMuPDF first, PdfMiner only on poor output')
+    parser.add_argument('--max-pages', type=int, default=None,
+                        help='Only extract the first N pages of the PDF')
+    parser.add_argument('--stop-on-sections', action='store_true',
+                        help='Stop extracting once name, contact, experience and education were found')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the on-disk extraction cache')
+    parser.add_argument('--debug-dir', default=None,
+                        help='Write each engine\'s extracted paragraphs to a unique file in this directory')
+    parser.add_argument('--criteria', default=None,
+                        help='rescore: JSON file of scoring criteria sections overriding scoring_criteria.json')
+    parser.add_argument('--top', type=int, default=10, help='rescore/match: number of results to list')
+    parser.add_argument('--job', default=None,
+                        help='match: rank the stored CVs for this job offer id instead of matching --path')
     args = parser.parse_args()
+    if args.action != 'rescore' and not args.path and not (args.action == 'match' and args.job):
+        parser.error(f"--path is required for {args.action}")
+    if args.no_cache:
+        os.environ["CV_EXTRACTION_CACHE"] = "0"
     
     # Setup logging based on flags
     log_manager = setup_logging(
@@ -357,6 +588,13 @@ if __name__ == "__main__":
     
     if args.action == 'parse_cv':
         result = CV_parsing_main(args.path, save_results=args.save, args=args)
+    elif args.action == 'rescore':
+        result = rescore_corpus(args.criteria, top=args.top, console=True)
+    elif args.action == 'match':
+        if args.job:
+            result = match_job_to_cvs(args.job, top=args.top)
+        else:
+            result = match_cv_to_jobs(args.path, args=args, top=args.top)
     
     # Only show execution time if console output is enabled
     if args.console:
@@ -9,46 +9,121 @@
 
 
 import io
+from concurrent.futures import ProcessPoolExecutor
+
 from pdfminer3.layout import LAParams, LTTextBox, LTTextContainer
 from pdfminer3.pdfpage import PDFPage
 from pdfminer3.pdfinterp import PDFResourceManager, PDFPageInterpreter
 from pdfminer3.converter import PDFPageAggregator
-from pdfminer3.pdfparser import PDFSyntaxError
-from pdfminer3.pdfdocument import PDFTextExtractionNotAllowed
-from pdfminer3.pdfparser import PDFParser
-from pdfminer3.pdfdocument import PDFDocument
+from pdfminer3.pdfparser import PDFSyntaxError, PDFParser
+from pdfminer3.pdfdocument import PDFTextExtractionNotAllowed, PDFDocument
+
+from .pdf_document import PDFDocumentHandle
+
+
+def _new_interpreter():
+    rsrcmgr = PDFResourceManager()
+    device = PDFPageAggregator(rsrcmgr, laparams=LAParams())
+    return PDFPageInterpreter(rsrcmgr, device), device
+
+
+def _page_text_boxes(interpreter, device, page):
+    """Run layout analysis on one page and return its non-empty text boxes"""
+    interpreter.process_page(page)
+    texts = []
+    for element in device.get_result():
+        if isinstance(element, (LTTextBox, LTTextContainer)):
+            text = element.get_text().strip()
+            if text:
+                texts.append(text)
+    return texts
+
+
+# Per-process state of the page pool, set once by _init_page_worker
+_worker_pages = None
+_worker_interpreter = None
+_worker_device = None
+
+
+def _init_page_worker(data):
+    """Parse the document once per worker process"""
+    global _worker_pages, _worker_interpreter, _worker_device
+    document = PDFDocument(PDFParser(io.BytesIO(data)))
+    _worker_pages = list(PDFPage.create_pages(document))
+    _worker_interpreter, _worker_device = _new_interpreter()
+
+
+def _extract_page_worker(page_no):
+    return _page_text_boxes(_worker_interpreter, _worker_device, _worker_pages[page_no])
+
 
 class PDFTextExtractorPdfMiner:
-    def __init__(self, pdf_path):
-        self.pdf_path = pdf_path
+    # Cache identity; bump VERSION whenever the extracted output changes
+    ENGINE = "pdfminer"
+    VERSION = "1"
+
+    def __init__(self, source, workers=1):
+        # `source` is a file path, PDF bytes or a shared PDFDocumentHandle
+        self.document = PDFDocumentHandle.open(source)
+        self._owns_document = self.document is not source
+        self.pdf_path = self.document.pdf_path
+        # workers > 1 runs the layout analysis of pages in a process pool
+        self.workers = max(1, workers or 1)
         self.paragraphs = []
 
-    def load_pdf(self):
+    def load_pdf(self, budget=None):
         try:
-            with open(self.pdf_path, 'rb') as f:
-                parser = PDFParser(f)
-                document = PDFDocument(parser)
-                if not document.is_extractable:
-                    raise PDFTextExtractionNotAllowed("Text extraction not allowed")
-
-                rsrcmgr = PDFResourceManager()
-                laparams = LAParams()
-                device = PDFPageAggregator(rsrcmgr, laparams=laparams)
-                interpreter = PDFPageInterpreter(rsrcmgr, device)
-
-                for page in PDFPage.create_pages(document):
-                    interpreter.process_page(page)
-                    layout = device.get_result()
-                    for element in layout:
-                        if isinstance(element, (LTTextBox, LTTextContainer)):
-                            text = element.get_text().strip()
-                            if text:
-                                self.paragraphs.append(text)
+            self.paragraphs = [para for _, para in self.iter_paragraphs(budget)]
             print(f"Successfully extracted text boxes from: {self.pdf_path}")
         except (FileNotFoundError, PDFSyntaxError, PDFTextExtractionNotAllowed) as e:
             print(f"Error processing PDF: {e}")
             self.paragraphs = []
 
+    def iter_paragraphs(self, budget=None):
+        """Yield (page_no, paragraph) pairs as each page finishes, page_no starting at 1.
+
+        An ExtractionBudget stops extraction before pages it does not need.
+        Unlike load_pdf, PDF errors are raised to the caller.
+        """
+        document = self.document.pdfminer_document
+        if not document.is_extractable:
+            raise PDFTextExtractionNotAllowed("Text extraction not allowed")
+
+        for page_no, page_texts in enumerate(self._iter_page_texts(budget), start=1):
+            for text in page_texts:
+                if budget:
+                    budget.observe(text)
+                yield page_no, text
+
+    def _iter_page_texts(self, budget=None):
+        """Yield the text boxes of each page, in page order"""
+        pages = self.document.pdfminer_pages
+        if budget and budget.max_pages:
+            pages = pages[:budget.max_pages]
+        workers = min(self.workers, len(pages))
+        if workers <= 1:
+            interpreter, device = _new_interpreter()
+            for page_no, page in enumerate(pages, start=1):
+                if budget and budget.before_page(page_no):
+                    return
+                yield _page_text_boxes(interpreter, device, page)
+            return
+
+        # Page objects are not picklable: each worker parses the shared bytes
+        # once, then receives page numbers. Results are read back in page order;
+        # pages left over when the budget stops extraction are cancelled.
+        pool = ProcessPoolExecutor(max_workers=workers,
+                                   initializer=_init_page_worker,
+                                   initargs=(self.document.data,))
+        try:
+            futures = [pool.submit(_extract_page_worker, i) for i in range(len(pages))]
+            for page_no, future in enumerate(futures, start=1):
+                if budget and budget.before_page(page_no):
+                    return
+                yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
     def save_extracted_paragraphs(self, output_path):
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
@@ -58,15 +133,16 @@ class PDFTextExtractorPdfMiner:
         except Exception as e:
             print(f"Failed to save extracted paragraphs: {e}")
 
-    def extract_paragraphs(self, output_path=None):
-        self.load_pdf()
+    def extract_paragraphs(self, output_path=None, budget=None):
+        self.load_pdf(budget)
         if output_path:
             self.save_extracted_paragraphs(output_path)
         return self.paragraphs
 
     def close(self):
-        # No persistent resource to close in this implementation
-        pass
+        # A shared handle is closed by whoever opened it
+        if self._owns_document:
+            self.document.close()
 
 
 # Example usage
@@ -7,16 +7,34 @@
 # @Software: Vscode
 # @Description: This module provides a class to extract text from PDF files.
 
-import fitz  # PyMuPDF
+from .pdf_document import PDFDocumentHandle
+from .layout_blocks import LAYOUT_VERSION, page_blocks_in_reading_order
 
 class PDFTextExtractorPyMuPDF:
-    def __init__(self, pdf_path):
-        self.pdf_path = pdf_path
+    # Cache identity; bump VERSION whenever the extracted output changes
+    ENGINE = "pymupdf"
+    VERSION = "2"
+    LAYOUTS = ("text", "blocks")
+
+    def __init__(self, source, layout="text"):
+        # `source` is a file path, PDF bytes or a shared PDFDocumentHandle
+        self.document = PDFDocumentHandle.open(source)
+        self._owns_document = self.document is not source
+        self.pdf_path = self.document.pdf_path
+        # "text" splits plain page text on blank lines; "blocks" rebuilds the
+        # reading order of multi-column pages from block bounding boxes
+        if layout not in self.LAYOUTS:
+            raise ValueError(f"Unknown layout '{layout}', expected one of {self.LAYOUTS}")
+        self.layout = layout
+        if layout != "text":
+            self.ENGINE = f"pymupdf-{layout}"
+            # Cached block layouts are dropped when layout_blocks changes
+            self.VERSION = f"{self.VERSION}.{LAYOUT_VERSION}"
         self.doc = None
 
     def load_pdf(self):
         try:
-            self.doc = fitz.open(self.pdf_path)
+            self.doc = self.document.fitz_document
             print(f"PDF loaded successfully: {self.pdf_path}")
         except Exception as e:
             print(f"Failed to load PDF: {e}")
@@ -31,19 +49,53 @@ class PDFTextExtractorPyMuPDF:
         except Exception as e:
             print(f"Failed to save extracted paragraphs: {e}")
 
-    def extract_paragraphs(self, output_path=None):
+    def iter_paragraphs(self, budget=None):
+        """Yield (page_no, paragraph) pairs as each page finishes, page_no starting at 1.
+
+        An ExtractionBudget stops extraction before pages it does not need.
+        """
         if not self.doc:
             self.load_pdf()
         if not self.doc:
-            return []
+            return
+
+        if self.layout == "blocks":
+            for block in self.iter_blocks(budget):
+                yield block.page_no, block.text
+            return
 
-        paragraphs = []
         for page_num in range(len(self.doc)):
+            if budget and budget.before_page(page_num + 1):
+                return
             page = self.doc.load_page(page_num)
             text = page.get_text("text")
-            page_paragraphs = self._split_into_paragraphs(text)
-            paragraphs.extend(page_paragraphs)
-        return self.save_extracted_paragraphs(paragraphs, output_path) if output_path else paragraphs
+            for para in self._split_into_paragraphs(text):
+                if budget:
+                    budget.observe(para)
+                yield page_num + 1, para
+
+    def iter_blocks(self, budget=None):
+        """Yield TextBlock objects (bbox, font size, column, heading flag) in reading order"""
+        if not self.doc:
+            self.load_pdf()
+        if not self.doc:
+            return
+
+        for page_num in range(len(self.doc)):
+            if budget and budget.before_page(page_num + 1):
+                return
+            page = self.doc.load_page(page_num)
+            page_dict = page.get_text("dict")
+            for block in page_blocks_in_reading_order(page_dict, page_num + 1):
+                if budget:
+                    budget.observe(block.text)
+                yield block
+
+    def extract_paragraphs(self, output_path=None, budget=None):
+        paragraphs = [para for _, para in self.iter_paragraphs(budget)]
+        if output_path:
+            self.save_extracted_paragraphs(paragraphs, output_path)
+        return paragraphs
 
 
     def _split_into_paragraphs(self, text):
@@ -51,8 +103,10 @@ class PDFTextExtractorPyMuPDF:
         return [para.strip() for para in text.split('\n\n') if para.strip()]
 
     def close(self):
-        if self.doc:
-            self.doc.close()
+        # A shared handle is closed by whoever opened it
+        if self._owns_document:
+            self.document.close()
+        self.doc = None
 
 
 # Example usage
@@ -10,22 +10,28 @@ import logging
 from pyresparser import ResumeParser
 from pathlib import Path
 
+from .pdf_document import PDFDocumentHandle
+
 class PyResParserExtractor:
-    def __init__(self, pdf_path):
-        self.pdf_path = pdf_path
+    def __init__(self, source):
+        # `source` is a file path, PDF bytes or a shared PDFDocumentHandle
+        self.document = PDFDocumentHandle.open(source)
+        self.pdf_path = self.document.pdf_path
         self.logger = logging.getLogger('PyResParser')
 
     def extract_all(self):
         try:
             self.logger.info(f"Starting pyresparser extraction for: {self.pdf_path}")
-            data = ResumeParser(self.pdf_path).get_extracted_data()
+            # pyresparser accepts a named BytesIO (it reads the extension from
+            # the name), so it reuses the shared buffer instead of the path
+            data = ResumeParser(self.document.stream(name="resume.pdf")).get_extracted_data()
             
             results = {
                 "Name": data.get('name', ''),
                 "Email": data.get('email', []),
                 "Phone": data.get('mobile_number', []),
                 "Skills": data.get('skills', []),
-                "Experience": data.get('experience', ["No experience found"])
+                "Experience": data.get('experience') or []
             }
             
             self.logger.debug(f"PyResParser results: {results}")
@@ -5,13 +5,129 @@
 # @File    : ResumeInfoExtractor.py
 # @Description: Extracts structured information from resume paragraphs.
 
+import copy
 import re
-import json
 import os
-from pathlib import Path
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from itertools import islice
+
+from utilis.asset_registry import AssetRegistry
+from utilis.result_models import ParsedResume
+from .entity_extractor import NER_ENABLED, HeaderEntities, HeaderEntityExtractor
+from .fuzzy_skill_matcher import FuzzySkillMatcher
+from .keyword_matcher import build_resume_matcher, drop_nested_hits
+from .patterns import EMAIL_RE, find_phone_numbers, match_date
+from .section_index import HEADER_SECTION, build_section_index
+from .text_normalizer import fold_text, normalize_text
+
+
+def _experience_fallback():
+    return {
+        "section_headers": [],
+        "date_patterns": [],
+        "position_indicators": [],
+        "company_indicators": [],
+        "action_verbs": []
+    }
+
+
+def _education_fallback():
+    return {
+        "section_headers": [],
+        "section_markers": {"start": [], "end": []},
+        "degree_types": {},
+        "education_levels": {},
+        "fields": [],
+        "institutions": []
+    }
+
+
+def _compile_resume_keywords(skills_data, experience_keywords, education_keywords, section_headers,
+                             skill_aliases):
+    """Flatten the skill categories and build the keyword automaton and fuzzy skill index"""
+    skill_keywords = [fold_text(skill) for category in skills_data.values() for skill in category]
+    section_headers = dict(section_headers)
+    section_headers["experience"] = experience_keywords.get("section_headers", [])
+    section_headers["education"] = (education_keywords.get("section_headers", [])
+                                    + education_keywords.get("section_markers", {}).get("start", []))
+    return {
+        "skills": skill_keywords,
+        "skill_order": list(dict.fromkeys(skill_keywords)),
+        "experience": experience_keywords,
+        "education": education_keywords,
+        "institution_order": [
+            (level, inst_name, inst_data)
+            for level, level_data in education_keywords.get("education_levels", {}).items()
+            for inst_name, inst_data in level_data.get("institutions", {}).items()
+        ],
+        "matcher": build_resume_matcher(skill_keywords, experience_keywords, education_keywords,
+                                        section_headers, skill_aliases.get("aliases", {})),
+        "fuzzy_skills": FuzzySkillMatcher(skill_keywords, skill_aliases.get("fuzzy_exclusions", []))
+    }
+
+
+# Paragraph separators written by the debug paragraph dumps
+_PARAGRAPH_MARKER_RE = re.compile(r'---\s*Paragraph\s*\d+\s*---')
+
+
+_registry = AssetRegistry.get_registry()
+_registry.register(
+    "resume_keywords",
+    ["skills_keywords.json", "experience_keywords.json", "education_keywords.json", "section_headers.json",
+     "skill_aliases.json"],
+    _compile_resume_keywords,
+    fallbacks=[dict, _experience_fallback, _education_fallback, dict, dict]
+)
+
+# Resumes handed to a worker at a time by extract_many()
+EXTRACT_CHUNK_SIZE = 64
+# Resumes without any section heading are all "header"; NER reads only this much of it
+HEADER_NER_MAX_CHARS = 1000
+
+
+def _iter_chunks(items, size):
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_extract_worker():
+    """Compile the keyword assets and load the NER model once per worker process"""
+    _registry.get("resume_keywords")
+    if NER_ENABLED:
+        HeaderEntityExtractor.get_extractor()
+
+
+def _extract_chunk(texts, fields):
+    """extract_resume() over one chunk, sharing a single snapshot of the compiled assets"""
+    keywords = _registry.get("resume_keywords")
+    extractors = []
+    for text in texts:
+        try:
+            extractors.append(ResumeInfoExtractor(text, keywords=keywords, verbose=False))
+        except ValueError:
+            # Empty resume
+            extractors.append(None)
+
+    # Names come from one nlp.pipe() pass over the chunk's header sections
+    parsed = [extractor for extractor in extractors if extractor is not None and extractor.use_ner]
+    if parsed and (fields is None or "Name" in fields):
+        entities = HeaderEntityExtractor.get_extractor().extract_batch(e.header_text for e in parsed)
+        for extractor, header_entities in zip(parsed, entities):
+            extractor._header_entities = header_entities
+
+    return [extractor.extract_resume(fields=fields) if extractor is not None else None
+            for extractor in extractors]
+
 
 class ResumeInfoExtractor:
-    def __init__(self, paragraphs):
+    def __init__(self, paragraphs, keywords=None, verbose=True, use_ner=None):
         if not paragraphs:
             raise ValueError("No paragraphs provided")
             
@@ -19,192 +135,201 @@ class ResumeInfoExtractor:
         if isinstance(paragraphs, str):
             self.paragraphs = [p for p in paragraphs.split('\n\n') if p.strip()]
         else:
-            self.paragraphs = [p for p in paragraphs if p.strip()]
+            # Lists of strings, or (page_no, paragraph) streams from iter_paragraphs();
+            # a stream is read to the end, sections need the whole text
+            self.paragraphs = [p for p in self._iter_paragraph_texts(paragraphs) if p.strip()]
             
         if not self.paragraphs:
             raise ValueError("No valid paragraphs after processing")
             
         self.text = "\n".join(self.paragraphs)
-        print(f"Debug: Loaded {len(self.paragraphs)} paragraphs")
+        self.verbose = verbose
+        # spaCy NER on the header section for the name, when installed (see entity_extractor)
+        self.use_ner = NER_ENABLED if use_ner is None else use_ner and NER_ENABLED
+        self._header_entities = None
+        if verbose:
+            print(f"Debug: Loaded {len(self.paragraphs)} paragraphs")
         
-        self.skills_file = Path(__file__).parent.parent / 'assets' / 'skills_keywords.json'
-        self.experience_file = Path(__file__).parent.parent / 'assets' / 'experience_keywords.json'
-        self.education_file = Path(__file__).parent.parent / 'assets' / 'education_keywords.json'
-        self.skill_keywords = self._load_skills()
-        self.experience_keywords = self._load_experience_keywords()
-        self.education_keywords = self._load_education_keywords()
-        print(f"Debug: Loaded {len(self.skill_keywords)} skills")
-
-    def _load_skills(self):
-        """Load skills from JSON file"""
-        try:
-            with open(self.skills_file, 'r') as f:
-                skills_data = json.load(f)
-                # Flatten the dictionary of skill categories into a single list
-                return [skill.lower() for category in skills_data.values() for skill in category]
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading skills file: {e}")
-            return []
-
-    def _load_experience_keywords(self):
-        """Load experience keywords from JSON file"""
-        try:
-            with open(self.experience_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading experience keywords: {str(e)}")
-            return {
-                "section_headers": [],
-                "date_patterns": [],
-                "position_indicators": [],
-                "company_indicators": [],
-                "action_verbs": []
-            }
-
-    def _load_education_keywords(self):
-        """Load education keywords from JSON file"""
+        # Keyword assets and the automaton built from them are compiled once per
+        # process by the asset registry; this instance keeps a consistent snapshot
+        keywords = keywords or _registry.get("resume_keywords")
+        self.skill_keywords = keywords["skills"]
+        self._skill_order = keywords["skill_order"]
+        self.experience_keywords = keywords["experience"]
+        self.education_keywords = keywords["education"]
+        self._institution_order = keywords["institution_order"]
+        self.matcher = keywords["matcher"]
+        self.fuzzy_skills = keywords["fuzzy_skills"]
+        if verbose:
+            print(f"Debug: Loaded {len(self.skill_keywords)} skills")
+
+    @classmethod
+    def extract_many(cls, texts, fields=None, chunk_size=EXTRACT_CHUNK_SIZE, workers=1):
+        """Yield extract_resume(fields), a ParsedResume, for each resume of `texts`, in input order.
+
+        `texts` may be any iterable of resume texts or paragraph lists; it is
+        consumed chunk by chunk. Every chunk reuses the compiled matchers, and
+        with workers > 1 chunks run in worker processes, at most two per worker
+        in flight. Empty resumes yield None.
+        """
+        chunks = _iter_chunks(texts, chunk_size)
+        if workers <= 1:
+            for chunk in chunks:
+                yield from _extract_chunk(chunk, fields)
+            return
+
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_extract_worker)
         try:
-            with open(self.education_file, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading education keywords: {str(e)}")
-            return {
-                "section_headers": [],
-                "degree_types": {},
-                "fields": [],
-                "institutions": []
-            }
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.submit(_extract_chunk, chunk, fields))
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Also reached when the caller stops iterating early
+            pool.shutdown(cancel_futures=True)
 
-    def extract_name(self):
-        # Naive assumption: first non-empty line is the name
-        for line in self.text.splitlines():
+    @staticmethod
+    def _iter_paragraph_texts(paragraphs):
+        """Paragraph texts of a list or of a (page_no, paragraph) stream"""
+        for item in paragraphs:
+            if isinstance(item, tuple):
+                item = item[1]
+            yield item
+
+    @cached_property
+    def normalized(self):
+        """Folded view of the text shared by every matcher, with offsets back to self.text"""
+        return normalize_text(self.text)
+
+    @cached_property
+    def header_text(self):
+        """Text above the first section heading: name, title and contact lines"""
+        header = self.sections.span(HEADER_SECTION)
+        return self.text[:header.end][:HEADER_NER_MAX_CHARS] if header else ""
+
+    @property
+    def header_entities(self):
+        """Person and organization entities of the header section"""
+        if self._header_entities is None:
+            if self.use_ner:
+                self._header_entities = HeaderEntityExtractor.get_extractor().extract(self.header_text)
+            else:
+                self._header_entities = HeaderEntities()
+        return self._header_entities
+
+    @cached_property
+    def name(self):
+        if self.header_entities.name:
+            return self.header_entities.name
+        # Naive fallback: first non-empty line above the first section is the name
+        header = self.sections.span(HEADER_SECTION)
+        for line in self.text[:header.end if header else len(self.text)].splitlines():
             if line.strip() and not any(char.isdigit() for char in line):
                 return line.strip()
-        return "Name not found"
+        return ""
 
-    def extract_emails(self):
-        return re.findall(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", self.text)
+    @cached_property
+    def emails(self):
+        return EMAIL_RE.findall(self.text)
 
-    def extract_phone_numbers(self):
+    @cached_property
+    def phone_numbers(self):
         """Extract phone numbers with improved validation"""
-        phone_patterns = [
-            # International format with country code
-            r'(?:\+\d{1,3}[-\s]?)?\d{8,12}',
-            # Format: +XXX XXXXXXXX
-            r'\+\d{1,3}\s\d{8}',
-            # Common Tunisian format
-            r'\+216\s\d{8}'
-        ]
-        
-        found_numbers = []
-        
-        for para in self.paragraphs:
-            for pattern in phone_patterns:
-                matches = re.finditer(pattern, para)
-                for match in matches:
-                    number = match.group().strip()
-                    # Additional validation
-                    if self._is_valid_phone(number):
-                        found_numbers.append(number)
-        
-        # Remove duplicates while maintaining order
-        unique_numbers = list(dict.fromkeys(found_numbers))
-        
-        return unique_numbers if unique_numbers else ["No phone number found"]
+        # One scan of the full text with the merged phone pattern
+        return find_phone_numbers(self.text)
 
-    def _is_valid_phone(self, number):
-        """Validate phone number"""
-        # Remove all non-digit characters except '+'
-        cleaned = ''.join(c for c in number if c.isdigit() or c == '+')
-        
-        # Basic validation rules
-        if not cleaned:
-            return False
-            
-        # Must start with + or digit
-        if not (cleaned.startswith('+') or cleaned[0].isdigit()):
-            return False
-            
-        # Check length (including country code)
-        if len(cleaned) < 8 or len(cleaned) > 15:
-            return False
-            
-        # If starts with +, must have proper country code
-        if cleaned.startswith('+'):
-            # For Tunisia (+216)
-            if cleaned.startswith('+216'):
-                return len(cleaned) == 12  # +216 + 8 digits
-                
-        # Must contain only digits after potential '+'
-        if not cleaned[1:].isdigit():
-            return False
-            
-        # Reject if contains year-like numbers
-        if re.search(r'[12]\d{3}', cleaned):
-            return False
-            
-        return True
+    @cached_property
+    def keyword_hits(self):
+        """Every keyword hit in the resume, from a single pass of the matcher.
 
-    def extract_skills(self):
+        Hits are found in the folded view; their spans point into self.text.
+        """
+        return self._to_original(self.matcher.scan(self.normalized.text))
+
+    @cached_property
+    def fuzzy_skill_hits(self):
+        """Misspelled ("Pyhton") and split ("java script") skills, spans into self.text"""
+        return self._to_original(self.fuzzy_skills.scan(self.normalized.text))
+
+    def _to_original(self, hits):
+        """Map hit spans from the folded view back to self.text"""
+        if self.normalized.offsets is None:
+            return hits
+        mapped = []
+        for hit in hits:
+            start, end = self.normalized.to_original(hit.start, hit.end)
+            mapped.append(hit._replace(start=start, end=end))
+        return mapped
+
+    @cached_property
+    def sections(self):
+        """Section index of the resume, segmented once from the keyword hits"""
+        return build_section_index(self.text, self.keyword_hits)
+
+    def _span_lines(self, span, categories):
+        """Lines of a section span, with the keyword hits of `categories` bucketed per line"""
+        lines = self.text[span.start:span.end].split('\n')
+        starts = []
+        offset = span.start
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+        buckets = [[] for _ in lines]
+        for hit in self.keyword_hits:
+            if hit.category in categories and span.start <= hit.start and hit.end <= span.end:
+                buckets[bisect_right(starts, hit.start) - 1].append(hit)
+        return lines, buckets
+
+    @cached_property
+    def skills(self):
         """Extract skills from resume text using loaded keywords"""
-        found_skills = []
-        for skill in self.skill_keywords:
-            if re.search(r'\b' + re.escape(skill) + r'\b', self.text.lower()):
-                found_skills.append(skill)
-        return found_skills
+        hits = [hit for hit in self.keyword_hits if hit.category == "skill"] + self.fuzzy_skill_hits
+        # "c plus plus" stands for c++ alone, not also for c
+        found = {hit.value for hit in drop_nested_hits(hits)}
+        # Keep the vocabulary order of the skills file
+        return [skill for skill in self._skill_order if skill in found]
 
-    def extract_experience(self):
-        """Extract work experience using keywords from JSON file"""
+    @cached_property
+    def experience(self):
+        """Extract work experience entries from the experience section(s)"""
         experience_sections = []
-        current_section = []
-        in_experience_section = False
-        
-        lines = self.text.split('\n')
         
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # Check section headers
-            if any(header.lower() in line.lower() 
-                   for header in self.experience_keywords['section_headers']):
-                in_experience_section = True
-                if current_section:
-                    experience_sections.append(' '.join(current_section))
-                    current_section = []
-                continue
-                
-            # Identify experience entries using position and company indicators
-            has_position = any(indicator.lower() in line.lower() 
-                             for indicator in self.experience_keywords['position_indicators'])
-            has_company = any(indicator.lower() in line.lower() 
-                             for indicator in self.experience_keywords['company_indicators'])
-            
-            if in_experience_section and (has_position or has_company):
-                if current_section:
-                    experience_sections.append(' '.join(current_section))
-                current_section = [line]
-                continue
-                
-            if in_experience_section:
+        for span in self.sections.spans_of("experience"):
+            current_section = []
+            lines, line_hits = self._span_lines(span, {"experience.position", "experience.company"})
+            for line, hits in zip(lines, line_hits):
+                line = line.strip()
+                if not line:
+                    continue
+                    
+                # Identify experience entries using position and company indicators
+                if hits:
+                    if current_section:
+                        experience_sections.append(' '.join(current_section))
+                    current_section = [line]
+                    continue
+                    
                 current_section.append(line)
-        
-        # Add final section
-        if current_section:
-            experience_sections.append(' '.join(current_section))
+            
+            # Add final entry of the section
+            if current_section:
+                experience_sections.append(' '.join(current_section))
         
         # Clean and format sections
         cleaned_sections = []
         for section in experience_sections:
             cleaned = ' '.join(section.split())
-            cleaned = re.sub(r'---\s*Paragraph\s*\d+\s*---', '', cleaned)
+            cleaned = _PARAGRAPH_MARKER_RE.sub('', cleaned)
             if cleaned:
                 cleaned_sections.append(cleaned)
         
-        return cleaned_sections if cleaned_sections else ["No experience found"]
+        return cleaned_sections
 
-    def extract_education(self):
+    @cached_property
+    def education(self):
         """Extract education information with improved pattern matching"""
         education = {
             "total_institutions": 0,
@@ -212,104 +337,113 @@ class ResumeInfoExtractor:
             "entries": []
         }
         
-        # Get education section text
-        edu_text = self._get_education_section()
-        if not edu_text:
+        # Lines of the education section(s), with the institutions each one names
+        paragraphs = []
+        paragraph_institutions = []
+        for span in self.sections.spans_of("education"):
+            lines, line_hits = self._span_lines(span, {"education.institution"})
+            for line, hits in zip(lines, line_hits):
+                if line.strip():
+                    paragraphs.append(line.strip())
+                    paragraph_institutions.append([hit.value for hit in hits])
+        if not paragraphs:
             return education
 
         # Track processed institutions to avoid duplicates
         processed = {}
         
-        # Process each paragraph
-        paragraphs = [p.strip() for p in edu_text.split('\n') if p.strip()]
-        
         # Process each paragraph with a 2-paragraph lookahead for context
         for i in range(len(paragraphs)):
             context = ' '.join(paragraphs[i:i+3])
+            found = {v for names in paragraph_institutions[i:i+3] for v in names}
             
-            for level, level_data in self.education_keywords["education_levels"].items():
-                for inst_name, inst_data in level_data["institutions"].items():
-                    if self._matches_institution(context, inst_data["keywords"]):
-                        if inst_name in processed:
-                            continue
-                        entry = {
-                            "institution": inst_data["name"],
-                            "type": inst_data["type"],
-                            "category": level,
-                            "degree": self._match_degree(context, inst_data["degrees"]),
-                            "period": self._match_date(context)
-                        }
-                        processed[inst_name] = entry
-                        if inst_data["name"] not in education["institutions"]:
-                            education["institutions"].append(inst_data["name"])
+            # Candidates are visited in the order of the keywords file
+            for level, inst_name, inst_data in self._institution_order:
+                if (level, inst_name) not in found or inst_name in processed:
+                    continue
+                entry = {
+                    "institution": inst_data["name"],
+                    "type": inst_data["type"],
+                    "category": level,
+                    "degree": self._match_degree(context, inst_data["degrees"]),
+                    "period": self._match_date(context)
+                }
+                processed[inst_name] = entry
+                if inst_data["name"] not in education["institutions"]:
+                    education["institutions"].append(inst_data["name"])
 
         
         education["entries"] = list(processed.values())
         education["total_institutions"] = len(education["institutions"])
         return education
 
-    def _get_education_section(self):
-        """Extract education section text"""
-        text = ' '.join(self.paragraphs)
-        start_idx = -1
-        
-        # Find start marker
-        for marker in self.education_keywords["section_markers"]["start"]:
-            idx = text.lower().find(marker.lower())
-            if idx != -1 and (start_idx == -1 or idx < start_idx):
-                start_idx = idx
-        
-        if start_idx == -1:
-            return None
-        
-        # Find end marker
-        end_idx = len(text)
-        for marker in self.education_keywords["section_markers"]["end"]:
-            idx = text.lower().find(marker.lower(), start_idx)
-            if idx != -1 and idx < end_idx:
-                end_idx = idx
-        
-        return text[start_idx:end_idx].strip()
-
-    def _matches_institution(self, text, keywords):
-        """Check if text matches institution keywords"""
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in keywords)
-
     def _match_degree(self, text, degrees):
         """Match degree from text using degree keywords"""
-        text_lower = text.lower()
+        text_folded = fold_text(text)
         for degree in degrees:
-            if all(keyword.lower() in text_lower for keyword in degree["keywords"]):
+            if all(fold_text(keyword) in text_folded for keyword in degree["keywords"]):
                 return degree["name"]
         return None
 
     def _match_date(self, text):
         """Extract date or date range from text"""
-        patterns = [
-            r'\b(19|20)\d{2}\s*[-to]{1,3}\s*(19|20)\d{2}\b',  # 2010-2014 or 2010 to 2014
-            r'\b(19|20)\d{2}\b',                              # Single year
-            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*(19|20)\d{2}',  # Month Year
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return match.group()
-        return None
+        return match_date(text)
+
+    # Result key -> cached property computing it
+    FIELDS = {
+        "Name": "name",
+        "Email": "emails",
+        "Phone": "phone_numbers",
+        "Skills": "skills",
+        "Experience": "experience",
+        "Education": "education"
+    }
+
+    def _field(self, field):
+        """Copy of a cached field, so callers may modify what they get"""
+        return copy.deepcopy(getattr(self, self.FIELDS[field]))
+
+    def extract_name(self):
+        return self._field("Name")
+
+    def extract_emails(self):
+        return self._field("Email")
 
-    def extract_all(self):
-        """Extract all information from the resume"""
+    def extract_phone_numbers(self):
+        return self._field("Phone")
+
+    def extract_skills(self):
+        return self._field("Skills")
+
+    def extract_experience(self):
+        return self._field("Experience")
+
+    def extract_education(self):
+        return self._field("Education")
+
+    def extract_all(self, fields=None):
+        """Extract information from the resume.
+
+        `fields` limits the result to some keys of FIELDS; each field is computed
+        on first access and cached, so repeated calls do not recompute it. The
+        result holds copies that the caller is free to modify.
+        """
+        if fields is None:
+            fields = self.FIELDS
+        elif isinstance(fields, str):
+            fields = [fields]
+        unknown = [field for field in fields if field not in self.FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}; expected some of {', '.join(self.FIELDS)}")
         try:
-            results = {
-                "Name": self.extract_name(),
-                "Email": self.extract_emails(),
-                "Phone": self.extract_phone_numbers(),
-                "Skills": self.extract_skills(),
-                "Experience": self.extract_experience(),
-                "Education": self.extract_education()
-            }
-            print("Debug: Extraction complete")
+            results = {field: self._field(field) for field in fields}
+            if self.verbose:
+                print("Debug: Extraction complete")
             return results
         except Exception as e:
             print(f"Error in extract_all: {str(e)}")
             return None
+
+    def extract_resume(self, fields=None):
+        """extract_all() as a ParsedResume; fields that were not asked for stay None"""
+        return ParsedResume.from_fields(self.extract_all(fields=fields))
@@ -1,6 +1,7 @@
 from .ResumeInfoExtractor import ResumeInfoExtractor
 from .PDFTextExtractorPyMuPDF import PDFTextExtractorPyMuPDF
 from .PDFTextExtractorPdfMiner import PDFTextExtractorPdfMiner
+from .pdf_document import PDFDocumentHandle
 try:
     from .PyResParserExtractor import PyResParserExtractor
     HAS_PYRESPARSER = True
@@ -8,6 +9,6 @@ except ImportError:
     HAS_PYRESPARSER = False
     print("Warning: pyresparser not available. Install with: pip install pyresparser")
 
-__all__ = ['ResumeInfoExtractor', 'PDFTextExtractorPyMuPDF' , 'PDFTextExtractorPdfMiner']
+__all__ = ['ResumeInfoExtractor', 'PDFTextExtractorPyMuPDF' , 'PDFTextExtractorPdfMiner', 'PDFDocumentHandle']
 if HAS_PYRESPARSER:
     __all__.append('PyResParserExtractor')
\ No newline at end of file
@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : batch_scorer.py
+# @Software: Vscode
+# @Description: Vectorized CVScorer over a pool of parsed resumes, with a ranked top-K.
+
+import logging
+from dataclasses import dataclass
+from typing import Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+from .cv_scorer import CVScorer
+
+CATEGORIES = ("skills", "experience", "education")
+
+
+@dataclass(frozen=True)
+class FeatureMatrix:
+    """Criteria-independent features of N CVs, one row per CV.
+
+    Skills are stored sparsely: `skill_rows[i]` holds skill `skill_vocabulary[skill_cols[i]]`.
+    Required skills are matched by substring, so the vocabulary is kept
+    whole and tested against the criteria once per distinct skill.
+    """
+    skill_vocabulary: Tuple[str, ...]
+    skill_rows: "np.ndarray"
+    skill_cols: "np.ndarray"
+    experience_texts: Tuple[str, ...]
+    has_experience: "np.ndarray"
+    years: "np.ndarray"
+    positions: "np.ndarray"
+    education_points: "np.ndarray"
+    education_max: "np.ndarray"
+
+    def __len__(self):
+        return len(self.experience_texts)
+
+    @classmethod
+    def from_features(cls, features):
+        """Stack CVFeatures (see CVScorer.extract_features)"""
+        features = list(features)
+        vocabulary = {}
+        rows, cols = [], []
+        for row, feature in enumerate(features):
+            for skill in dict.fromkeys(feature.skills):
+                rows.append(row)
+                cols.append(vocabulary.setdefault(skill, len(vocabulary)))
+        count = len(features)
+        return cls(
+            skill_vocabulary=tuple(vocabulary),
+            skill_rows=np.asarray(rows, dtype=np.intp),
+            skill_cols=np.asarray(cols, dtype=np.intp),
+            experience_texts=tuple(f.experience_text for f in features),
+            has_experience=np.fromiter((f.has_experience for f in features), dtype=bool, count=count),
+            years=np.fromiter((f.years for f in features), dtype=np.float64, count=count),
+            positions=np.fromiter((f.positions for f in features), dtype=np.float64, count=count),
+            education_points=np.fromiter((f.education_points for f in features), dtype=np.float64, count=count),
+            education_max=np.fromiter((f.education_max for f in features), dtype=np.float64, count=count)
+        )
+
+
+def round2(values):
+    """round(x, 2) of every element, as CVScorer rounds.
+
+    np.round scales by 100 and rounds half to even, which is off by 0.01
+    from Python's round on some values.
+    """
+    return np.array([round(v, 2) for v in values.ravel().tolist()]).reshape(values.shape)
+
+
+def skill_hits(matrix, required):
+    """N x R bitmap: CV has a skill containing required skill r"""
+    required = [skill.lower() for skill in required]
+    hits = np.zeros((len(matrix), len(required)), dtype=bool)
+    if not required or not matrix.skill_vocabulary:
+        return hits
+    # V x R membership, one substring test per distinct skill
+    member = np.array([[r in skill for r in required] for skill in matrix.skill_vocabulary], dtype=bool)
+    np.logical_or.at(hits, matrix.skill_rows, member[matrix.skill_cols])
+    return hits
+
+
+def keyword_hits(matrix, keywords):
+    """N x K bitmap: experience text contains keyword k"""
+    keywords = [keyword.lower() for keyword in keywords]
+    hits = np.zeros((len(matrix), len(keywords)), dtype=bool)
+    for col, keyword in enumerate(keywords):
+        hits[:, col] = np.fromiter((keyword in text for text in matrix.experience_texts),
+                                   dtype=bool, count=len(matrix))
+    return hits
+
+
+def experience_base_scores(matrix):
+    """Criteria-independent experience parts: 0.4 x year score and 0.2 x position score"""
+    year_score = np.minimum(100, matrix.years / 5 * 100)
+    position_score = np.minimum(100, matrix.positions * 25)
+    return year_score * 0.4, position_score * 0.2
+
+
+def education_scores(matrix):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        education = np.minimum(100, matrix.education_points / matrix.education_max * 100)
+    return np.where(matrix.education_max > 0, round2(education), 0)
+
+
+class BatchScorer:
+    """Scores many CVs at once under one set of criteria.
+
+    Produces the same category and total scores as CVScorer.score_cv, but
+    each formula runs once over arrays of N CVs instead of N times in Python.
+    Only the substring tests (a required skill against each distinct skill,
+    an experience keyword against each text) stay per item.
+    Without NumPy it falls back to score_cv row by row.
+    """
+
+    def __init__(self, custom_criteria=None, scorer=None):
+        self.logger = logging.getLogger(__name__)
+        self.scorer = scorer or CVScorer(custom_criteria)
+
+    @property
+    def criteria(self):
+        return self.scorer.criteria
+
+    def build_matrix(self, cvs):
+        """FeatureMatrix of ParsedResumes or parser result dicts"""
+        return FeatureMatrix.from_features(self.scorer.extract_features(cv) for cv in cvs)
+
+    def category_scores(self, matrix):
+        """Category scores as arrays of length N, rounded where CVScorer rounds them"""
+        hits = skill_hits(matrix, self.criteria["skills"]["required"])
+        skills = np.zeros(len(matrix))
+        if hits.shape[1]:
+            skills = np.minimum(100, hits.sum(axis=1) / hits.shape[1] * 100)
+
+        hits = keyword_hits(matrix, self.criteria["experience"]["relevant_keywords"])
+        keyword_score = np.zeros(len(matrix))
+        if hits.shape[1]:
+            keyword_score = hits.sum(axis=1) / hits.shape[1] * 100
+        year_part, position_part = experience_base_scores(matrix)
+        experience = year_part + keyword_score * 0.4 + position_part
+        experience = np.where(matrix.has_experience, round2(experience), 0)
+
+        return {"skills": skills, "experience": experience, "education": education_scores(matrix)}
+
+    def total_scores(self, matrix, scores=None):
+        """Weighted totals, rounded like CVScore.total_score"""
+        scores = scores if scores is not None else self.category_scores(matrix)
+        weights = self.scorer.weights
+        total = np.zeros(len(matrix))
+        for category in CATEGORIES:
+            total = total + scores[category] * weights[category]
+        return round2(total)
+
+    def rank(self, matrix, k=10):
+        """(row, total score) of the k best CVs, best first; ties keep input order"""
+        totals = self.total_scores(matrix)
+        k = min(k, len(totals))
+        if k <= 0:
+            return []
+        # Partition only finds the k-th best score; rows tied with it are
+        # taken in input order so the ranking does not depend on the pivot
+        cutoff = -np.partition(-totals, k - 1)[k - 1]
+        above = np.flatnonzero(totals > cutoff)
+        top = np.concatenate((above, np.flatnonzero(totals == cutoff)[:k - len(above)]))
+        top = top[np.lexsort((top, -totals[top]))]
+        return [(int(row), float(totals[row])) for row in top]
+
+    def top_k(self, cvs, k=10):
+        """(index, CVScore) of the k best CVs, best first"""
+        cvs = list(cvs)
+        if not HAS_NUMPY:
+            scored = [(index, self.scorer.score_cv(cv)) for index, cv in enumerate(cvs)]
+            scored.sort(key=lambda item: -item[1].total_score)
+            return scored[:k]
+        features = [self.scorer.extract_features(cv) for cv in cvs]
+        ranked = self.rank(FeatureMatrix.from_features(features), k)
+        # Full details only for the winners
+        return [(row, self.scorer.score_features(features[row])) for row, _ in ranked]
+
+    def rescore(self, store, k=10):
+        """(digest, source, CVScore) of the k best CVs of a FeatureStore, without re-parsing"""
+        digests, sources, features = store.load()
+        if not HAS_NUMPY:
+            scored = [(i, self.scorer.score_features(f)) for i, f in enumerate(features)]
+            scored.sort(key=lambda item: -item[1].total_score)
+            return [(digests[i], sources[i], score) for i, score in scored[:k]]
+        ranked = self.rank(FeatureMatrix.from_features(features), k)
+        return [(digests[row], sources[row], self.scorer.score_features(features[row])) for row, _ in ranked]
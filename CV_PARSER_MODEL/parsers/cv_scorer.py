@@ -1,8 +1,33 @@
-from pathlib import Path
-import json
 import logging
-import re
-from datetime import datetime
+from dataclasses import dataclass
+from typing import Tuple
+
+from utilis.asset_registry import AssetRegistry
+from utilis.result_models import CVScore, ExperienceMetrics, ParsedResume
+from .experience_timeline import experience_timeline
+
+# Job titles counted as distinct positions held
+POSITION_MARKERS = ("developer", "engineer", "designer", "analyst")
+# Institutions that earn the higher education bonus
+HIGHER_EDUCATION_MARKERS = ("esprit", "engineering", "university", "institute")
+DEFAULT_WEIGHTS = {
+    "skills": 0.4,
+    "experience": 0.35,
+    "education": 0.25
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CVFeatures:
+    """Everything the scorer reads from a CV; independent of the scoring criteria"""
+    skills: Tuple[str, ...] = ()          # lowercased
+    experience_text: str = ""             # lowercased entries joined by spaces
+    has_experience: bool = False
+    years: int = 0
+    positions: int = 0
+    education_points: float = 0.0
+    education_max: float = 0.0
+
 
 class CVScorer:
     """CV scoring system with configurable criteria"""
@@ -15,16 +40,12 @@ class CVScorer:
             self.criteria.update(custom_criteria)
     
     def _load_default_criteria(self):
-        """Load default scoring criteria from JSON file"""
-        try:
-            criteria_file = Path(__file__).parent.parent / 'assets' / 'scoring_criteria.json'
-            with open(criteria_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Error loading default criteria: {e}")
-            return self._get_fallback_criteria()
+        """Default scoring criteria, shared through the asset registry"""
+        # Shallow copy: custom criteria replace top-level sections only
+        return dict(_registry.get("scoring_criteria"))
     
-    def _get_fallback_criteria(self):
+    @staticmethod
+    def _get_fallback_criteria():
         """Fallback scoring criteria if JSON file is not available"""
         return {
             "skills": {
@@ -53,57 +74,74 @@ class CVScorer:
         }
     
     def score_cv(self, cv_data):
-        """Score a CV with detailed metrics"""
+        """Score a CV (ParsedResume or parser result dict) with detailed metrics"""
         try:
-            experience_results = self._score_experience(cv_data.get("Experience", []))
-            skills_score = self._score_skills(cv_data.get("Skills", []))
-            education_score = self._score_education(cv_data.get("Education", []))
-            
-            scores = {
-                "skills": skills_score,
-                "experience": experience_results["score"],
-                "education": education_score
-            }
-            
-            # Calculate weighted total
-            weights = self.criteria.get("weights", {
-                "skills": 0.4,
-                "experience": 0.35,
-                "education": 0.25
-            })
-            total_score = sum(scores[cat] * weights[cat] for cat in scores)
-            
-            return {
-                "total_score": round(total_score, 2),
-                "detailed_scores": {k: round(v, 2) for k, v in scores.items()},
-                "experience_metrics": {
-                    "years": experience_results["years"],
-                    "positions": experience_results["positions"],
-                    "details": experience_results["details"]
-                },
-                "feedback": self._generate_feedback(scores)
-            }
-            
+            return self.score_features(self.extract_features(cv_data))
         except Exception as e:
             self.logger.error(f"Error in CV scoring: {str(e)}")
-            return {
-                "total_score": 0,
-                "detailed_scores": {},
-                "experience_metrics": {
-                    "years": 0,
-                    "positions": 0,
-                    "details": f"Error: {str(e)}"
-                },
-                "feedback": ["Error occurred during scoring"]
-            }
+            return CVScore(
+                experience_metrics=ExperienceMetrics(details=f"Error: {str(e)}"),
+                feedback=("Error occurred during scoring",)
+            )
+
+    def extract_features(self, cv_data):
+        """Criteria-independent scoring features of a CV (ParsedResume or parser result dict)"""
+        if isinstance(cv_data, ParsedResume):
+            experience = cv_data.experience or ()
+            skills = cv_data.skills or ()
+            education = cv_data.education.to_dict() if cv_data.education else []
+        else:
+            experience = cv_data.get("Experience", [])
+            skills = cv_data.get("Skills", [])
+            education = cv_data.get("Education", [])
+
+        # Join experience entries into single text
+        experience_text = ' '.join(str(exp) for exp in experience).lower() if experience else ""
+        education_points, education_max = self._education_points(education)
+        return CVFeatures(
+            skills=tuple(s.lower() for s in skills or ()),
+            experience_text=experience_text,
+            has_experience=bool(experience),
+            years=self._extract_years_of_experience(experience) if experience else 0,
+            positions=sum(1 for marker in POSITION_MARKERS if marker in experience_text),
+            education_points=education_points,
+            education_max=education_max
+        )
+
+    @property
+    def weights(self):
+        return self.criteria.get("weights", DEFAULT_WEIGHTS)
+
+    def score_features(self, features):
+        """Score extracted features under the current criteria"""
+        experience_results = self._score_experience(features)
+        scores = {
+            "skills": self._score_skills(features.skills),
+            "experience": experience_results["score"],
+            "education": self._score_education(features)
+        }
+        
+        # Calculate weighted total
+        weights = self.weights
+        total_score = sum(scores[cat] * weights[cat] for cat in scores)
+        
+        return CVScore(
+            total_score=round(total_score, 2),
+            detailed_scores={k: round(v, 2) for k, v in scores.items()},
+            experience_metrics=ExperienceMetrics(
+                years=experience_results["years"],
+                positions=experience_results["positions"],
+                details=experience_results["details"]
+            ),
+            feedback=tuple(self._generate_feedback(scores))
+        )
 
-    def _score_skills(self, skills):
+    def _score_skills(self, skills_lower):
         """Score skills section"""
-        if not skills:
+        if not skills_lower:
             return 0
         
         try:
-            skills_lower = [s.lower() for s in skills]
             required_skills = self.criteria["skills"]["required"]
             
             # Count matching required skills
@@ -119,54 +157,17 @@ class CVScorer:
             self.logger.error(f"Error scoring skills: {str(e)}")
             return 0
 
-    def _extract_years_of_experience(self, experience_text):
-        """Extract total years of experience from text"""
-        total_years = 0
+    def _extract_years_of_experience(self, experience):
+        """Years of merged experience tenure (overlapping jobs count once)"""
         try:
-            # Pattern for date ranges like "2020 - 2023" or "2020-present"
-            date_pattern = r'(\d{4})\s*[-–—]\s*((?:\d{4})|(?:present|current|now))'
-            
-            # Find all date ranges
-            matches = re.finditer(date_pattern, experience_text.lower())
-            
-            current_year = datetime.now().year
-            
-            for match in matches:
-                start_year = int(match.group(1))
-                end_str = match.group(2)
-                
-                # Handle 'present' or current year
-                if end_str in ['present', 'current', 'now']:
-                    end_year = current_year
-                else:
-                    end_year = int(end_str)
-                
-                # Add years from this position
-                if start_year <= end_year:
-                    total_years += end_year - start_year
-            
-            # Also look for explicit mentions of experience
-            year_patterns = [
-                r'(\d+)\+?\s*years? of experience',
-                r'(\d+)\+?\s*years? in',
-                r'experienced (\d+)\+?\s*years?'
-            ]
-            
-            for pattern in year_patterns:
-                matches = re.finditer(pattern, experience_text.lower())
-                for match in matches:
-                    years = int(match.group(1))
-                    total_years = max(total_years, years)
-            
-            return total_years
-            
+            return experience_timeline(experience).total_years
         except Exception as e:
             self.logger.error(f"Error extracting years of experience: {str(e)}")
             return 0
 
-    def _score_experience(self, experience):
+    def _score_experience(self, features):
         """Score experience section with detailed metrics"""
-        if not experience:
+        if not features.has_experience:
             return {
                 "score": 0,
                 "years": 0,
@@ -175,15 +176,9 @@ class CVScorer:
             }
             
         try:
-            # Join experience entries into single text
-            text = ' '.join(str(exp) for exp in experience).lower()
-            
-            # Extract years of experience
-            total_years = self._extract_years_of_experience(text)
-            
-            # Count different positions
-            position_markers = ["developer", "engineer", "designer", "analyst"]
-            positions = sum(1 for marker in position_markers if marker in text.lower())
+            text = features.experience_text
+            total_years = features.years
+            positions = features.positions
             
             # Score based on years (40%)
             year_score = min(100, (total_years / 5) * 100)
@@ -215,10 +210,11 @@ class CVScorer:
                 "details": f"Error: {str(e)}"
             }
 
-    def _score_education(self, education):
-        """Improved scoring for education section"""
+    @staticmethod
+    def _education_points(education):
+        """(points, max points) over the education entries"""
         if not education:
-            return 0
+            return 0.0, 0.0
 
         # If education is a dict with 'entries', use that
         if isinstance(education, dict) and "entries" in education:
@@ -226,13 +222,10 @@ class CVScorer:
         else:
             entries = education
 
-        if not entries:
-            return 0
-
         total_points = 0
         max_points = 0
 
-        for entry in entries:
+        for entry in entries or []:
             entry_points = 0
             entry_max = 3  # institution, degree, period
 
@@ -252,15 +245,21 @@ class CVScorer:
 
             # Bonus: Higher education (engineering/university)
             inst = entry.get("institution", "").lower()
-            if any(x in inst for x in ["esprit", "engineering", "university", "institute"]):
+            if any(x in inst for x in HIGHER_EDUCATION_MARKERS):
                 entry_points += 0.5
                 entry_max += 0.5
 
             total_points += entry_points
             max_points += entry_max
 
+        return float(total_points), float(max_points)
+
+    def _score_education(self, features):
+        """Improved scoring for education section"""
         # Normalize to 100
-        score = (total_points / max_points) * 100 if max_points else 0
+        if not features.education_max:
+            return 0
+        score = (features.education_points / features.education_max) * 100
         return round(min(100, score), 2)
 
     def _generate_feedback(self, scores):
@@ -275,4 +274,9 @@ class CVScorer:
             else:
                 feedback.append(f"{category.title()}: Excellent")
         
-        return feedback
\ No newline at end of file
+        return feedback
+
+
+_registry = AssetRegistry.get_registry()
+_registry.register("scoring_criteria", "scoring_criteria.json",
+                   fallbacks=[CVScorer._get_fallback_criteria])
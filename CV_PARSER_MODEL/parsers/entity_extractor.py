@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : entity_extractor.py
+# @Software: Vscode
+# @Description: Warm, process-wide spaCy NER for the name and organizations of a resume header.
+
+import logging
+import os
+import threading
+from typing import NamedTuple, Tuple
+
+try:
+    import spacy
+    HAS_SPACY = True
+except ImportError:
+    HAS_SPACY = False
+
+SPACY_MODEL = os.environ.get("CV_SPACY_MODEL", "en_core_web_sm")
+# Set CV_NER=0 to keep the first-line name heuristic even when spaCy is installed
+NER_ENABLED = HAS_SPACY and os.environ.get("CV_NER", "1") == "1"
+
+# Only the entity recognizer (and the tok2vec layer it listens to) is used
+_UNUSED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer", "morphologizer", "senter", "textcat"]
+NAME_MAX_WORDS = 4
+
+
+class HeaderEntities(NamedTuple):
+    name: str = ""
+    organizations: Tuple[str, ...] = ()
+
+
+def _clean_name(text):
+    """A PERSON entity that can be a full name, or an empty string"""
+    name = " ".join(text.split())
+    if not name or any(c.isdigit() or c == "@" for c in name) or len(name.split()) > NAME_MAX_WORDS:
+        return ""
+    return name
+
+
+class HeaderEntityExtractor:
+    """Runs spaCy NER over resume header sections.
+
+    The model is loaded once per process (each worker of a pool loads its own
+    copy, see get_extractor) with every component but NER excluded. When
+    spaCy or the model is missing, `available` is False and extract() returns
+    empty entities.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, model=SPACY_MODEL):
+        self.logger = logging.getLogger(__name__)
+        self.model = model
+        self.nlp = None
+        if not HAS_SPACY:
+            return
+        try:
+            self.nlp = spacy.load(model, exclude=_UNUSED_COMPONENTS)
+            self.logger.info(f"Loaded spaCy model {model} with pipes {self.nlp.pipe_names}")
+        except OSError as e:
+            self.logger.error(f"Could not load spaCy model {model}: {e}")
+
+    @classmethod
+    def get_extractor(cls):
+        """Get or create the process-wide instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = HeaderEntityExtractor()
+        return cls._instance
+
+    @property
+    def available(self):
+        return self.nlp is not None
+
+    @staticmethod
+    def _entities(doc):
+        name = ""
+        organizations = []
+        for ent in doc.ents:
+            if ent.label_ == "PERSON" and not name:
+                name = _clean_name(ent.text)
+            elif ent.label_ == "ORG":
+                organizations.append(" ".join(ent.text.split()))
+        return HeaderEntities(name, tuple(dict.fromkeys(organizations)))
+
+    def extract(self, header_text):
+        """Name and organizations of one header section"""
+        if not self.available or not header_text.strip():
+            return HeaderEntities()
+        return self._entities(self.nlp(header_text))
+
+    def extract_batch(self, header_texts, batch_size=64):
+        """extract() over many headers with nlp.pipe, in input order"""
+        header_texts = list(header_texts)
+        if not self.available:
+            return [HeaderEntities() for _ in header_texts]
+        return [self._entities(doc) for doc in self.nlp.pipe(header_texts, batch_size=batch_size)]
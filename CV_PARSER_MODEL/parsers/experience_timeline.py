@@ -0,0 +1,196 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : experience_timeline.py
+# @Software: Vscode
+# @Description: Month-precision experience intervals, merged into total tenure, gaps and role durations.
+
+import re
+from datetime import date
+from functools import cached_property, lru_cache
+from typing import NamedTuple, Tuple
+
+from .patterns import YEARS_MENTION_RES
+from .text_normalizer import fold_text
+
+# English and French month names and abbreviations, accent folded
+MONTHS = {
+    "january": 1, "janvier": 1, "janv": 1, "jan": 1,
+    "february": 2, "fevrier": 2, "fevr": 2, "fev": 2, "feb": 2,
+    "march": 3, "mars": 3, "mar": 3,
+    "april": 4, "avril": 4, "avr": 4, "apr": 4,
+    "may": 5, "mai": 5,
+    "june": 6, "juin": 6, "jun": 6,
+    "july": 7, "juillet": 7, "juil": 7, "jul": 7,
+    "august": 8, "aout": 8, "aug": 8,
+    "september": 9, "septembre": 9, "sept": 9, "sep": 9,
+    "october": 10, "octobre": 10, "oct": 10,
+    "november": 11, "novembre": 11, "nov": 11,
+    "december": 12, "decembre": 12, "dec": 12,
+}
+_MONTH_NAMES = "|".join(sorted(MONTHS, key=len, reverse=True))
+
+
+def _point(prefix):
+    """A month-name, MM/YYYY or bare year date, groups named after `prefix`"""
+    return (rf"(?:(?<![a-z])(?P<{prefix}_month>{_MONTH_NAMES})\.?\s*"
+            rf"|(?<!\d)(?P<{prefix}_num>0?[1-9]|1[0-2])\s*[/.-]\s*)?"
+            rf"(?<!\d)(?P<{prefix}_year>(?:19|20)\d{{2}})(?!\d)")
+
+
+_OPEN_END = r"(?P<open>present|current|now|today|aujourd['’]hui|actuellement|actuel|en cours|ce jour)"
+# "Jan 2021 - present", "03/2019 to 05/2021", "janvier 2019 à mars 2021", "depuis 2020"
+DATE_INTERVAL_RE = re.compile(
+    rf"(?:(?:since|depuis)\s+{_point('since')})"
+    rf"|(?:{_point('start')}\s*(?:[-–—]+|\s(?:to|until|a|au|jusqu['’]?au?)\s)\s*"
+    rf"(?:{_point('end')}|{_OPEN_END}))"
+)
+
+
+class Interval(NamedTuple):
+    """Half-open month range [start, end) in months since year 0"""
+    start: int
+    end: int
+
+    @property
+    def months(self):
+        return self.end - self.start
+
+
+class RoleDuration(NamedTuple):
+    entry: int          # index in the experience entries
+    title: str
+    months: int
+
+
+def month_ordinal(year, month=1):
+    return year * 12 + month - 1
+
+
+def format_month(ordinal):
+    return f"{ordinal // 12:04d}-{ordinal % 12 + 1:02d}"
+
+
+def _start(match, prefix):
+    year = int(match.group(f"{prefix}_year"))
+    if match.group(f"{prefix}_month"):
+        return month_ordinal(year, MONTHS[match.group(f"{prefix}_month")])
+    if match.group(f"{prefix}_num"):
+        return month_ordinal(year, int(match.group(f"{prefix}_num")))
+    return month_ordinal(year)
+
+
+def parse_intervals(text, current):
+    """Intervals of the date ranges of one entry; `current` is this month's ordinal.
+
+    An open-ended range runs through the current month. A named end month
+    is included; a bare end year stops at its January, so "2018 - 2020"
+    still counts two years as the year ranges always did.
+    """
+    intervals = []
+    for match in DATE_INTERVAL_RE.finditer(fold_text(text)):
+        if match.group("since_year"):
+            start, end = _start(match, "since"), current + 1
+        else:
+            start = _start(match, "start")
+            if match.group("open"):
+                end = current + 1
+            elif match.group("end_month") or match.group("end_num"):
+                end = _start(match, "end") + 1
+            else:
+                end = month_ordinal(int(match.group("end_year")))
+        if start < end:
+            intervals.append(Interval(start, end))
+    return intervals
+
+
+def merge_intervals(intervals):
+    """Sort-and-sweep union of intervals; touching intervals are joined"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1].end:
+            if end > merged[-1].end:
+                merged[-1] = Interval(merged[-1].start, end)
+        else:
+            merged.append(Interval(start, end))
+    return merged
+
+
+class ExperienceTimeline:
+    """Dated view of a resume's experience entries.
+
+    Each entry is parsed once into month intervals. Overlapping jobs are
+    merged before tenure is counted, so two concurrent roles are not
+    double-counted. Derived values are computed on first access and kept.
+    Build through experience_timeline(), which shares one timeline between
+    the scorer and the parse results of the same entries.
+    """
+
+    def __init__(self, entries, current=None):
+        self.entries = tuple(entries)
+        if current is None:
+            today = date.today()
+            current = month_ordinal(today.year, today.month)
+        self.current = current
+        self.role_intervals = tuple(tuple(parse_intervals(entry, current)) for entry in self.entries)
+
+    @cached_property
+    def intervals(self) -> Tuple[Interval, ...]:
+        """Merged intervals, oldest first"""
+        return tuple(merge_intervals(i for role in self.role_intervals for i in role))
+
+    @cached_property
+    def total_months(self) -> int:
+        return sum(interval.months for interval in self.intervals)
+
+    @cached_property
+    def gaps(self) -> Tuple[Interval, ...]:
+        """Months between consecutive merged intervals"""
+        return tuple(Interval(a.end, b.start) for a, b in zip(self.intervals, self.intervals[1:]))
+
+    @cached_property
+    def gap_months(self) -> int:
+        return sum(gap.months for gap in self.gaps)
+
+    @cached_property
+    def roles(self) -> Tuple[RoleDuration, ...]:
+        """Duration of every dated entry, its own overlaps merged"""
+        return tuple(
+            RoleDuration(index, self.entries[index][:80], sum(i.months for i in merge_intervals(intervals)))
+            for index, intervals in enumerate(self.role_intervals) if intervals
+        )
+
+    @cached_property
+    def mentioned_years(self) -> int:
+        """Largest explicit "N years of experience" mention"""
+        text = fold_text(" ".join(self.entries))
+        return max((int(m.group(1)) for pattern in YEARS_MENTION_RES for m in pattern.finditer(text)), default=0)
+
+    @cached_property
+    def total_years(self) -> int:
+        """Whole years of merged tenure, or the explicit mention if higher"""
+        return max(self.total_months // 12, self.mentioned_years)
+
+    def to_dict(self):
+        return {
+            "total_months": self.total_months,
+            "total_years": self.total_years,
+            "gap_months": self.gap_months,
+            "intervals": [[format_month(i.start), format_month(i.end - 1)] for i in self.intervals],
+            "gaps": [[format_month(g.start), format_month(g.end - 1)] for g in self.gaps],
+            "roles": [{"entry": r.entry, "title": r.title, "months": r.months} for r in self.roles]
+        }
+
+
+@lru_cache(maxsize=1024)
+def _timeline(entries, current):
+    return ExperienceTimeline(entries, current)
+
+
+def experience_timeline(entries):
+    """Shared ExperienceTimeline of experience entries (a string or a sequence of strings)"""
+    if isinstance(entries, str):
+        entries = (entries,)
+    today = date.today()
+    return _timeline(tuple(str(entry) for entry in entries or ()), month_ordinal(today.year, today.month))
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : extraction_budget.py
+# @Software: Vscode
+# @Description: Page and section budget that ends PDF extraction early.
+
+from utilis.asset_registry import AssetRegistry
+from .patterns import EMAIL_RE, PHONE_RE
+
+SECTION_MARKERS = ("name", "contact", "experience", "education")
+
+
+def _compile_headers(experience_keywords, education_keywords):
+    experience = tuple(h.lower() for h in experience_keywords.get("section_headers", []))
+    education = tuple(h.lower() for h in education_keywords.get("section_headers", []))
+    return {"experience": experience, "education": education}
+
+
+_registry = AssetRegistry.get_registry()
+_registry.register("section_headers", ['experience_keywords.json', 'education_keywords.json'],
+                   _compile_headers, fallbacks=[dict, dict])
+
+
+def load_section_headers():
+    """Experience and education section headers, lowercased"""
+    return _registry.get("section_headers")
+
+
+class ExtractionBudget:
+    """Ends page-by-page extraction after max_pages, or once every section marker was seen.
+
+    Extractors call before_page() ahead of each page and observe() on every
+    paragraph, so pages past the budget are never parsed. The section stop is
+    checked at page boundaries: the page holding the last marker is kept whole.
+    """
+
+    def __init__(self, max_pages=None, stop_when_sections_found=False):
+        self.max_pages = max_pages if max_pages and max_pages > 0 else None
+        self.stop_when_sections_found = stop_when_sections_found
+        self.found = set()
+        self.pages_read = 0
+        self.stop_reason = None
+
+    def fresh(self):
+        """Unused copy with the same limits; a budget tracks one extraction run"""
+        return ExtractionBudget(self.max_pages, self.stop_when_sections_found)
+
+    @property
+    def enabled(self):
+        return bool(self.max_pages or self.stop_when_sections_found)
+
+    @property
+    def cache_suffix(self):
+        """Distinguishes budgeted extractor output from full output in the extraction cache"""
+        if not self.enabled:
+            return ""
+        suffix = f"-p{self.max_pages}" if self.max_pages else ""
+        return suffix + ("-s" if self.stop_when_sections_found else "")
+
+    def before_page(self, page_no):
+        """Return True when page `page_no` (1-based) should not be extracted"""
+        if self.stop_when_sections_found and page_no > 1 and self.found.issuperset(SECTION_MARKERS):
+            self.stop_reason = f"all sections found by page {page_no - 1}"
+            return True
+        if self.max_pages and page_no > self.max_pages:
+            self.stop_reason = f"page limit of {self.max_pages} reached"
+            return True
+        self.pages_read = page_no
+        return False
+
+    def observe(self, paragraph):
+        """Record which section markers a paragraph contains"""
+        if not self.stop_when_sections_found:
+            return
+        if "name" not in self.found:
+            if any(line.strip() and not any(c.isdigit() for c in line) for line in paragraph.splitlines()):
+                self.found.add("name")
+        if "contact" not in self.found and (EMAIL_RE.search(paragraph) or PHONE_RE.search(paragraph)):
+            self.found.add("contact")
+        lowered = paragraph.lower()
+        for section, headers in load_section_headers().items():
+            if section not in self.found and any(h in lowered for h in headers):
+                self.found.add(section)
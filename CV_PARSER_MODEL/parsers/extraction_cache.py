@@ -0,0 +1,110 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : extraction_cache.py
+# @Software: Vscode
+# @Description: Content-addressed on-disk cache of PDF extractor output.
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".app_cache" / "extraction"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ExtractionCache:
+    """Paragraph lists per engine, keyed by the SHA-256 of the PDF bytes.
+
+    Entries carry the extractor version and are dropped when it changes.
+    The least recently used entries (by mtime, refreshed on every hit) are
+    evicted once the cache grows past max_bytes.
+    """
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _entry_path(self, engine, digest):
+        return self.cache_dir / engine / f"{digest}.json"
+
+    def get(self, engine, version, digest):
+        """Return the cached paragraphs, or None on a miss or a stale entry"""
+        path = self._entry_path(engine, digest)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.warning(f"Dropping unreadable cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+        if entry.get("version") != version:
+            self._remove(path)
+            return None
+
+        try:
+            # Refresh recency for LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("paragraphs")
+
+    def put(self, engine, version, digest, paragraphs):
+        """Store paragraphs atomically, then evict old entries if over budget"""
+        path = self._entry_path(engine, digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {"engine": engine, "version": version, "paragraphs": list(paragraphs)}
+        try:
+            fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=path.parent)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.error(f"Failed to write cache entry {path}: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for engine_dir in self.cache_dir.iterdir():
+            if not engine_dir.is_dir():
+                continue
+            for entry in os.scandir(engine_dir):
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            self._remove(path)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        for engine_dir in self.cache_dir.iterdir():
+            if engine_dir.is_dir():
+                for entry in os.scandir(engine_dir):
+                    self._remove(entry.path)
@@ -0,0 +1,73 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : extraction_quality.py
+# @Software: Vscode
+# @Description: Cheap quality signals used to decide whether fast PyMuPDF output is good enough.
+
+import re
+
+from .extraction_budget import load_section_headers
+from .ResumeInfoExtractor import ResumeInfoExtractor
+from .section_index import HEADER_SECTION
+
+MIN_CHARS_PER_PAGE = 200
+MAX_BROKEN_WORD_RATIO = 0.15
+
+# Single letters that are real words or skills and must not count as broken
+_SINGLE_LETTER_WORDS = {"a", "i", "y", "à", "c", "r"}
+_WORD_RE = re.compile(r"[^\W\d_]+(?:-(?=\n))?")
+
+
+def empty_sections(paragraphs):
+    """Headings directly followed by another heading.
+
+    Columns read row by row instead of one after the other put the headings
+    that share a row next to each other, leaving the first section empty.
+    """
+    try:
+        sections = ResumeInfoExtractor(paragraphs, verbose=False, use_ner=False).sections
+    except ValueError:
+        return []
+    return [span.heading for span in sections.spans
+            if span.section != HEADER_SECTION and not sections.text[span.start:span.end].strip()]
+
+
+def assess_extraction_quality(paragraphs, page_count):
+    """Score extracted paragraphs; returns acceptable flag, failure reasons and metrics"""
+    text = "\n".join(paragraphs or [])
+    page_count = max(1, page_count or 1)
+
+    words = _WORD_RE.findall(text)
+    broken = sum(1 for w in words
+                  if w.endswith('-') or (len(w) == 1 and w.lower() not in _SINGLE_LETTER_WORDS))
+    broken_ratio = broken / len(words) if words else 1.0
+    chars_per_page = len(text) / page_count
+
+    text_lower = text.lower()
+    headers = load_section_headers()
+    sections_found = [h for h in sorted(set(headers["experience"] + headers["education"])) if h in text_lower]
+    empty = empty_sections(paragraphs) if paragraphs else []
+
+    reasons = []
+    if chars_per_page < MIN_CHARS_PER_PAGE:
+        reasons.append(f"only {chars_per_page:.0f} characters per page")
+    if broken_ratio > MAX_BROKEN_WORD_RATIO:
+        reasons.append(f"{broken_ratio:.0%} of words look broken")
+    if not sections_found:
+        reasons.append("no experience or education section header found")
+    if empty:
+        reasons.append(f"empty sections, columns look interleaved: {', '.join(empty)}")
+
+    return {
+        "acceptable": not reasons,
+        "reasons": reasons,
+        "metrics": {
+            "pages": page_count,
+            "chars_per_page": round(chars_per_page, 1),
+            "broken_word_ratio": round(broken_ratio, 3),
+            "sections_found": sections_found,
+            "empty_sections": empty
+        }
+    }
@@ -0,0 +1,114 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : feature_store.py
+# @Software: Vscode
+# @Description: SQLite store of per-CV scoring features, keyed by the SHA-256 of the PDF.
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from .cv_scorer import CVFeatures
+
+DEFAULT_STORE_PATH = Path(__file__).parent.parent / ".app_cache" / "features.sqlite3"
+# Bump when CVFeatures or the way it is extracted changes; older rows are ignored
+FEATURES_VERSION = 2
+
+_COLUMNS = ("skills", "experience_text", "has_experience", "years", "positions",
+            "education_points", "education_max")
+
+
+class FeatureStore:
+    """Scoring features of every scored CV, one row per PDF.
+
+    A row holds the CVFeatures of the custom parser's result, so the whole
+    corpus can be scored again under new criteria (see BatchScorer.rescore)
+    without extracting or parsing a single PDF. Re-scoring the same PDF
+    replaces its row. Years of experience are stored as computed at parse
+    time: open-ended ranges ("2021 - present") are not advanced afterwards.
+    """
+
+    def __init__(self, path=None):
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path) if path else DEFAULT_STORE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cv_features ("
+            " digest TEXT PRIMARY KEY,"
+            " source TEXT,"
+            " version INTEGER NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " skills TEXT NOT NULL,"
+            " experience_text TEXT NOT NULL,"
+            " has_experience INTEGER NOT NULL,"
+            " years INTEGER NOT NULL,"
+            " positions INTEGER NOT NULL,"
+            " education_points REAL NOT NULL,"
+            " education_max REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def put(self, digest, features, source=None):
+        """Store the features of the PDF with SHA-256 `digest`"""
+        row = (digest, str(source) if source else None, FEATURES_VERSION, time.time(),
+               json.dumps(list(features.skills), ensure_ascii=False), features.experience_text,
+               int(features.has_experience), features.years, features.positions,
+               features.education_points, features.education_max)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    f"INSERT OR REPLACE INTO cv_features (digest, source, version, updated_at, {', '.join(_COLUMNS)})"
+                    f" VALUES ({', '.join('?' * len(row))})", row)
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to store features for {digest[:12]}: {e}")
+
+    @staticmethod
+    def _features(row):
+        skills, experience_text, has_experience, years, positions, points, max_points = row
+        return CVFeatures(
+            skills=tuple(json.loads(skills)),
+            experience_text=experience_text,
+            has_experience=bool(has_experience),
+            years=years,
+            positions=positions,
+            education_points=points,
+            education_max=max_points
+        )
+
+    def get(self, digest):
+        """CVFeatures of one PDF, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM cv_features WHERE digest = ? AND version = ?",
+                (digest, FEATURES_VERSION)).fetchone()
+        return self._features(row) if row else None
+
+    def load(self):
+        """(digests, sources, features) of every current row, in insertion order"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT digest, source, {', '.join(_COLUMNS)} FROM cv_features"
+                " WHERE version = ? ORDER BY rowid", (FEATURES_VERSION,)).fetchall()
+        return ([row[0] for row in rows], [row[1] for row in rows],
+                [self._features(row[2:]) for row in rows])
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM cv_features WHERE version = ?",
+                                      (FEATURES_VERSION,)).fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cv_features")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : fuzzy_skill_matcher.py
+# @Software: Vscode
+# @Description: Typo-tolerant skill lookup through a trigram index and a bounded edit distance.
+
+import re
+from collections import Counter
+
+from .keyword_matcher import KeywordHit
+from .text_normalizer import fold_text
+
+# Shorter skills and tokens are only matched exactly: one edit turns
+# "react" into "reach"
+MIN_FUZZY_LENGTH = 6
+# Tokens of this length or more may be two edits away
+TWO_EDITS_LENGTH = 10
+MAX_CANDIDATES = 8
+TOKEN_CACHE_SIZE = 50000
+
+_TOKEN_RE = re.compile(r"[^\W\d_]+")
+
+
+def _trigrams(word):
+    padded = f"^{word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def bounded_edit_distance(a, b, max_distance):
+    """Edit distance with adjacent transpositions, or max_distance + 1 once it is exceeded"""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    previous_min = 0
+    for i, char_a in enumerate(a, start=1):
+        current = [i] + [0] * len(b)
+        row_min = i
+        for j, char_b in enumerate(b, start=1):
+            cost = 0 if char_a == char_b else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        # A transposition reaches back two rows, so both must be over the bound
+        if row_min > max_distance and previous_min > max_distance:
+            return max_distance + 1
+        previous2, previous, previous_min = previous, current, row_min
+    return min(previous[-1], max_distance + 1)
+
+
+class FuzzySkillMatcher:
+    """Maps misspelled tokens to vocabulary skills.
+
+    Single-word skills of MIN_FUZZY_LENGTH letters or more are indexed by
+    trigram. A token is compared, with a bounded edit distance, only against
+    the few skills sharing the most trigrams with it and the same first
+    letter. Token decisions are cached, so a word costs one lookup per process.
+    Two adjacent tokens are also tried joined ("java script").
+    """
+
+    def __init__(self, skill_keywords, exclusions=()):
+        self.vocabulary = set(skill_keywords)
+        self.exclusions = {fold_text(word) for word in exclusions}
+        self._index = {}
+        for skill in self.vocabulary:
+            if len(skill) >= MIN_FUZZY_LENGTH and skill.isalpha():
+                for gram in _trigrams(skill):
+                    self._index.setdefault(gram, []).append(skill)
+        self._cache = {}
+
+    def lookup(self, token):
+        """Vocabulary skill `token` is a misspelling of, or None"""
+        cached = self._cache.get(token, False)
+        if cached is not False:
+            return cached
+        match = self._lookup(token)
+        if len(self._cache) >= TOKEN_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[token] = match
+        return match
+
+    def _lookup(self, token):
+        if len(token) < MIN_FUZZY_LENGTH or token in self.vocabulary or token in self.exclusions:
+            return None
+        max_distance = 2 if len(token) >= TWO_EDITS_LENGTH else 1
+        shared = Counter()
+        for gram in _trigrams(token):
+            for skill in self._index.get(gram, ()):
+                if skill[0] == token[0] and abs(len(skill) - len(token)) <= max_distance:
+                    shared[skill] += 1
+        best, best_distance = None, max_distance + 1
+        for skill, _ in shared.most_common(MAX_CANDIDATES):
+            distance = bounded_edit_distance(token, skill, max_distance)
+            if distance < best_distance:
+                best, best_distance = skill, distance
+        return best
+
+    def scan(self, text):
+        """Fuzzy skill hits in folded `text`, spans in `text` coordinates"""
+        hits = []
+        previous = None
+        for match in _TOKEN_RE.finditer(text):
+            token = match.group()
+            skill = self.lookup(token)
+            if skill:
+                hits.append(KeywordHit(token, "skill.fuzzy", match.start(), match.end(), skill))
+            elif previous is not None and text[previous.end():match.start()].isspace():
+                joined = previous.group() + token
+                skill = joined if joined in self.vocabulary else self.lookup(joined)
+                if skill:
+                    hits.append(KeywordHit(joined, "skill.fuzzy", previous.start(), match.end(), skill))
+            previous = match
+        return hits
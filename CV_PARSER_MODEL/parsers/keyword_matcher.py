@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : keyword_matcher.py
+# @Software: Vscode
+# @Description: Aho-Corasick automaton matching every keyword asset in a single pass over the text.
+
+from collections import deque
+from typing import NamedTuple
+
+from .text_normalizer import fold_text
+
+
+class KeywordHit(NamedTuple):
+    keyword: str
+    category: str
+    start: int
+    end: int
+    value: object
+
+
+class KeywordMatcher:
+    """Multi-pattern matcher: cost grows with the text length, not with the vocabulary size.
+
+    Keywords are folded like NormalizedText (casefold, accents, ligatures), so
+    scan() expects the folded view of the text.
+    Whole-word keywords must not touch a letter, digit or underscore on either
+    side; the others match anywhere, like a plain `in` test.
+    """
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._outputs = [[]]
+        self._seen = set()
+        self._built = False
+
+    def add(self, keyword, category, whole_word=True, value=None):
+        keyword = fold_text(keyword).strip()
+        if not keyword or (keyword, category, value) in self._seen:
+            return
+        self._seen.add((keyword, category, value))
+
+        node = 0
+        for char in keyword:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            node = nxt
+        self._outputs[node].append((keyword, category, whole_word, keyword if value is None else value))
+        self._built = False
+
+    def build(self):
+        """Compute failure links breadth-first and merge outputs along them"""
+        queue = deque()
+        for nxt in self._goto[0].values():
+            self._fail[nxt] = 0
+            queue.append(nxt)
+        while queue:
+            node = queue.popleft()
+            for char, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._outputs[nxt] = self._outputs[nxt] + self._outputs[self._fail[nxt]]
+        self._built = True
+        return self
+
+    def scan(self, text, categories=None):
+        """Return every hit in `text`, ordered by end offset"""
+        if not self._built:
+            self.build()
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        hits = []
+        node = 0
+        length = len(text)
+        for i, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not outputs[node]:
+                continue
+            end = i + 1
+            for keyword, category, whole_word, value in outputs[node]:
+                if categories and category not in categories:
+                    continue
+                start = end - len(keyword)
+                if whole_word and (
+                        (start > 0 and _is_word_char(text[start - 1]))
+                        or (end < length and _is_word_char(text[end]))):
+                    continue
+                hits.append(KeywordHit(keyword, category, start, end, value))
+        return hits
+
+    def __len__(self):
+        return len(self._seen)
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+
+def drop_nested_hits(hits):
+    """Hits not lying inside a longer hit, in start order.
+
+    An alias or multi-word skill also contains shorter skills: "c" in
+    "c plus plus" or "c++", "js" in "node js", "java" in "java script".
+    """
+    kept = []
+    max_end = first_start = -1
+    for hit in sorted(hits, key=lambda h: (h.start, -h.end)):
+        # Earlier hits start no later; the one reaching furthest covers this
+        # hit unless it has the very same span
+        if max_end > hit.end or (max_end == hit.end and first_start < hit.start):
+            continue
+        kept.append(hit)
+        if hit.end > max_end:
+            max_end, first_start = hit.end, hit.start
+    return kept
+
+
+def build_resume_matcher(skill_keywords, experience_keywords, education_keywords, section_headers=None,
+                         skill_aliases=None):
+    """One automaton over the skills, experience, education and section header assets.
+
+    Skills, skill aliases and section headings are whole words, headings also
+    in the plural; experience and education indicators keep their substring
+    semantics. An alias hit's value is the skill it stands for. The keyword
+    files' own section headers come in through `section_headers`.
+    """
+    matcher = KeywordMatcher()
+    for skill, aliases in (skill_aliases or {}).items():
+        for alias in aliases:
+            matcher.add(alias, "skill", value=fold_text(skill))
+    for section, headers in (section_headers or {}).items():
+        for header in headers:
+            matcher.add(header, "section_header", value=section)
+            # "Experiences", "Expériences professionnelles"
+            if not header.endswith("s"):
+                matcher.add(header + "s", "section_header", value=section)
+    for skill in skill_keywords:
+        matcher.add(skill, "skill")
+
+    for indicator in experience_keywords.get("position_indicators", []):
+        matcher.add(indicator, "experience.position", whole_word=False)
+    for indicator in experience_keywords.get("company_indicators", []):
+        matcher.add(indicator, "experience.company", whole_word=False)
+
+    for level, level_data in education_keywords.get("education_levels", {}).items():
+        for inst_name, inst_data in level_data.get("institutions", {}).items():
+            for keyword in inst_data.get("keywords", []):
+                matcher.add(keyword, "education.institution", whole_word=False, value=(level, inst_name))
+    return matcher.build()
@@ -0,0 +1,217 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : layout_blocks.py
+# @Software: Vscode
+# @Description: Reading-order reconstruction for PyMuPDF "dict" output (columns, headings).
+
+from dataclasses import dataclass
+from statistics import median
+
+# Part of the "blocks" layout cache key; bump whenever the reading order changes
+LAYOUT_VERSION = "2"
+
+# Horizontal gap, in points, that separates two columns
+MIN_COLUMN_GAP = 12
+# Blocks wider than this share of the page are treated as spanning all columns
+FULL_WIDTH_RATIO = 0.6
+# A gap only splits columns when each side has this many blocks, running down
+# this share of the page's text height
+MIN_COLUMN_BLOCKS = 3
+MIN_COLUMN_HEIGHT_RATIO = 0.25
+# Share of a page's narrow blocks that may straddle a column gap
+MAX_BRIDGING_RATIO = 0.1
+# Blocks sharing this much of the smaller height sit on the same row
+ROW_OVERLAP_RATIO = 0.5
+HEADING_SIZE_RATIO = 1.2
+HEADING_MAX_WORDS = 6
+
+_BOLD_FLAG = 16  # PyMuPDF span flag bit 4
+
+
+@dataclass
+class TextBlock:
+    """One text block of a page, with the layout facts used to order and label it"""
+    page_no: int
+    bbox: tuple
+    text: str
+    font_size: float
+    bold: bool
+    column: int = 0           # -1 for blocks spanning several columns
+    is_heading: bool = False
+
+    @property
+    def x0(self):
+        return self.bbox[0]
+
+    @property
+    def y0(self):
+        return self.bbox[1]
+
+    @property
+    def x1(self):
+        return self.bbox[2]
+
+    @property
+    def y1(self):
+        return self.bbox[3]
+
+
+def _block_from_dict(block, page_no):
+    lines = []
+    sizes = []
+    bold_chars = 0
+    total_chars = 0
+    for line in block.get("lines", []):
+        text = "".join(span.get("text", "") for span in line.get("spans", []))
+        if text.strip():
+            lines.append(text.strip())
+        for span in line.get("spans", []):
+            n = len(span.get("text", "").strip())
+            if not n:
+                continue
+            sizes.append(span.get("size", 0))
+            total_chars += n
+            if span.get("flags", 0) & _BOLD_FLAG:
+                bold_chars += n
+    text = "\n".join(lines)
+    if not text:
+        return None
+    return TextBlock(
+        page_no=page_no,
+        bbox=tuple(block["bbox"]),
+        text=text,
+        font_size=max(sizes) if sizes else 0.0,
+        bold=total_chars > 0 and bold_chars * 2 >= total_chars,
+    )
+
+
+def _same_row(a, b):
+    overlap = min(a.y1, b.y1) - max(a.y0, b.y0)
+    return overlap > 0 and overlap >= ROW_OVERLAP_RATIO * min(a.y1 - a.y0, b.y1 - b.y0)
+
+
+def _is_column_split(left, right, text_height):
+    """Whether the blocks on either side of a gap form two columns.
+
+    Dates or locations right-aligned next to each role line also leave a gap,
+    but they are few, short, or one-line blocks on the same row as a block
+    across the gap.
+    """
+    for side in (left, right):
+        extent = max(b.y1 for b in side) - min(b.y0 for b in side)
+        if len(side) < MIN_COLUMN_BLOCKS or extent < MIN_COLUMN_HEIGHT_RATIO * text_height:
+            return False
+    smaller, other = (left, right) if len(left) <= len(right) else (right, left)
+    row_partners = sum(1 for b in smaller
+                       if "\n" not in b.text and any(_same_row(b, o) for o in other))
+    return row_partners * 2 < len(smaller)
+
+
+def _column_gaps(blocks):
+    """(lo, hi) x-intervals wider than MIN_COLUMN_GAP crossed by at most a few blocks.
+
+    A contact line or a wide heading may straddle the gap between a sidebar
+    and the main column; as long as most blocks keep clear of it, the gap is
+    still a column boundary and the straddling blocks span both columns.
+    """
+    edges = sorted({b.x0 for b in blocks} | {b.x1 for b in blocks})
+    max_bridging = int(len(blocks) * MAX_BRIDGING_RATIO)
+    gaps = []
+    start = None
+    for lo, hi in zip(edges, edges[1:]):
+        crossing = sum(1 for b in blocks if b.x0 <= lo and b.x1 >= hi)
+        if crossing <= max_bridging:
+            start = lo if start is None else start
+            continue
+        if start is not None and lo - start > MIN_COLUMN_GAP:
+            gaps.append((start, lo))
+        start = None
+    return gaps
+
+
+def _column_ranges(blocks, page_width):
+    """x-ranges of the columns of a page.
+
+    Narrow blocks are grouped between the gaps of _column_gaps; neighbouring
+    groups that fail _is_column_split are merged back into one column.
+    """
+    narrow = [b for b in blocks if (b.x1 - b.x0) < FULL_WIDTH_RATIO * page_width]
+    if not narrow:
+        return []
+    bounds = [min(b.x0 for b in narrow)] + [x for gap in _column_gaps(narrow) for x in gap] \
+        + [max(b.x1 for b in narrow)]
+    groups = []
+    for lo, hi in zip(bounds[::2], bounds[1::2]):
+        members = [b for b in narrow if b.x0 >= lo and b.x1 <= hi]
+        if members:
+            groups.append([min(b.x0 for b in members), max(b.x1 for b in members), members])
+    if len(groups) > 1:
+        text_height = max(b.y1 for b in blocks) - min(b.y0 for b in blocks)
+        i = 0
+        while i < len(groups) - 1:
+            left, right = groups[i], groups[i + 1]
+            if _is_column_split(left[2], right[2], text_height):
+                i += 1
+            else:
+                groups[i:i + 2] = [[min(left[0], right[0]), max(left[1], right[1]), left[2] + right[2]]]
+                # The merged group is checked again against the previous one
+                i = max(i - 1, 0)
+    return [[x0, x1] for x0, x1, _ in groups]
+
+
+def _assign_columns(blocks, page_width):
+    ranges = _column_ranges(blocks, page_width)
+    for block in blocks:
+        hits = [i for i, (x0, x1) in enumerate(ranges) if block.x0 < x1 and block.x1 > x0]
+        block.column = hits[0] if len(hits) == 1 else -1
+    # A single column layout has no spanning blocks
+    if len(ranges) <= 1:
+        for block in blocks:
+            block.column = 0
+    return len(ranges) or 1
+
+
+def _flag_headings(blocks):
+    sizes = [b.font_size for b in blocks if b.font_size]
+    body_size = median(sizes) if sizes else 0
+    for block in blocks:
+        words = block.text.split()
+        if not words or len(words) > HEADING_MAX_WORDS or "\n" in block.text:
+            continue
+        letters = [c for c in block.text if c.isalpha()]
+        is_upper = bool(letters) and all(c.isupper() for c in letters) and len(letters) > 2
+        larger = body_size and block.font_size >= body_size * HEADING_SIZE_RATIO
+        block.is_heading = bool(larger or block.bold or is_upper)
+
+
+def page_blocks_in_reading_order(page_dict, page_no):
+    """Text blocks of one page from page.get_text("dict"), in reading order.
+
+    Blocks that span several columns split the page into horizontal bands;
+    inside a band, columns are read left to right and each column top to bottom.
+    """
+    blocks = [b for b in (_block_from_dict(raw, page_no)
+                          for raw in page_dict.get("blocks", []) if raw.get("type", 0) == 0) if b]
+    if not blocks:
+        return []
+
+    page_width = page_dict.get("width") or max(b.x1 for b in blocks)
+    _assign_columns(blocks, page_width)
+    _flag_headings(blocks)
+
+    spanning = sorted((b for b in blocks if b.column == -1), key=lambda b: b.y0)
+    bands = [[] for _ in range(len(spanning) + 1)]
+    for block in blocks:
+        if block.column == -1:
+            continue
+        band = sum(1 for s in spanning if s.y0 <= block.y0)
+        bands[band].append(block)
+
+    ordered = []
+    for band_no, band in enumerate(bands):
+        if band_no > 0:
+            ordered.append(spanning[band_no - 1])
+        ordered.extend(sorted(band, key=lambda b: (b.column, b.y0, b.x0)))
+    return ordered
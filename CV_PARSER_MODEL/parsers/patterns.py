@@ -0,0 +1,87 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : patterns.py
+# @Software: Vscode
+# @Description: Precompiled contact and date patterns shared by the extractors and the scorer.
+
+import re
+
+EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# The three phone variants (international with optional country code,
+# "+XXX XXXXXXXX" and Tunisian "+216 XXXXXXXX") collapse into one pattern: the
+# last two are cases of the first. Only when a longer candidate fails
+# validation is the short form retried at the same position.
+PHONE_RE = re.compile(r"(?:\+\d{1,3}[-\s]?)?\d{8,12}")
+PHONE_SHORT_RE = re.compile(r"\+\d{1,3}\s\d{8}")
+_YEAR_LIKE_RE = re.compile(r"[12]\d{3}")
+
+# Tried in order; the first match is the reported period
+DATE_PATTERNS = [
+    re.compile(r"\b(19|20)\d{2}\s*[-to]{1,3}\s*(19|20)\d{2}\b", re.IGNORECASE),  # 2010-2014 or 2010 to 2014
+    re.compile(r"\b(19|20)\d{2}\b", re.IGNORECASE),                              # Single year
+    re.compile(r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s*(19|20)\d{2}", re.IGNORECASE),
+]
+
+# Explicit mentions such as "5+ years of experience"
+YEARS_MENTION_RES = [
+    re.compile(r"(\d+)\+?\s*years? of experience"),
+    re.compile(r"(\d+)\+?\s*years? in"),
+    re.compile(r"experienced (\d+)\+?\s*years?"),
+]
+
+
+def is_valid_phone(number):
+    """Validate a phone number candidate"""
+    # Remove all non-digit characters except '+'
+    cleaned = ''.join(c for c in number if c.isdigit() or c == '+')
+
+    if not cleaned:
+        return False
+
+    # Must start with + or digit
+    if not (cleaned.startswith('+') or cleaned[0].isdigit()):
+        return False
+
+    # Check length (including country code)
+    if len(cleaned) < 8 or len(cleaned) > 15:
+        return False
+
+    # For Tunisia (+216), exactly 8 digits after the country code
+    if cleaned.startswith('+216'):
+        return len(cleaned) == 12
+
+    # Must contain only digits after potential '+'
+    if not cleaned[1:].isdigit():
+        return False
+
+    # Reject if contains year-like numbers
+    if _YEAR_LIKE_RE.search(cleaned):
+        return False
+
+    return True
+
+
+def find_phone_numbers(text):
+    """Valid phone numbers of `text` in order of appearance, without duplicates"""
+    found = []
+    for match in PHONE_RE.finditer(text):
+        number = match.group().strip()
+        if not is_valid_phone(number):
+            short = PHONE_SHORT_RE.match(text, match.start())
+            if not short or not is_valid_phone(short.group()):
+                continue
+            number = short.group()
+        found.append(number)
+    return list(dict.fromkeys(found))
+
+
+def match_date(text):
+    """First date or date range of `text`, or None"""
+    for pattern in DATE_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            return match.group()
+    return None
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : pdf_document.py
+# @Software: Vscode
+# @Description: Shared PDF document handle so every extraction engine reuses one read of the file.
+
+import hashlib
+import io
+from pathlib import Path
+
+import fitz  # PyMuPDF
+from pdfminer3.pdfpage import PDFPage
+from pdfminer3.pdfparser import PDFParser
+from pdfminer3.pdfdocument import PDFDocument
+
+
+class PDFDocumentHandle:
+    """Reads a PDF once and hands the same buffer and parsed documents to every engine"""
+
+    def __init__(self, pdf_path=None, data=None, name=None):
+        if pdf_path is None and data is None:
+            raise ValueError("A PDF path or PDF bytes are required")
+        self.in_memory = pdf_path is None
+        self.pdf_path = str(pdf_path) if pdf_path is not None else f"<memory:{name or 'upload.pdf'}>"
+        self.name = name or (Path(pdf_path).name if pdf_path is not None else "upload.pdf")
+        self._data = None
+        if data is not None:
+            # fitz.open(stream=...) only accepts bytes, so views are materialised once here
+            self._data = data if isinstance(data, bytes) else bytes(data)
+        self._sha256 = None
+        self._fitz_doc = None
+        self._pdfminer_stream = None
+        self._pdfminer_doc = None
+        self._pdfminer_pages = None
+
+    @classmethod
+    def from_bytes(cls, data, name=None):
+        """Handle over an in-memory PDF (bytes, bytearray or memoryview), no disk access"""
+        return cls(data=data, name=name)
+
+    @classmethod
+    def open(cls, source):
+        """Return `source` unchanged if it is already a handle, otherwise wrap the path or bytes"""
+        if isinstance(source, cls):
+            return source
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return cls.from_bytes(source)
+        return cls(source)
+
+    def __repr__(self):
+        return f"PDFDocumentHandle({self.pdf_path!r})"
+
+    @property
+    def data(self):
+        """Raw PDF bytes, read from disk on first access only"""
+        if self._data is None:
+            self._data = Path(self.pdf_path).read_bytes()
+        return self._data
+
+    @property
+    def sha256(self):
+        """Hex digest of the PDF bytes, used as a content address"""
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    def stream(self, name=None):
+        """New file object over the shared buffer (no copy of the bytes)"""
+        buffer = io.BytesIO(self.data)
+        buffer.name = name or self.name
+        return buffer
+
+    @property
+    def fitz_document(self):
+        """PyMuPDF document opened from the shared buffer"""
+        if self._fitz_doc is None:
+            self._fitz_doc = fitz.open(stream=self.data, filetype="pdf")
+        return self._fitz_doc
+
+    @property
+    def pdfminer_document(self):
+        """pdfminer3 document parsed from the shared buffer"""
+        if self._pdfminer_doc is None:
+            # PDFParser reads lazily, so the stream must outlive the document
+            self._pdfminer_stream = self.stream()
+            self._pdfminer_doc = PDFDocument(PDFParser(self._pdfminer_stream))
+        return self._pdfminer_doc
+
+    @property
+    def pdfminer_pages(self):
+        """Cached pdfminer3 page objects, in document order"""
+        if self._pdfminer_pages is None:
+            self._pdfminer_pages = list(PDFPage.create_pages(self.pdfminer_document))
+        return self._pdfminer_pages
+
+    @property
+    def page_count(self):
+        return len(self.fitz_document)
+
+    def close(self):
+        if self._fitz_doc is not None:
+            self._fitz_doc.close()
+            self._fitz_doc = None
+        if self._pdfminer_stream is not None:
+            self._pdfminer_stream.close()
+            self._pdfminer_stream = None
+        self._pdfminer_doc = None
+        self._pdfminer_pages = None
+        # Path-backed handles can re-read the file; in-memory data has no backing copy
+        if not self.in_memory:
+            self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
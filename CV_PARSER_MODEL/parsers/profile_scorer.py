@@ -0,0 +1,162 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : profile_scorer.py
+# @Software: Vscode
+# @Description: Scores CVs against a catalog of criteria profiles at once, as a CV x profile table.
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+from utilis.asset_registry import AssetRegistry
+from .batch_scorer import (CATEGORIES, FeatureMatrix, education_scores, experience_base_scores,
+                           keyword_hits, round2, skill_hits)
+from .cv_scorer import DEFAULT_WEIGHTS, CVFeatures, CVScorer
+
+
+@dataclass(frozen=True)
+class CompiledProfiles:
+    """Criteria profiles as matrices over the union of their terms.
+
+    required[p, s] counts required skill s in profile p (a skill listed twice
+    counts twice, as in CVScorer), keywords[p, w] likewise for relevant
+    experience keywords; weights[p] follows CATEGORIES.
+    """
+    names: Tuple[str, ...]
+    criteria: Dict[str, dict]
+    skill_terms: Tuple[str, ...]
+    required: np.ndarray
+    keyword_terms: Tuple[str, ...]
+    keywords: np.ndarray
+    weights: np.ndarray
+
+    def __len__(self):
+        return len(self.names)
+
+
+def _term_matrix(term_lists):
+    """(terms, P x T count matrix) of one term list per profile, lowercased"""
+    columns = {}
+    for terms in term_lists:
+        for term in terms:
+            columns.setdefault(term.lower(), len(columns))
+    matrix = np.zeros((len(term_lists), len(columns)))
+    for row, terms in enumerate(term_lists):
+        for term in terms:
+            matrix[row, columns[term.lower()]] += 1
+    return tuple(columns), matrix
+
+
+def compile_profiles(defaults, profiles):
+    """CompiledProfiles of {name: criteria sections overriding `defaults`}"""
+    criteria = {}
+    for name, overrides in profiles.items():
+        # Same shallow override as CVScorer(custom_criteria)
+        criteria[name] = dict(defaults)
+        criteria[name].update(overrides)
+    names = tuple(criteria)
+    skill_terms, required = _term_matrix([criteria[n]["skills"]["required"] for n in names])
+    keyword_terms, keywords = _term_matrix([criteria[n]["experience"]["relevant_keywords"] for n in names])
+    weights = np.array([[criteria[n].get("weights", DEFAULT_WEIGHTS)[c] for c in CATEGORIES] for n in names],
+                       dtype=np.float64).reshape(len(names), len(CATEGORIES))
+    return CompiledProfiles(names, criteria, skill_terms, required, keyword_terms, keywords, weights)
+
+
+@dataclass(frozen=True)
+class ProfileTable:
+    """Scores of N CVs under P profiles; every array is N x P"""
+    profiles: Tuple[str, ...]
+    totals: np.ndarray
+    scores: Dict[str, np.ndarray]
+
+    def row(self, index):
+        """{profile: total score} of one CV"""
+        return dict(zip(self.profiles, self.totals[index].tolist()))
+
+    def best_profiles(self, index, k=3):
+        """(profile, total score) of the k profiles one CV fits best"""
+        order = np.argsort(-self.totals[index], kind="stable")[:k]
+        return [(self.profiles[col], float(self.totals[index, col])) for col in order]
+
+    def to_dict(self):
+        return {"profiles": self.profiles, "totals": self.totals.tolist()}
+
+
+class ProfileScorer:
+    """CVScorer under many criteria profiles in one pass.
+
+    Profiles come from assets/scoring_profiles.json, each overriding
+    sections of scoring_criteria.json like custom_criteria does. The catalog
+    is compiled once into required-skill and keyword matrices; a CV's
+    features and its skill/keyword bitmaps are extracted once, then each
+    profile costs one row of a matrix product. Totals equal
+    CVScorer(profile).score_cv for every profile.
+    """
+
+    def __init__(self, profiles=None):
+        self.logger = logging.getLogger(__name__)
+        self.scorer = CVScorer()
+        # Explicit catalogs are compiled against the current default criteria
+        self._compiled = compile_profiles(self.scorer.criteria, profiles) if profiles is not None else None
+
+    @property
+    def compiled(self):
+        return self._compiled if self._compiled is not None else _registry.get("scoring_profiles")
+
+    @property
+    def profiles(self):
+        return self.compiled.names
+
+    def build_matrix(self, cvs):
+        """FeatureMatrix of ParsedResumes, parser result dicts or CVFeatures"""
+        return FeatureMatrix.from_features(
+            cv if isinstance(cv, CVFeatures) else self.scorer.extract_features(cv) for cv in cvs)
+
+    def score_table(self, cvs):
+        """ProfileTable of CVs (a FeatureMatrix or an iterable accepted by build_matrix)"""
+        matrix = cvs if isinstance(cvs, FeatureMatrix) else self.build_matrix(cvs)
+        compiled = self.compiled
+        shape = (len(matrix), len(compiled))
+
+        # N x P matched counts, one dot product per (CV, profile) pair
+        required_counts = compiled.required.sum(axis=1)
+        matched = skill_hits(matrix, compiled.skill_terms).astype(np.float64) @ compiled.required.T
+        skills = np.zeros(shape)
+        np.divide(matched, required_counts, out=skills, where=required_counts > 0)
+        skills = np.minimum(100, skills * 100)
+
+        keyword_counts = compiled.keywords.sum(axis=1)
+        matched = keyword_hits(matrix, compiled.keyword_terms).astype(np.float64) @ compiled.keywords.T
+        keyword_score = np.zeros(shape)
+        np.divide(matched, keyword_counts, out=keyword_score, where=keyword_counts > 0)
+        keyword_score = keyword_score * 100
+        year_part, position_part = experience_base_scores(matrix)
+        experience = year_part[:, None] + keyword_score * 0.4 + position_part[:, None]
+        experience = np.where(matrix.has_experience[:, None], round2(experience), 0)
+
+        education = np.broadcast_to(education_scores(matrix)[:, None], shape)
+
+        scores = {"skills": skills, "experience": experience, "education": education}
+        total = np.zeros(shape)
+        for col, category in enumerate(CATEGORIES):
+            total = total + scores[category] * compiled.weights[:, col]
+        return ProfileTable(compiled.names, round2(total), scores)
+
+    def score_cv(self, cv):
+        """{profile: total score} of one CV"""
+        return self.score_table([cv]).row(0)
+
+    def score_details(self, cv, profile):
+        """Full CVScore of one CV under one profile"""
+        features = cv if isinstance(cv, CVFeatures) else self.scorer.extract_features(cv)
+        return CVScorer(self.compiled.criteria[profile]).score_features(features)
+
+
+_registry = AssetRegistry.get_registry()
+_registry.register("scoring_profiles", ["scoring_criteria.json", "scoring_profiles.json"],
+                   lambda defaults, data: compile_profiles(defaults, data.get("profiles", {})),
+                   fallbacks=[CVScorer._get_fallback_criteria, lambda: {"profiles": {}}])
@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : section_index.py
+# @Software: Vscode
+# @Description: Single-pass segmentation of resume text into typed section spans.
+
+import re
+from bisect import bisect_right
+from typing import NamedTuple
+
+# Text above the first heading (name, title, contact lines)
+HEADER_SECTION = "header"
+
+HEADING_MAX_CHARS = 60
+# Words allowed after the header keyword, e.g. "Education & Training"
+HEADING_MAX_TRAILING_WORDS = 2
+
+_WORD_RE = re.compile(r"[^\W\d_]+")
+
+
+class SectionSpan(NamedTuple):
+    section: str
+    heading: str    # heading line as written, empty for the header section
+    start: int      # first character after the heading line
+    end: int
+
+
+class SectionIndex:
+    """Section type -> character spans of the resume text.
+
+    A section runs from the line after its heading to the next heading of any
+    type, so every field extractor reads only its own part of the text.
+    """
+
+    def __init__(self, text, spans):
+        self.text = text
+        self.spans = spans
+        self._by_section = {}
+        for span in spans:
+            self._by_section.setdefault(span.section, []).append(span)
+
+    def __contains__(self, section):
+        return section in self._by_section
+
+    def spans_of(self, section):
+        """Every span of a section type, in document order"""
+        return self._by_section.get(section, [])
+
+    def span(self, section):
+        """First span of a section type, or None"""
+        spans = self._by_section.get(section)
+        return spans[0] if spans else None
+
+    def section_text(self, section):
+        """Text of every span of a section type, joined by newlines"""
+        return "\n".join(self.text[s.start:s.end].strip("\n") for s in self.spans_of(section))
+
+    def section_at(self, offset):
+        """Section type of the span holding character `offset`"""
+        for span in self.spans:
+            if span.start <= offset < span.end:
+                return span.section
+        return None
+
+    def as_dict(self):
+        """JSON friendly view: section type -> list of [start, end]"""
+        return {section: [[s.start, s.end] for s in spans] for section, spans in self._by_section.items()}
+
+    def __repr__(self):
+        return f"SectionIndex({', '.join(f'{s.section}[{s.start}:{s.end}]' for s in self.spans)})"
+
+
+def _heading_hit(text, line_start, line_end, hits):
+    """Longest header keyword that opens the line and makes up most of it"""
+    line = text[line_start:line_end]
+    if len(line.strip()) > HEADING_MAX_CHARS:
+        return None
+    best = None
+    for hit in hits:
+        # Only bullets, numbering or spaces may precede the keyword
+        if any(c.isalpha() for c in text[line_start:hit.start]):
+            continue
+        if len(_WORD_RE.findall(text[hit.end:line_end])) > HEADING_MAX_TRAILING_WORDS:
+            continue
+        if best is None or (hit.end - hit.start) > (best.end - best.start):
+            best = hit
+    return best
+
+
+def build_section_index(text, hits, category="section_header"):
+    """Segment `text` using the section header hits of a KeywordMatcher scan.
+
+    `hits` are KeywordHits over a lowercased copy of `text` whose value is the
+    section type. Lines are walked once; the heading of each section is the
+    line its header keyword opens.
+    """
+    line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+    hits_by_line = {}
+    for hit in hits:
+        if hit.category == category:
+            hits_by_line.setdefault(bisect_right(line_starts, hit.start) - 1, []).append(hit)
+
+    headings = []
+    for line_no in sorted(hits_by_line):
+        line_start = line_starts[line_no]
+        line_end = line_starts[line_no + 1] - 1 if line_no + 1 < len(line_starts) else len(text)
+        hit = _heading_hit(text, line_start, line_end, hits_by_line[line_no])
+        if hit is not None:
+            headings.append((line_start, line_end, hit.value))
+
+    spans = []
+    first_heading = headings[0][0] if headings else len(text)
+    if text[:first_heading].strip():
+        spans.append(SectionSpan(HEADER_SECTION, "", 0, first_heading))
+    for i, (line_start, line_end, section) in enumerate(headings):
+        end = headings[i + 1][0] if i + 1 < len(headings) else len(text)
+        spans.append(SectionSpan(section, text[line_start:line_end].strip(), min(line_end + 1, end), end))
+    return SectionIndex(text, spans)
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : text_normalizer.py
+# @Software: Vscode
+# @Description: Canonical matching view of resume text with an offset map back to the original.
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Removed outright: soft hyphen, zero-width spaces and joiners, byte order mark
+_DROP_CHARS = {"\u00ad", "\u200b", "\u200c", "\u200d", "\u2060", "\ufeff"}
+# Unicode spaces PDF extractors emit in place of a plain space
+_SPACE_CHARS = {"\u00a0", "\u2002", "\u2003", "\u2007", "\u2009", "\u200a", "\u202f", "\u3000"}
+# A line-end hyphen between two letters, the next one lowercase: "manage-\nment"
+_HYPHEN_BREAK_RE = re.compile(r"(?<=[^\W\d_])[-\u00ad]\n(?=[^\W\d_])")
+
+
+@lru_cache(maxsize=4096)
+def _fold_char(char):
+    """NFKC, casefold and accent fold one character; may return 0 to n characters"""
+    if char in _DROP_CHARS:
+        return ""
+    if char in _SPACE_CHARS:
+        return " "
+    folded = unicodedata.normalize("NFKC", char).casefold()
+    return "".join(c for c in unicodedata.normalize("NFD", folded) if not unicodedata.combining(c))
+
+
+def fold_text(text):
+    """Matching form of a keyword or short string, without offset tracking"""
+    if text.isascii():
+        return text.lower()
+    return "".join(_fold_char(c) for c in text)
+
+
+class NormalizedText:
+    """Folded view of a text: NFKC, casefolded, accent-folded, hyphenation repaired.
+
+    offsets[i] is the index in `original` of the character that produced
+    text[i]; it is None when the view is a plain lowercase copy, in which case
+    positions are the same in both.
+    """
+
+    def __init__(self, original, text, offsets=None):
+        self.original = original
+        self.text = text
+        self.offsets = offsets
+
+    def to_original(self, start, end):
+        """Map the span [start, end) of the folded text to the original text"""
+        if self.offsets is None:
+            return start, end
+        if start >= end:
+            position = self.offsets[start] if start < len(self.offsets) else len(self.original)
+            return position, position
+        return self.offsets[start], self.offsets[end - 1] + 1
+
+    def __len__(self):
+        return len(self.text)
+
+    def __repr__(self):
+        return f"NormalizedText({len(self.original)} -> {len(self.text)} chars)"
+
+
+def normalize_text(text):
+    """Build the folded view of `text` in one pass"""
+    breaks = [m.start() for m in _HYPHEN_BREAK_RE.finditer(text)
+              if text[m.end()].islower()]
+    # Plain ASCII without broken words keeps its offsets
+    if not breaks and text.isascii():
+        return NormalizedText(text, text.lower())
+
+    skip = set()
+    for position in breaks:
+        skip.update((position, position + 1))
+
+    chars = []
+    offsets = []
+    for i, char in enumerate(text):
+        if i in skip:
+            continue
+        if char < "\x80":
+            chars.append(char.lower())
+            offsets.append(i)
+            continue
+        folded = _fold_char(char)
+        chars.append(folded)
+        offsets.extend([i] * len(folded))
+    return NormalizedText(text, "".join(chars), offsets)
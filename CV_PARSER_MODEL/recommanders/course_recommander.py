@@ -1,49 +1,39 @@
-from pathlib import Path
-import json
 import logging
 from typing import Dict, List
 
+from utilis.asset_registry import AssetRegistry
+from utilis.result_models import LearningPath, SkillRecommendations
+
+_registry = AssetRegistry.get_registry()
+_registry.register("courses_data", "courses_data.json", fallbacks=[lambda: {"platforms": {}}])
+
 class CourseRecommender:
     """Recommends courses and learning resources based on skill recommendations"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.courses_data = self._load_courses_data()
         
-    def _load_courses_data(self) -> Dict:
-        """Load courses data from JSON file"""
-        try:
-            courses_file = Path(__file__).parent.parent / 'assets' / 'courses_data.json'
-            with open(courses_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Error loading courses data: {e}")
-            return {"platforms": {}}
+    @property
+    def courses_data(self) -> Dict:
+        """Courses data, loaded once per process by the asset registry"""
+        return _registry.get("courses_data")
             
-    def recommend_courses(self, skill_recommendations: Dict) -> Dict:
+    def recommend_courses(self, skill_recommendations: SkillRecommendations) -> LearningPath:
         """Generate course recommendations based on skill recommendations"""
         try:
-            if skill_recommendations["status"] != "success":
-                return {"status": "error", "message": "Invalid skill recommendations"}
+            if not skill_recommendations.ok:
+                return LearningPath(status="error", message="Invalid skill recommendations")
                 
-            recommendations = {
-                "status": "success",
-                "high_priority": self._get_courses_for_skills(
-                    skill_recommendations["recommendations"]["missing_required"]
-                ),
-                "medium_priority": self._get_courses_for_skills(
-                    skill_recommendations["recommendations"]["missing_preferred"]
-                ),
-                "additional_learning": self._get_courses_for_skills(
-                    skill_recommendations["recommendations"]["related_skills"][:3]
-                )
-            }
-            
-            return recommendations
+            return LearningPath(
+                status="success",
+                high_priority=self._get_courses_for_skills(skill_recommendations.missing_required),
+                medium_priority=self._get_courses_for_skills(skill_recommendations.missing_preferred),
+                additional_learning=self._get_courses_for_skills(skill_recommendations.related_skills[:3])
+            )
             
         except Exception as e:
             self.logger.error(f"Error generating course recommendations: {e}")
-            return {"status": "error", "message": str(e)}
+            return LearningPath(status="error", message=str(e))
             
     def _get_courses_for_skills(self, skills: List[str]) -> Dict:
         """Get course recommendations for specific skills"""
@@ -0,0 +1,231 @@
+import heapq
+import logging
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from parsers.cv_scorer import CVFeatures, CVScorer
+from parsers.text_normalizer import fold_text
+from utilis.asset_registry import AssetRegistry
+from utilis.result_models import MatchResult
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Share of the BM25 relevance in a match score; the rest is the CVScorer total
+RELEVANCE_WEIGHT = 0.5
+# BM25 candidates re-ranked with CVScorer for each requested result
+RERANK_FACTOR = 5
+# Term frequency of a required skill in a job document
+REQUIRED_SKILL_TF = 2
+
+# Skill-like tokens: "c++", "c#", "node.js"
+_TERM_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+
+def normalize_term(term: str) -> str:
+    """Index form of a skill or keyword"""
+    return " ".join(fold_text(term).split())
+
+
+def text_terms(text: str) -> List[str]:
+    return _TERM_RE.findall(fold_text(text))
+
+
+def job_terms(job: Dict) -> Counter:
+    """Term frequencies of a job offer: skills, keywords and title words"""
+    terms = Counter()
+    for skill in job.get("required", []):
+        terms[normalize_term(skill)] += REQUIRED_SKILL_TF
+    for term in job.get("preferred", []) + job.get("keywords", []):
+        terms[normalize_term(term)] += 1
+    terms.update(text_terms(job.get("title", "")))
+    return terms
+
+
+def cv_terms(features: CVFeatures) -> Counter:
+    """Term frequencies of a CV: its skills and the words of its experience"""
+    terms = Counter(normalize_term(skill) for skill in dict.fromkeys(features.skills))
+    terms.update(text_terms(features.experience_text))
+    return terms
+
+
+def job_criteria(job: Dict) -> Dict:
+    """CVScorer criteria sections for one job offer"""
+    return {
+        "skills": {
+            "required": list(job.get("required", [])),
+            "preferred": list(job.get("preferred", []))
+        },
+        "experience": {"relevant_keywords": list(job.get("keywords", []))}
+    }
+
+
+class InvertedIndex:
+    """BM25 over term -> {doc_id: tf} postings.
+
+    A search only visits the postings of its query terms, so its cost
+    follows the matching documents, not the size of the index.
+    """
+
+    def __init__(self, k1=BM25_K1, b=BM25_B):
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[str, int]] = {}
+        self.doc_terms: Dict[str, Tuple[str, ...]] = {}
+        self.lengths: Dict[str, int] = {}
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.lengths
+
+    def add(self, doc_id: str, terms: Counter):
+        """Index a document, replacing a previous version of it"""
+        if doc_id in self.lengths:
+            self.remove(doc_id)
+        for term, tf in terms.items():
+            self.postings.setdefault(term, {})[doc_id] = tf
+        self.doc_terms[doc_id] = tuple(terms)
+        self.lengths[doc_id] = sum(terms.values())
+        self.total_length += self.lengths[doc_id]
+
+    def remove(self, doc_id: str):
+        for term in self.doc_terms.pop(doc_id, ()):
+            posting = self.postings[term]
+            del posting[doc_id]
+            if not posting:
+                del self.postings[term]
+        self.total_length -= self.lengths.pop(doc_id, 0)
+
+    def idf(self, term: str) -> float:
+        df = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self) - df + 0.5) / (df + 0.5))
+
+    def search(self, query: Counter, k: int) -> List[Tuple[float, str]]:
+        """(BM25 score, doc_id) of the k best documents sharing a term with the query"""
+        if not self.lengths or k <= 0:
+            return []
+        avg_length = self.total_length / len(self.lengths)
+        scores = {}
+        for term, query_tf in query.items():
+            posting = self.postings.get(term)
+            if not posting:
+                continue
+            weight = query_tf * self.idf(term) * (self.k1 + 1)
+            for doc_id, tf in posting.items():
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf / (tf + norm)
+        return heapq.nlargest(k, ((score, doc_id) for doc_id, score in scores.items()))
+
+    def self_score(self, query: Counter) -> float:
+        """BM25 of the query itself as a document: what a document holding every query term scores"""
+        if not self.lengths:
+            return 0.0
+        avg_length = self.total_length / len(self.lengths)
+        norm = self.k1 * (1 - self.b + self.b * sum(query.values()) / avg_length)
+        return sum(tf * self.idf(term) * (self.k1 + 1) * tf / (tf + norm) for term, tf in query.items())
+
+
+def _compile_job_offers(data):
+    jobs = {job["id"]: job for job in data.get("jobs", [])}
+    index = InvertedIndex()
+    for job_id, job in jobs.items():
+        index.add(job_id, job_terms(job))
+    return {"jobs": jobs, "index": index}
+
+
+class JobMatcher:
+    """Matches CVs and job offers both ways.
+
+    Job offers come from assets/job_offers.json and are indexed once per
+    process by the asset registry. CVs are indexed with add_cv() or
+    load_store(). A query retrieves BM25 candidates from the index, re-ranks
+    RERANK_FACTOR times the requested count with the CVScorer under the job's
+    criteria, and keeps the best k with a heap.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self.scorer = CVScorer()
+        self.cv_index = InvertedIndex()
+        self.cv_features: Dict[str, CVFeatures] = {}
+        self.cv_titles: Dict[str, str] = {}
+
+    @property
+    def jobs(self) -> Dict[str, Dict]:
+        return _registry.get("job_offers")["jobs"]
+
+    @property
+    def job_index(self) -> InvertedIndex:
+        return _registry.get("job_offers")["index"]
+
+    def _features(self, cv) -> CVFeatures:
+        return cv if isinstance(cv, CVFeatures) else self.scorer.extract_features(cv)
+
+    def add_cv(self, cv_id: str, cv, title: str = ""):
+        """Index a CV (ParsedResume, parser result dict or CVFeatures)"""
+        features = self._features(cv)
+        self.cv_index.add(cv_id, cv_terms(features))
+        self.cv_features[cv_id] = features
+        self.cv_titles[cv_id] = title or cv_id
+
+    def load_store(self, store):
+        """Index every CV of a FeatureStore, titled by source file"""
+        for digest, source, features in zip(*store.load()):
+            self.add_cv(digest, features, title=source or digest[:12])
+        self.logger.info(f"Indexed {len(self.cv_index)} CVs")
+
+    def _rank(self, candidates, k, result, ceiling):
+        """Best k of the BM25 candidates once combined with their CVScorer totals.
+
+        Relevance is BM25 as a share of `ceiling`, the query's self-score, so
+        a weak best candidate stays weak and scores compare across queries.
+        """
+        if not candidates or ceiling <= 0:
+            return ()
+        matches = []
+        for bm25, doc_id in candidates:
+            relevance = min(100.0, bm25 / ceiling * 100)
+            cv_score, title, matched = result(doc_id)
+            score = RELEVANCE_WEIGHT * relevance + (1 - RELEVANCE_WEIGHT) * cv_score.total_score
+            matches.append(MatchResult(id=doc_id, title=title, score=round(score, 2),
+                                       relevance=round(relevance, 2), cv_score=cv_score,
+                                       matched_terms=matched))
+        return tuple(heapq.nlargest(k, matches, key=lambda match: match.score))
+
+    def top_jobs(self, cv, k: int = 10) -> Tuple[MatchResult, ...]:
+        """Best k job offers for a CV"""
+        features = self._features(cv)
+        query = cv_terms(features)
+        jobs = self.jobs
+        candidates = self.job_index.search(query, k * RERANK_FACTOR)
+
+        def result(job_id):
+            job = jobs[job_id]
+            matched = tuple(term for term in job_terms(job) if term in query)
+            return CVScorer(job_criteria(job)).score_features(features), job.get("title", job_id), matched
+
+        return self._rank(candidates, k, result, self.job_index.self_score(query))
+
+    def top_cvs(self, job_id: str, k: int = 10) -> Tuple[MatchResult, ...]:
+        """Best k indexed CVs for a job offer"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            self.logger.error(f"Job offer '{job_id}' not found")
+            return ()
+        query = job_terms(job)
+        scorer = CVScorer(job_criteria(job))
+        candidates = self.cv_index.search(query, k * RERANK_FACTOR)
+
+        def result(cv_id):
+            matched = tuple(term for term in self.cv_index.doc_terms[cv_id] if term in query)
+            return scorer.score_features(self.cv_features[cv_id]), self.cv_titles[cv_id], matched
+
+        return self._rank(candidates, k, result, self.cv_index.self_score(query))
+
+
+_registry = AssetRegistry.get_registry()
+_registry.register("job_offers", "job_offers.json", _compile_job_offers, fallbacks=[lambda: {"jobs": []}])
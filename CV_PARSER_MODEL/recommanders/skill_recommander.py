@@ -1,26 +1,22 @@
-from pathlib import Path
-import json
 import logging
 from typing import Dict, List, Set
 
+from utilis.asset_registry import AssetRegistry
+from utilis.result_models import SkillRecommendations, SkillStep
+
 class SkillRecommender:
     """Recommends skills based on job position and existing skills"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.skills_data = self._load_skills_data()
         
-    def _load_skills_data(self) -> Dict:
-        """Load skills data from JSON file"""
-        try:
-            skills_file = Path(__file__).parent.parent / 'assets' / 'skills_data.json'
-            with open(skills_file, 'r') as f:
-                return json.load(f)
-        except Exception as e:
-            self.logger.error(f"Error loading skills data: {e}")
-            return self._get_default_skills_data()
+    @property
+    def skills_data(self) -> Dict:
+        """Skills data, loaded once per process by the asset registry"""
+        return _registry.get("skills_data")
     
-    def _get_default_skills_data(self) -> Dict:
+    @staticmethod
+    def _get_default_skills_data() -> Dict:
         """Fallback skills data"""
         return {
             "positions": {
@@ -48,17 +44,16 @@ class SkillRecommender:
             }
         }
     
-    def recommend_skills(self, position: str, current_skills: List[str]) -> Dict:
+    def recommend_skills(self, position: str, current_skills: List[str]) -> SkillRecommendations:
         """Generate skill recommendations based on position and current skills"""
         position = position.lower().replace(' ', '_')
         current_skills = [skill.lower() for skill in current_skills]
         
         if position not in self.skills_data["positions"]:
-            return {
-                "status": "error",
-                "message": f"Position '{position}' not found in skills database",
-                "recommendations": {}
-            }
+            return SkillRecommendations(
+                status="error",
+                message=f"Position '{position}' not found in skills database"
+            )
         
         position_skills = self.skills_data["positions"][position]
         
@@ -85,17 +80,15 @@ class SkillRecommender:
             missing_preferred
         )
         
-        return {
-            "status": "success",
-            "position": position,
-            "current_skills": current_skills,
-            "recommendations": {
-                "missing_required": list(missing_required),
-                "missing_preferred": list(missing_preferred),
-                "related_skills": list(related_skills),
-                "skill_path": skill_path
-            }
-        }
+        return SkillRecommendations(
+            status="success",
+            position=position,
+            current_skills=tuple(current_skills),
+            missing_required=tuple(missing_required),
+            missing_preferred=tuple(missing_preferred),
+            related_skills=tuple(related_skills),
+            skill_path=tuple(skill_path)
+        )
     
     def _get_missing_skills(self, current: List[str], required: List[str]) -> Set[str]:
         """Find missing skills from required list"""
@@ -115,33 +108,26 @@ class SkillRecommender:
         position_skills: Dict,
         missing_required: Set[str],
         missing_preferred: Set[str]
-    ) -> List[Dict]:
+    ) -> List[SkillStep]:
         """Generate a prioritized skill learning path"""
         path = []
         
         # First priority: missing required skills
         for skill in missing_required:
-            path.append({
-                "skill": skill,
-                "priority": "high",
-                "reason": "Required for position"
-            })
+            path.append(SkillStep(skill, "high", "Required for position"))
         
         # Second priority: missing preferred skills
         for skill in missing_preferred:
-            path.append({
-                "skill": skill,
-                "priority": "medium",
-                "reason": "Preferred for position"
-            })
+            path.append(SkillStep(skill, "medium", "Preferred for position"))
         
         # Third priority: related skills
         for skill in position_skills["related"]:
             if skill not in current:
-                path.append({
-                    "skill": skill,
-                    "priority": "low",
-                    "reason": "Enhances skillset"
-                })
+                path.append(SkillStep(skill, "low", "Enhances skillset"))
         
-        return path
\ No newline at end of file
+        return path
+
+
+_registry = AssetRegistry.get_registry()
+_registry.register("skills_data", "skills_data.json",
+                   fallbacks=[SkillRecommender._get_default_skills_data])
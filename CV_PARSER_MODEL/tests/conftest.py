@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+# Modules import each other as top-level packages (parsers, utilis, recommanders)
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from parsers.cv_scorer import CVFeatures  # noqa: E402
+
+TEST_CV = Path(__file__).parent.parent.parent / ".github" / "test-data" / "test_cv.pdf"
+
+SKILLS = ["python", "c++", "c", "git", "linux", "docker", "kubernetes", "rust", "java", "jira", "react", "sql"]
+WORDS = ["software", "developer", "engineer", "lead", "manager", "architect", "embedded", "test", "devops"]
+
+
+def random_features(rng):
+    """CVFeatures with random skills, keywords, years and education points"""
+    entry_max = sum(rng.choice([3, 3.5]) for _ in range(rng.randint(0, 4)))
+    return CVFeatures(
+        skills=tuple(rng.sample(SKILLS, rng.randint(0, 8))),
+        experience_text=" ".join(rng.choices(WORDS, k=rng.randint(0, 12))),
+        has_experience=rng.random() < 0.9,
+        years=rng.randint(0, 17),
+        positions=rng.randint(0, 5),
+        education_points=float(rng.randint(0, int(entry_max * 2)) / 2) if entry_max else 0.0,
+        education_max=float(entry_max),
+    )
+
+
+def random_criteria(rng):
+    """Criteria with random required skills, keywords and weights"""
+    weights = [rng.randint(1, 9) for _ in range(3)]
+    return {
+        "skills": {"required": rng.sample(SKILLS, rng.randint(0, 7))},
+        "experience": {"relevant_keywords": rng.sample(WORDS, rng.randint(0, 7))},
+        "weights": dict(zip(("skills", "experience", "education"), (w / sum(weights) for w in weights))),
+    }
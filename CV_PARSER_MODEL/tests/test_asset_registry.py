@@ -0,0 +1,33 @@
+import json
+import os
+
+from utilis.asset_registry import AssetRegistry
+
+
+def _write(path, text, mtime_ns):
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_failed_reload_keeps_the_last_good_value(tmp_path):
+    path = tmp_path / "skills.json"
+    _write(path, json.dumps({"skills": ["python", "rust"]}), 1_000_000_000)
+    registry = AssetRegistry(tmp_path, check_interval=0)
+    registry.register("skills", "skills.json", lambda data: data["skills"], fallbacks=[lambda: {"skills": []}])
+    assert registry.get("skills") == ["python", "rust"]
+
+    # A half-written save, then one that parses but does not compile
+    _write(path, '{"skills": ["python", "ru', 2_000_000_000)
+    assert registry.get("skills") == ["python", "rust"]
+    _write(path, "{}", 3_000_000_000)
+    assert registry.get("skills") == ["python", "rust"]
+
+    _write(path, json.dumps({"skills": ["python", "rust", "go"]}), 4_000_000_000)
+    assert registry.get("skills") == ["python", "rust", "go"]
+
+
+def test_first_load_uses_the_fallback(tmp_path):
+    _write(tmp_path / "skills.json", "not json", 1_000_000_000)
+    registry = AssetRegistry(tmp_path, check_interval=0)
+    registry.register("skills", "skills.json", lambda data: data["skills"], fallbacks=[lambda: {"skills": ["c"]}])
+    assert registry.get("skills") == ["c"]
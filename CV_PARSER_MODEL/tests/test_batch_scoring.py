@@ -0,0 +1,34 @@
+import random
+
+import pytest
+
+from conftest import random_criteria, random_features
+from parsers.batch_scorer import BatchScorer, FeatureMatrix
+from parsers.feature_store import FeatureStore
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batch_totals_equal_cv_scorer(seed):
+    rng = random.Random(seed)
+    features = [random_features(rng) for _ in range(300)]
+    batch = BatchScorer(random_criteria(rng))
+    matrix = FeatureMatrix.from_features(features)
+
+    totals = batch.total_scores(matrix)
+    scores = batch.category_scores(matrix)
+    for row, feature in enumerate(features):
+        expected = batch.scorer.score_features(feature)
+        assert totals[row] == expected.total_score
+        for category, value in expected.detailed_scores.items():
+            assert round(float(scores[category][row]), 2) == value
+
+
+def test_rescore_ranks_by_the_reported_total(tmp_path):
+    rng = random.Random(7)
+    store = FeatureStore(tmp_path / "features.sqlite3")
+    for i in range(200):
+        store.put(f"{i:064x}", random_features(rng), source=f"cv{i}.pdf")
+    ranked = BatchScorer(random_criteria(rng)).rescore(store, k=50)
+    totals = [score.total_score for _, _, score in ranked]
+    assert totals == sorted(totals, reverse=True)
+    store.close()
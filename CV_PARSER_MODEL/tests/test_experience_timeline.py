@@ -0,0 +1,32 @@
+from parsers.experience_timeline import ExperienceTimeline, month_ordinal
+
+CURRENT = month_ordinal(2026, 10)
+
+
+def test_month_name_ranges_are_counted():
+    timeline = ExperienceTimeline(["SW designer, Jan 2016 - Dec 2018"], CURRENT)
+    assert timeline.total_months == 36
+    assert timeline.total_years == 3
+
+
+def test_overlapping_roles_are_merged():
+    timeline = ExperienceTimeline([
+        "Engineer at A, 2019 - present",
+        "Freelance consultant, 03/2020 - 06/2021",
+        "Intern at B, Jan 2016 - Dec 2018",
+    ], CURRENT)
+    assert [(r.entry, r.months) for r in timeline.roles] == [(0, 94), (1, 16), (2, 36)]
+    assert timeline.total_months == 130
+    assert timeline.gap_months == 0
+
+
+def test_gaps_between_roles():
+    timeline = ExperienceTimeline(["Engineer, 2014 - 2016", "Engineer, 2018 - 2020"], CURRENT)
+    assert timeline.total_years == 4
+    assert timeline.to_dict()["gaps"] == [["2016-01", "2017-12"]]
+
+
+def test_explicit_mention_wins_when_higher():
+    timeline = ExperienceTimeline(["12+ years of experience in embedded software", "Engineer, 2020 - 2022"],
+                                  CURRENT)
+    assert timeline.total_years == 12
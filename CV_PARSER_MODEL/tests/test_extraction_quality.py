@@ -0,0 +1,23 @@
+from parsers.extraction_quality import assess_extraction_quality
+
+SIDEBAR = ["Education", "ESPRIT - Private School of Engineering and Technology", "2017 - 2022",
+           "Skills", "Python / C++ / Git / Jira"]
+MAIN = ["Experience", "SW Designer, ACTIA Engineering Services", "May 2022 - present",
+        "Analyze and review software customers' specifications and requirements",
+        "Projects", "Study and realization of a human follower assistant robot"]
+HEADER = ["Yasser Jemli", "Embedded software engineer passionate about automotive systems and testing"]
+
+
+def test_columns_read_one_after_the_other_are_acceptable():
+    quality = assess_extraction_quality(HEADER + SIDEBAR + MAIN, 1)
+    assert quality["acceptable"], quality["reasons"]
+    assert quality["metrics"]["empty_sections"] == []
+
+
+def test_interleaved_columns_are_rejected():
+    # Row by row: the two columns' headings end up side by side
+    interleaved = HEADER + ["Education", "Experience", SIDEBAR[1], MAIN[1], SIDEBAR[2], MAIN[2],
+                            "Skills", MAIN[3], SIDEBAR[4], "Projects", MAIN[5]]
+    quality = assess_extraction_quality(interleaved, 1)
+    assert not quality["acceptable"]
+    assert quality["metrics"]["empty_sections"] == ["Education"]
@@ -0,0 +1,37 @@
+import pytest
+
+import main
+from conftest import TEST_CV
+
+
+@pytest.fixture
+def feature_store(tmp_path, monkeypatch):
+    monkeypatch.setenv("CV_FEATURE_STORE_PATH", str(tmp_path / "features.sqlite3"))
+    monkeypatch.setenv("CV_EXTRACTION_CACHE", "0")
+    monkeypatch.setattr(main, "_feature_store", None)
+    yield
+    if main._feature_store is not None:
+        main._feature_store.close()
+
+
+def test_parsed_cv_is_rescored_from_the_store(feature_store):
+    results = main.CV_parsing_main(str(TEST_CV))
+    assert results is not None
+    assert len(main.get_feature_store()) == 1
+
+    ranked = main.rescore_corpus(top=5)
+    assert len(ranked) == 1
+    digest, source, score = ranked[0]
+    assert digest == results['sha256']
+    assert source == str(TEST_CV)
+    assert score.total_score == results['scores']['custom'].total_score
+
+
+def test_uploaded_cv_is_stored_under_its_filename(feature_store):
+    with main.PDFDocumentHandle.from_bytes(TEST_CV.read_bytes(), name="candidate.pdf") as document:
+        results = main.CV_parsing_main(document)
+    assert results is not None
+
+    digests, sources, _ = main.get_feature_store().load()
+    assert digests == [results['sha256']]
+    assert sources == ["candidate.pdf"]
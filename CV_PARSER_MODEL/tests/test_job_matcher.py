@@ -0,0 +1,29 @@
+from collections import Counter
+
+from parsers.cv_scorer import CVFeatures
+from recommanders.job_matcher import InvertedIndex, JobMatcher, job_terms
+
+
+def test_self_score_is_the_score_of_a_document_equal_to_the_query():
+    index = InvertedIndex()
+    query = Counter({"python": 2, "git": 1, "engineer": 1})
+    index.add("same", query)
+    index.add("other", Counter({"java": 2, "maven": 1, "engineer": 1}))
+    (score, doc_id), = index.search(query, 1)
+    assert doc_id == "same"
+    assert abs(score - index.self_score(query)) < 1e-9
+
+
+def test_a_single_shared_term_is_not_a_perfect_match():
+    matcher = JobMatcher()
+    job_id = "embedded_linux_engineer"
+    job = matcher.jobs[job_id]
+    matcher.add_cv("weak", CVFeatures(skills=(), experience_text="engineer", has_experience=True, years=1,
+                                      positions=1, education_points=0, education_max=0))
+    matcher.add_cv("strong", CVFeatures(skills=tuple(job["required"]) + tuple(job.get("preferred", [])),
+                                        experience_text=" ".join(job_terms(job)), has_experience=True,
+                                        years=5, positions=2, education_points=0, education_max=0))
+
+    relevance = {match.id: match.relevance for match in matcher.top_cvs(job_id, k=2)}
+    assert relevance["weak"] < 20
+    assert relevance["strong"] > 80
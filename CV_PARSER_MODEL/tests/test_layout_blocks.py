@@ -0,0 +1,61 @@
+from conftest import TEST_CV
+from parsers.layout_blocks import page_blocks_in_reading_order
+from parsers.pdf_document import PDFDocumentHandle
+from parsers.PDFTextExtractorPyMuPDF import PDFTextExtractorPyMuPDF
+from parsers.ResumeInfoExtractor import ResumeInfoExtractor
+
+LINE_HEIGHT = 12
+
+
+def _block(x0, y0, x1, *lines, size=10):
+    return {
+        "type": 0,
+        "bbox": [x0, y0, x1, y0 + LINE_HEIGHT * len(lines)],
+        "lines": [{"spans": [{"text": line, "size": size, "flags": 0}]} for line in lines],
+    }
+
+
+def _texts(page_dict):
+    return [block.text for block in page_blocks_in_reading_order(page_dict, 1)]
+
+
+def test_right_aligned_dates_stay_with_their_role():
+    blocks = [_block(50, 60, 250, "PROFESSIONAL EXPERIENCE", size=14)]
+    y = 90
+    for role, dates in [("SW Designer, ACTIA", "May 2022 - present"),
+                        ("Embedded Developer, SASTEC", "Feb 2022 - Apr 2022"),
+                        ("Intern, Sofrecom", "Jun 2021 - Aug 2021"),
+                        ("Intern, Telnet", "Jul 2020 - Sep 2020")]:
+        blocks.append(_block(50, y, 300, role))
+        blocks.append(_block(450, y + 0.5, 550, dates))
+        blocks.append(_block(50, y + 14, 300, "Tested infotainment features", "Reported defects in Jira"))
+        y += 80
+    texts = _texts({"width": 600, "height": 800, "blocks": blocks})
+
+    for role, dates in [("SW Designer, ACTIA", "May 2022 - present"), ("Intern, Telnet", "Jul 2020 - Sep 2020")]:
+        assert texts.index(dates) == texts.index(role) + 1
+
+
+def test_two_column_layout_reads_sidebar_first():
+    sidebar = [_block(40, 100 + i * 150, 180, f"Sidebar {i}", "item a", "item b") for i in range(4)]
+    main = [_block(220, 90 + i * 120, 560, f"Main {i}", "detail one", "detail two", "detail three")
+            for i in range(5)]
+    header = _block(40, 30, 560, "Yasser Jemli - Embedded Software Engineer - yasser@example.com")
+    texts = _texts({"width": 600, "height": 800, "blocks": main + sidebar + [header]})
+
+    firsts = [text.split("\n")[0] for text in texts]
+    assert firsts == (["Yasser Jemli - Embedded Software Engineer - yasser@example.com"]
+                      + [f"Sidebar {i}" for i in range(4)] + [f"Main {i}" for i in range(5)])
+
+
+def test_sample_cv_sidebar_is_read_before_the_main_column():
+    # The contact block straddles the sidebar and the main column
+    with PDFDocumentHandle.from_bytes(TEST_CV.read_bytes()) as document:
+        paragraphs = PDFTextExtractorPyMuPDF(document, layout="blocks").extract_paragraphs()
+    extractor = ResumeInfoExtractor(paragraphs, verbose=False)
+
+    sections = extractor.sections
+    assert [span.section for span in sections.spans] == ["header", "education", "skills", "experience", "projects"]
+    assert "Higher Institute" in sections.section_text("education")
+    assert "Higher Institute" not in sections.section_text("experience")
+    assert "May 2022 - present" in sections.section_text("experience")
@@ -0,0 +1,19 @@
+import pytest
+
+from conftest import TEST_CV
+from parsers.PDFTextExtractorPdfMiner import PDFTextExtractorPdfMiner
+from parsers.PDFTextExtractorPyMuPDF import PDFTextExtractorPyMuPDF
+from parsers.pdf_document import PDFDocumentHandle
+from parsers.ResumeInfoExtractor import ResumeInfoExtractor
+
+
+@pytest.mark.parametrize("extractor_class", [PDFTextExtractorPyMuPDF, PDFTextExtractorPdfMiner])
+def test_stream_parses_like_the_paragraph_list(extractor_class):
+    with PDFDocumentHandle.from_bytes(TEST_CV.read_bytes()) as document:
+        paragraphs = extractor_class(document).extract_paragraphs()
+        stream = extractor_class(document).iter_paragraphs()
+        from_stream = ResumeInfoExtractor(stream, verbose=False)
+
+    from_list = ResumeInfoExtractor(paragraphs, verbose=False)
+    assert from_stream.paragraphs == from_list.paragraphs
+    assert from_stream.extract_resume() == from_list.extract_resume()
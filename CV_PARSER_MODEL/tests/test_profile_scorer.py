@@ -0,0 +1,21 @@
+import random
+
+import pytest
+
+from conftest import random_criteria, random_features
+from parsers.cv_scorer import CVScorer
+from parsers.profile_scorer import ProfileScorer
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_profile_table_equals_cv_scorer(seed):
+    rng = random.Random(100 + seed)
+    features = [random_features(rng) for _ in range(200)]
+    profiles = {f"profile_{i}": random_criteria(rng) for i in range(6)}
+    scorer = ProfileScorer(profiles)
+
+    table = scorer.score_table(features)
+    for col, name in enumerate(table.profiles):
+        reference = CVScorer(scorer.compiled.criteria[name])
+        for row, feature in enumerate(features):
+            assert table.totals[row, col] == reference.score_features(feature).total_score
@@ -0,0 +1,52 @@
+import pytest
+
+from parsers.ResumeInfoExtractor import ResumeInfoExtractor
+from utilis.result_models import ParsedResume
+
+RESUME = """Yasser Jemli
+yasser.jemli@example.com
+
+Experience
+SW Designer at ACTIA Engineering Services Ltd
+Jan 2021 - present
+
+Education
+ESPRIT - Engineering diploma 2015 - 2018
+
+Skills
+Python, C++, Git
+"""
+
+
+def test_extract_all_returns_copies():
+    extractor = ResumeInfoExtractor(RESUME, verbose=False)
+    first = extractor.extract_all()
+    first["Skills"].append("cobol")
+    first["Experience"].clear()
+    first["Education"]["institutions"].append("Nowhere")
+
+    second = extractor.extract_all()
+    assert "cobol" not in second["Skills"]
+    assert second["Experience"]
+    assert "Nowhere" not in second["Education"]["institutions"]
+    assert "cobol" not in extractor.extract_skills()
+
+
+@pytest.mark.parametrize("line, skills", [
+    ("C plus plus, Node JS", ["c++", "node.js"]),
+    ("C++, node.js, java script", ["javascript", "c++", "node.js"]),
+    ("C++, C, JS, Node JS", ["c++", "c", "node.js", "js"]),
+])
+def test_alias_hits_drop_the_skills_inside_them(line, skills):
+    assert ResumeInfoExtractor(f"Skills\n{line}", verbose=False).skills == skills
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_extract_many_yields_parsed_resumes(workers):
+    texts = [RESUME, "", RESUME.replace("Python", "Rust")]
+    results = list(ResumeInfoExtractor.extract_many(texts, chunk_size=1, workers=workers))
+
+    assert results[1] is None
+    assert results[0] == ResumeInfoExtractor(RESUME, verbose=False).extract_resume()
+    assert isinstance(results[2], ParsedResume)
+    assert "rust" in results[2].skills and "python" not in results[2].skills
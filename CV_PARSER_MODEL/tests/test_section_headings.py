@@ -0,0 +1,44 @@
+import pytest
+
+from parsers.ResumeInfoExtractor import ResumeInfoExtractor
+
+RESUME = """Yasser Jemli
+yasser.jemli@example.com
+
+{heading}
+SW Designer at ACTIA Engineering Services Ltd
+Jan 2021 - present
+Embedded Sytem Developer, Sofrecom Solutions
+2018 - 2020
+
+{education}
+ESPRIT - Engineering diploma 2015 - 2018
+
+Skills
+Python, C++, Git
+"""
+
+
+@pytest.mark.parametrize("heading", [
+    "Experience",
+    "EXPERIENCES",
+    "Professional Experiences",
+    "Expériences professionnelles",
+    "EXPÉRIENCE PROFESSIONNELLE",
+    "Parcours professionnel",
+])
+def test_experience_headings(heading):
+    extractor = ResumeInfoExtractor(RESUME.format(heading=heading, education="Education"), verbose=False)
+    assert "experience" in extractor.sections
+    assert extractor.experience == [
+        "SW Designer at ACTIA Engineering Services Ltd Jan 2021 - present",
+        "Embedded Sytem Developer, Sofrecom Solutions 2018 - 2020",
+    ]
+
+
+@pytest.mark.parametrize("heading", ["Education", "EDUCATION", "Formation", "Formations", "Études"])
+def test_education_headings(heading):
+    extractor = ResumeInfoExtractor(RESUME.format(heading="Experience", education=heading), verbose=False)
+    assert "education" in extractor.sections
+    assert extractor.experience[-1] == "Embedded Sytem Developer, Sofrecom Solutions 2018 - 2020"
+    assert extractor.education["institutions"]
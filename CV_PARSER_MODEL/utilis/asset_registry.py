@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : asset_registry.py
+# @Software: Vscode
+# @Description: Process-wide registry of compiled JSON assets with mtime based hot reload.
+# @License : MIT License
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).parent.parent / 'assets'
+
+
+class AssetRegistry:
+    """Loads and compiles each asset once per process and shares the result.
+
+    An asset is one or more JSON files under assets/ plus a compiler that
+    turns the parsed JSON into ready-to-use structures (sets, regexes,
+    automata...). get() re-checks file mtimes at most every check_interval
+    seconds; a changed file is recompiled and the new value swapped in
+    atomically, so readers always see either the old or the new asset.
+    Fallback data only stands in on the first load: when a reload fails (a
+    half-written or invalid file) the last good value is kept.
+    Compiled values are shared: callers must treat them as read-only.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, assets_dir=None, check_interval=1.0):
+        self.logger = logging.getLogger(__name__)
+        self.assets_dir = Path(assets_dir) if assets_dir else ASSETS_DIR
+        self.check_interval = check_interval
+        self._specs = {}
+        # name -> (mtimes, value, checked_at); replaced as a whole on reload
+        self._compiled = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def get_registry(cls):
+        """Get or create the process-wide instance"""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = AssetRegistry()
+        return cls._instance
+
+    def register(self, name, files, compiler=None, fallbacks=None):
+        """Declare an asset built from `files` (names relative to assets/).
+
+        `compiler(*data)` receives the parsed JSON of each file in order;
+        `fallbacks` gives per file the data to use when it is missing or invalid.
+        Registering an existing name again is a no-op.
+        """
+        with self._lock:
+            if name in self._specs:
+                return
+            if isinstance(files, str):
+                files = [files]
+            fallbacks = list(fallbacks) if fallbacks is not None else [None] * len(files)
+            self._specs[name] = (list(files), compiler or (lambda *data: data[0]), fallbacks)
+
+    def get(self, name):
+        """Compiled value of an asset, reloaded if one of its files changed"""
+        entry = self._compiled.get(name)
+        now = time.monotonic()
+        if entry is not None and now - entry[2] < self.check_interval:
+            return entry[1]
+
+        files, _, _ = self._specs[name]
+        mtimes = tuple(self._mtime(f) for f in files)
+        if entry is not None and entry[0] == mtimes:
+            self._compiled[name] = (mtimes, entry[1], now)
+            return entry[1]
+
+        with self._lock:
+            entry = self._compiled.get(name)
+            if entry is not None and entry[0] == mtimes:
+                return entry[1]
+            if entry is None:
+                value = self._compile(name)
+            else:
+                try:
+                    value = self._compile(name, use_fallbacks=False)
+                except Exception as e:
+                    # Retried once the files change again
+                    self.logger.error(f"Failed to reload asset '{name}', keeping the previous version: {e}")
+                    self._compiled[name] = (mtimes, entry[1], now)
+                    return entry[1]
+                self.logger.info(f"Reloaded asset '{name}'")
+            self._compiled[name] = (mtimes, value, now)
+            return value
+
+    def _mtime(self, filename):
+        try:
+            return os.stat(self.assets_dir / filename).st_mtime_ns
+        except OSError:
+            return None
+
+    def _compile(self, name, use_fallbacks=True):
+        files, compiler, fallbacks = self._specs[name]
+        data = []
+        for filename, fallback in zip(files, fallbacks):
+            try:
+                with open(self.assets_dir / filename, 'r', encoding='utf-8') as f:
+                    data.append(json.load(f))
+            except (OSError, json.JSONDecodeError) as e:
+                if not use_fallbacks:
+                    raise
+                self.logger.error(f"Error loading asset file {filename}: {e}")
+                data.append(fallback() if callable(fallback) else fallback)
+        return compiler(*data)
+
+    def invalidate(self, name=None):
+        """Force a reload on next access"""
+        with self._lock:
+            if name is None:
+                self._compiled = {}
+            else:
+                self._compiled.pop(name, None)
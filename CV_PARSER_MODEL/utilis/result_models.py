@@ -0,0 +1,257 @@
+#!/usr/bin/python3
+
+# -*- coding: utf-8 -*-
+# @Author  : Yasser JEMLI
+# @File    : result_models.py
+# @Software: Vscode
+# @Description: Immutable slotted models for parsed resumes, scores and recommendations.
+# @License : MIT License
+
+import json
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _as_tuple(value):
+    """Tuple of a list-like, scalar or missing value"""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        return (value,) if value else ()
+    return tuple(value)
+
+
+@dataclass(frozen=True, slots=True)
+class EducationEntry:
+    institution: str
+    type: str = ""
+    category: str = ""
+    degree: Optional[str] = None
+    period: Optional[str] = None
+
+    def to_dict(self):
+        return {
+            "institution": self.institution,
+            "type": self.type,
+            "category": self.category,
+            "degree": self.degree,
+            "period": self.period
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    institutions: Tuple[str, ...] = ()
+    entries: Tuple[EducationEntry, ...] = ()
+
+    @property
+    def total_institutions(self):
+        return len(self.institutions)
+
+    @classmethod
+    def from_dict(cls, data):
+        if not data:
+            return cls()
+        return cls(
+            institutions=_as_tuple(data.get("institutions")),
+            entries=tuple(EducationEntry(**entry) for entry in data.get("entries", []))
+        )
+
+    def to_dict(self):
+        return {
+            "total_institutions": self.total_institutions,
+            "institutions": self.institutions,
+            "entries": [entry.to_dict() for entry in self.entries]
+        }
+
+
+# Result key -> ParsedResume attribute
+RESUME_KEYS = (
+    ("Name", "name"),
+    ("Email", "emails"),
+    ("Phone", "phones"),
+    ("Skills", "skills"),
+    ("Experience", "experience"),
+    ("Education", "education"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedResume:
+    """Fields of one parsed resume.
+
+    None means the field was not extracted (see extract_all(fields=...));
+    an empty string or tuple means it was extracted and nothing was found.
+    """
+    name: Optional[str] = None
+    emails: Optional[Tuple[str, ...]] = None
+    phones: Optional[Tuple[str, ...]] = None
+    skills: Optional[Tuple[str, ...]] = None
+    experience: Optional[Tuple[str, ...]] = None
+    education: Optional[Education] = None
+
+    @classmethod
+    def from_fields(cls, fields):
+        """Build from a parser result dict keyed like RESUME_KEYS; None stays None"""
+        if fields is None:
+            return None
+        values = {}
+        for key, attribute in RESUME_KEYS:
+            if key not in fields:
+                continue
+            value = fields[key]
+            if attribute == "name":
+                values[attribute] = value or ""
+            elif attribute == "education":
+                values[attribute] = Education.from_dict(value)
+            else:
+                values[attribute] = _as_tuple(value)
+        return cls(**values)
+
+    def to_dict(self):
+        """Result dict keyed like RESUME_KEYS, without the fields that were not extracted"""
+        result = {}
+        for key, attribute in RESUME_KEYS:
+            value = getattr(self, attribute)
+            if value is not None:
+                result[key] = value.to_dict() if attribute == "education" else value
+        return result
+
+
+@dataclass(frozen=True, slots=True)
+class ExperienceMetrics:
+    years: int = 0
+    positions: int = 0
+    details: str = ""
+
+    def to_dict(self):
+        return {"years": self.years, "positions": self.positions, "details": self.details}
+
+
+@dataclass(frozen=True, slots=True)
+class CVScore:
+    total_score: float = 0
+    detailed_scores: Dict[str, float] = field(default_factory=dict)
+    experience_metrics: ExperienceMetrics = ExperienceMetrics()
+    feedback: Tuple[str, ...] = ()
+
+    def to_dict(self):
+        return {
+            "total_score": self.total_score,
+            "detailed_scores": self.detailed_scores,
+            "experience_metrics": self.experience_metrics.to_dict(),
+            "feedback": self.feedback
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SkillStep:
+    skill: str
+    priority: str
+    reason: str
+
+    def to_dict(self):
+        return {"skill": self.skill, "priority": self.priority, "reason": self.reason}
+
+
+@dataclass(frozen=True, slots=True)
+class SkillRecommendations:
+    status: str
+    position: str = ""
+    current_skills: Tuple[str, ...] = ()
+    missing_required: Tuple[str, ...] = ()
+    missing_preferred: Tuple[str, ...] = ()
+    related_skills: Tuple[str, ...] = ()
+    skill_path: Tuple[SkillStep, ...] = ()
+    message: str = ""
+
+    @property
+    def ok(self):
+        return self.status == "success"
+
+    def to_dict(self):
+        if not self.ok:
+            return {"status": self.status, "message": self.message, "recommendations": {}}
+        return {
+            "status": self.status,
+            "position": self.position,
+            "current_skills": self.current_skills,
+            "recommendations": {
+                "missing_required": self.missing_required,
+                "missing_preferred": self.missing_preferred,
+                "related_skills": self.related_skills,
+                "skill_path": [step.to_dict() for step in self.skill_path]
+            }
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class LearningPath:
+    """Courses per skill, grouped by priority; course entries are asset data"""
+    status: str
+    high_priority: Dict[str, dict] = field(default_factory=dict)
+    medium_priority: Dict[str, dict] = field(default_factory=dict)
+    additional_learning: Dict[str, dict] = field(default_factory=dict)
+    message: str = ""
+
+    @property
+    def ok(self):
+        return self.status == "success"
+
+    def to_dict(self):
+        if not self.ok:
+            return {"status": self.status, "message": self.message}
+        return {
+            "status": self.status,
+            "high_priority": self.high_priority,
+            "medium_priority": self.medium_priority,
+            "additional_learning": self.additional_learning
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class MatchResult:
+    """A job matched to a CV, or a CV matched to a job"""
+    id: str
+    title: str = ""
+    score: float = 0
+    relevance: float = 0            # BM25 as a share of the query's self-score, 0-100
+    cv_score: Optional[CVScore] = None
+    matched_terms: Tuple[str, ...] = ()
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "title": self.title,
+            "score": self.score,
+            "relevance": self.relevance,
+            "cv_score": self.cv_score.to_dict() if self.cv_score else None,
+            "matched_terms": self.matched_terms
+        }
+
+
+def _default(obj):
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent=False):
+    """Serialize results holding result models straight to UTF-8 JSON bytes.
+
+    Uses orjson when installed, the json module otherwise.
+    """
+    if HAS_ORJSON:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, default=_default, ensure_ascii=False, indent=4 if indent else None).encode("utf-8")